@@ -7,8 +7,10 @@ from braintree.amex_express_checkout_card import AmexExpressCheckoutCard
 from braintree.android_pay_card import AndroidPayCard
 from braintree.apple_pay_card import ApplePayCard
 from braintree.apple_pay_gateway import ApplePayGateway
+from braintree.async_braintree_gateway import AsyncBraintreeGateway
 from braintree.braintree_gateway import BraintreeGateway
 from braintree.client_token import ClientToken
+from braintree.compact_record import CompactRecord
 from braintree.configuration import Configuration
 from braintree.connected_merchant_paypal_status_changed import ConnectedMerchantPayPalStatusChanged
 from braintree.connected_merchant_status_transitioned import ConnectedMerchantStatusTransitioned
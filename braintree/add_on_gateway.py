@@ -1,6 +1,8 @@
 import braintree
 from braintree.add_on import AddOn
+from braintree.exceptions.not_found_error import NotFoundError
 from braintree.resource_collection import ResourceCollection
+from braintree.util.catalog_cache import CatalogCache
 
 class AddOnGateway(object):
     def __init__(self, gateway):
@@ -8,6 +10,21 @@ class AddOnGateway(object):
         self.config = gateway.config
 
     def all(self):
+        return [AddOn(self.gateway, item) for item in self.__all_attributes()]
+
+    def all_cached(self):
+        return CatalogCache.items_for(self.config, CatalogCache.AddOns, self.__all_attributes, self.__add_on)
+
+    def get_cached(self, add_on_id):
+        add_on = CatalogCache.get_for(self.config, CatalogCache.AddOns, self.__all_attributes, self.__add_on, add_on_id)
+        if add_on is None:
+            raise NotFoundError("Add-on with id " + repr(add_on_id) + " not found")
+        return add_on
+
+    def __all_attributes(self):
         response = self.config.http().get(self.config.base_merchant_path() + "/add_ons/")
         add_ons = {"add_on": response["add_ons"]}
-        return [AddOn(self.gateway, item) for item in ResourceCollection._extract_as_array(add_ons, "add_on")]
+        return ResourceCollection._extract_as_array(add_ons, "add_on")
+
+    def __add_on(self, attributes):
+        return AddOn(self.gateway, attributes)
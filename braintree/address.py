@@ -1,3 +1,4 @@
+from functools import lru_cache
 from braintree.successful_result import SuccessfulResult
 from braintree.error_result import ErrorResult
 from braintree.resource import Resource
@@ -125,11 +126,13 @@ class Address(Resource):
         return Configuration.gateway().address.update(customer_id, address_id, params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return ["company", "country_code_alpha2", "country_code_alpha3", "country_code_numeric",
                 "country_name", "customer_id", "extended_address", "first_name",
                 "last_name", "locality", "phone_number", "postal_code", "region", "street_address"]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def update_signature():
         return Address.create_signature()
@@ -0,0 +1,42 @@
+from braintree.async_customer_gateway import AsyncCustomerGateway
+from braintree.async_payment_method_gateway import AsyncPaymentMethodGateway
+from braintree.async_transaction_gateway import AsyncTransactionGateway
+from braintree.configuration import Configuration
+import braintree.configuration
+
+class AsyncBraintreeGateway(object):
+    """
+    An asyncio gateway exposing coroutine versions of the transaction, customer and
+    payment method operations. It returns the same resource and result classes as
+    :class:`BraintreeGateway <braintree.braintree_gateway.BraintreeGateway>`. ::
+
+        async with braintree.AsyncBraintreeGateway(config) as gateway:
+            result = await gateway.transaction.sale({"amount": "10.00", "payment_method_nonce": nonce})
+
+    Requests are made with ``config.async_http_strategy()``; pass ``async_http_strategy``
+    to the Configuration to plug in a different asynchronous HTTP backend.
+    """
+
+    def __init__(self, config=None, **kwargs):
+        if isinstance(config, braintree.configuration.Configuration):
+            self.config = config
+        else:
+            self.config = Configuration(
+                client_id=kwargs.get("client_id"),
+                client_secret=kwargs.get("client_secret"),
+                access_token=kwargs.get("access_token"),
+                async_http_strategy=kwargs.get("async_http_strategy")
+            )
+        self.customer = AsyncCustomerGateway(self)
+        self.payment_method = AsyncPaymentMethodGateway(self)
+        self.transaction = AsyncTransactionGateway(self)
+
+    async def close(self):
+        """ Closes idle connections held by the default asynchronous HTTP backend. """
+        await self.config.async_http().close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, trace):
+        await self.close()
@@ -0,0 +1,65 @@
+from braintree.exceptions.unexpected_error import UnexpectedError
+
+class AsyncResourceCollection(object):
+    """
+    A class representing results from a search made through an
+    :class:`AsyncBraintreeGateway <braintree.async_braintree_gateway.AsyncBraintreeGateway>`.
+    Supports the asynchronous iterator protocol::
+
+        results = await gateway.transaction.search(braintree.TransactionSearch.amount == "10.00")
+        async for transaction in results:
+            print(transaction.id)
+    """
+
+    class _Iterator(object):
+        def __init__(self, collection):
+            self.__collection = collection
+            self.__batch_index = 0
+            self.__items = []
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            while not self.__items:
+                batch = self.__collection._batch(self.__batch_index)
+                if not batch:
+                    raise StopAsyncIteration
+                self.__batch_index += 1
+                self.__items = list(await self.__collection._fetch(batch))
+                self.__items.reverse()
+            return self.__items.pop()
+
+    def __init__(self, query, results, method):
+        if "search_results" not in results:
+            raise UnexpectedError("Unprocessable entity due to an invalid request")
+        self.__ids = results["search_results"]["ids"]
+        self.__method = method
+        self.__page_size = results["search_results"]["page_size"]
+        self.__query = query
+
+    @property
+    def maximum_size(self):
+        """
+        Returns the approximate size of the results.  The size is approximate due to race conditions when pulling
+        back results.  Due to its inexact nature, maximum_size should be avoided.
+        """
+        return len(self.__ids)
+
+    async def first(self):
+        """ Returns the first item in the results. """
+        return (await self.__method(self.__query, self.__ids[0:1]))[0]
+
+    @property
+    def ids(self):
+        """ Returns the list of ids in the search result. """
+        return self.__ids
+
+    def __aiter__(self):
+        return AsyncResourceCollection._Iterator(self)
+
+    def _batch(self, index):
+        return self.__ids[index * self.__page_size:(index + 1) * self.__page_size]
+
+    def _fetch(self, batch):
+        return self.__method(self.__query, batch)
@@ -1,3 +1,5 @@
+import braintree.compact_record
+
 class AttributeGetter(object):
     """
     Helper class for objects that define their attributes from dictionaries
@@ -24,6 +26,13 @@ class AttributeGetter(object):
                 setattr(self, "graphql_id", val)
                 self._setattrs.append("graphql_id")
 
+    def compact(self):
+        """
+        Returns a :class:`CompactRecord <braintree.compact_record.CompactRecord>`
+        holding the same attributes in far less memory.
+        """
+        return braintree.compact_record.CompactRecord.of(self)
+
     def __repr__(self, detail_list=None):
         if detail_list is None:
             detail_list = self._setattrs
@@ -1,6 +1,7 @@
 import datetime
 import json
 import urllib
+from functools import lru_cache
 from braintree.configuration import Configuration
 from braintree.signature_service import SignatureService
 from braintree.util.crypto import Crypto
@@ -19,6 +20,7 @@ class ClientToken(object):
         return gateway.generate(params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def generate_signature():
         return [
             "customer_id",
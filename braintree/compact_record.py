@@ -0,0 +1,85 @@
+import threading
+
+class CompactRecord(object):
+    """
+    A read-only, memory-compact copy of a resource, for holding many resources in
+    memory at once. ::
+
+        transactions = [transaction.compact() for transaction in braintree.Transaction.search(...)]
+
+    Each resource class and set of attributes gets one generated record class whose
+    attributes are stored in ``__slots__``, so a record carries no per-instance
+    ``__dict__`` or attribute list. Nested resources, including those in lists, are
+    compacted too. Raw response attributes that the resource class replaced with a
+    built object, listed in its ``_superseded_attributes`` (such as a transaction's
+    ``billing`` dict, built into ``billing_details``), are left out. The properties
+    and methods of the original resource class keep working, but records are not
+    instances of it and new attributes cannot be set.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _resource_class = None
+
+    __record_classes = {}
+    __max_record_classes = 256
+    __lock = threading.Lock()
+
+    @staticmethod
+    def of(resource):
+        names = list(vars(resource)) + list(getattr(resource, "_lazy_attributes", None) or ())
+        superseded = getattr(type(resource), "_superseded_attributes", frozenset())
+        fields = tuple(name for name in names if name not in CompactRecord.__skipped_fields and name not in superseded)
+        record_class = CompactRecord.__record_class(type(resource), fields)
+        record = record_class()
+        for name in fields:
+            object.__setattr__(record, name, CompactRecord.__compact_value(getattr(resource, name)))
+        return record
+
+    def __getattr__(self, name):
+        # special names such as __dict__ describe the resource class's own instances
+        if not name.startswith("__"):
+            for klass in self._resource_class.__mro__:
+                if name in klass.__dict__:
+                    attribute = klass.__dict__[name]
+                    if hasattr(attribute, "__get__"):
+                        return attribute.__get__(self, type(self))
+                    return attribute
+        raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+
+    def __repr__(self):
+        details = ", ".join("%s: %r" % (name, getattr(self, name))
+                            for name in self._fields
+                                if name != "gateway" and hasattr(self, name))
+        return "<%s {%s} at %d>" % (type(self).__name__, details, id(self))
+
+    __skipped_fields = frozenset(["_setattrs", "_lazy_attributes", "_selected_fields"])
+
+    @staticmethod
+    def __record_class(resource_class, fields):
+        # the same attributes in another order share a class, since they are set by name
+        key = (resource_class, frozenset(fields))
+        record_class = CompactRecord.__record_classes.get(key)
+        if record_class is None:
+            with CompactRecord.__lock:
+                record_class = CompactRecord.__record_classes.get(key)
+                if record_class is None:
+                    # projections and unusual responses must not grow the classes without bound
+                    if len(CompactRecord.__record_classes) >= CompactRecord.__max_record_classes:
+                        CompactRecord.__record_classes.clear()
+                    record_class = type(resource_class.__name__, (CompactRecord,), {
+                        "__slots__": fields,
+                        "_fields": fields,
+                        "_resource_class": resource_class
+                    })
+                    CompactRecord.__record_classes[key] = record_class
+        return record_class
+
+    @staticmethod
+    def __compact_value(value):
+        compact = getattr(value, "compact", None)
+        if compact is not None and not isinstance(value, (CompactRecord, type)):
+            return compact()
+        elif isinstance(value, list):
+            return [CompactRecord.__compact_value(item) for item in value]
+        return value
@@ -2,6 +2,7 @@ import braintree
 from braintree.credentials_parser import CredentialsParser
 from braintree.environment import Environment
 from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.util.connection_pool import ConnectionPool
 from braintree.util.graphql_client import GraphQLClient
 
 
@@ -26,7 +27,23 @@ class Configuration(object):
         Configuration.private_key = private_key
         Configuration.default_http_strategy = kwargs.get("http_strategy", None)
         Configuration.timeout = kwargs.get("timeout", 60)
+        Configuration.connect_timeout = kwargs.get("connect_timeout", None)
+        Configuration.read_timeout = kwargs.get("read_timeout", None)
         Configuration.wrap_http_exceptions = kwargs.get("wrap_http_exceptions", False)
+        Configuration.default_connection_pool = kwargs.get("connection_pool") or ConnectionPool(
+            pool_size=kwargs.get("pool_size", 10),
+            keep_alive=kwargs.get("keep_alive", True),
+            max_idle=kwargs.get("pool_max_idle", None)
+        )
+        Configuration.default_retry_policy = kwargs.get("retry_policy", None)
+        Configuration.default_rate_limiter = kwargs.get("rate_limiter", None)
+        Configuration.default_circuit_breaker = kwargs.get("circuit_breaker", None)
+        Configuration.default_hedging_policy = kwargs.get("hedging_policy", None)
+        Configuration.lazy_resources = kwargs.get("lazy_resources", False)
+        Configuration.default_vault_cache = kwargs.get("vault_cache", None)
+        Configuration.default_catalog_cache = kwargs.get("catalog_cache", None)
+        Configuration.default_single_flight = kwargs.get("single_flight", None)
+        Configuration.default_not_found_cache = kwargs.get("not_found_cache", None)
 
     @staticmethod
     def for_partner(environment, partner_id, public_key, private_key, **kwargs):
@@ -37,7 +54,22 @@ class Configuration(object):
             private_key=private_key,
             http_strategy=kwargs.get("http_strategy", None),
             timeout=kwargs.get("timeout", 60),
-            wrap_http_exceptions=kwargs.get("wrap_http_exceptions", False)
+            connect_timeout=kwargs.get("connect_timeout", None),
+            read_timeout=kwargs.get("read_timeout", None),
+            wrap_http_exceptions=kwargs.get("wrap_http_exceptions", False),
+            connection_pool=kwargs.get("connection_pool", None),
+            pool_size=kwargs.get("pool_size", 10),
+            keep_alive=kwargs.get("keep_alive", True),
+            pool_max_idle=kwargs.get("pool_max_idle", None),
+            retry_policy=kwargs.get("retry_policy", None),
+            rate_limiter=kwargs.get("rate_limiter", None),
+            circuit_breaker=kwargs.get("circuit_breaker", None),
+            hedging_policy=kwargs.get("hedging_policy", None),
+            lazy_resources=kwargs.get("lazy_resources", False),
+            vault_cache=kwargs.get("vault_cache", None),
+            catalog_cache=kwargs.get("catalog_cache", None),
+            single_flight=kwargs.get("single_flight", None),
+            not_found_cache=kwargs.get("not_found_cache", None)
         )
 
     @staticmethod
@@ -53,7 +85,19 @@ class Configuration(object):
             private_key=Configuration.private_key,
             http_strategy=Configuration.default_http_strategy,
             timeout=Configuration.timeout,
-            wrap_http_exceptions=Configuration.wrap_http_exceptions
+            connect_timeout=Configuration.connect_timeout,
+            read_timeout=Configuration.read_timeout,
+            wrap_http_exceptions=Configuration.wrap_http_exceptions,
+            connection_pool=Configuration.default_connection_pool,
+            retry_policy=Configuration.default_retry_policy,
+            rate_limiter=Configuration.default_rate_limiter,
+            circuit_breaker=Configuration.default_circuit_breaker,
+            hedging_policy=Configuration.default_hedging_policy,
+            lazy_resources=Configuration.lazy_resources,
+            vault_cache=Configuration.default_vault_cache,
+            catalog_cache=Configuration.default_catalog_cache,
+            single_flight=Configuration.default_single_flight,
+            not_found_cache=Configuration.default_not_found_cache
         )
 
     @staticmethod
@@ -100,7 +144,27 @@ class Configuration(object):
         self.client_secret = parser.client_secret
         self.access_token = parser.access_token
         self.timeout = kwargs.get("timeout", 60)
+        self.connect_timeout = kwargs.get("connect_timeout", None)
+        self.read_timeout = kwargs.get("read_timeout", None)
         self.wrap_http_exceptions = kwargs.get("wrap_http_exceptions", False)
+        self._connection_pool = kwargs.get("connection_pool") or ConnectionPool(
+            pool_size=kwargs.get("pool_size", 10),
+            keep_alive=kwargs.get("keep_alive", True),
+            max_idle=kwargs.get("pool_max_idle", None)
+        )
+
+        self.retry_policy = kwargs.get("retry_policy", None)
+        self.rate_limiter = kwargs.get("rate_limiter", None)
+        self.circuit_breaker = kwargs.get("circuit_breaker", None)
+        self.hedging_policy = kwargs.get("hedging_policy", None)
+        self.lazy_resources = kwargs.get("lazy_resources", False)
+        self.vault_cache = kwargs.get("vault_cache", None)
+        self.catalog_cache = kwargs.get("catalog_cache", None)
+        self.single_flight = kwargs.get("single_flight", None)
+        self.not_found_cache = kwargs.get("not_found_cache", None)
+        self._http = None
+        self._async_http = None
+        self._async_http_strategy = None
 
         http_strategy = kwargs.get("http_strategy", None)
 
@@ -109,6 +173,11 @@ class Configuration(object):
         else:
             self._http_strategy = self.http()
 
+        async_http_strategy = kwargs.get("async_http_strategy", None)
+
+        if async_http_strategy:
+            self._async_http_strategy = async_http_strategy(self, self.environment)
+
     def base_merchant_path(self):
         return "/merchants/" + self.merchant_id
 
@@ -119,7 +188,20 @@ class Configuration(object):
         return self.environment.protocol + self.environment.graphql_server_and_port + "/graphql"
 
     def http(self):
-        return braintree.util.http.Http(self)
+        if self._http is None:
+            self._http = braintree.util.http.Http(self)
+        return self._http
+
+    def connection_pool(self):
+        return self._connection_pool
+
+    def async_http(self):
+        if self._async_http is None:
+            self._async_http = braintree.util.async_http.AsyncHttp(self)
+        return self._async_http
+
+    def async_http_strategy(self):
+        return self._async_http_strategy or self.async_http()
 
     def graphql_client(self):
         return GraphQLClient(self)
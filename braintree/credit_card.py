@@ -1,9 +1,12 @@
 import braintree
 import warnings
+from functools import lru_cache
 from braintree.resource import Resource
 from braintree.address import Address
 from braintree.configuration import Configuration
 from braintree.credit_card_verification import CreditCardVerification
+from braintree.util.constants import Constants
+from braintree.util.parser import Parser
 
 
 class CreditCard(Resource):
@@ -190,10 +193,12 @@ class CreditCard(Resource):
         return Configuration.gateway().credit_card.from_nonce(nonce)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return CreditCard.signature("create")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def update_signature():
         return CreditCard.signature("update")
 
@@ -301,3 +306,5 @@ class CreditCard(Resource):
         Returns the masked number of the CreditCard.
         """
         return self.bin + "******" + self.last_4
+
+Parser.intern_values(Constants.get_all_constant_values_from_class(CreditCard.CardType))
@@ -7,6 +7,8 @@ from braintree.ids_search import IdsSearch
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
 from braintree.successful_result import SuccessfulResult
+from braintree.util.not_found_cache import NotFoundCache
+from braintree.util.vault_cache import VaultCache
 
 
 class CreditCardGateway(object):
@@ -19,10 +21,16 @@ class CreditCardGateway(object):
             params = {}
         Resource.verify_keys(params, CreditCard.create_signature())
         self.__check_for_deprecated_attributes(params)
-        return self._post("/payment_methods", {"credit_card": params})
+        result = self._post("/payment_methods", {"credit_card": params})
+        if result.is_success:
+            NotFoundCache.forget(self.config, "payment_method", result.credit_card.token)
+            if params.get("customer_id"):
+                VaultCache.invalidate(self.config, "customer/" + params["customer_id"])
+        return result
 
     def delete(self, credit_card_token):
         self.config.http().delete(self.config.base_merchant_path() + "/payment_methods/credit_card/" + credit_card_token)
+        VaultCache.invalidate_payment_method(self.config, credit_card_token)
         return SuccessfulResult()
 
     def expired(self):
@@ -40,7 +48,8 @@ class CreditCardGateway(object):
         try:
             if credit_card_token is None or credit_card_token.strip() == "":
                 raise NotFoundError()
-            response = self.config.http().get(self.config.base_merchant_path() + "/payment_methods/credit_card/" + credit_card_token)
+            path = self.config.base_merchant_path() + "/payment_methods/credit_card/" + credit_card_token
+            response = VaultCache.read_through(self.config, "credit_card/" + credit_card_token, lambda: self.config.http().get(path))
             return CreditCard(self.gateway, response["credit_card"])
         except NotFoundError:
             raise NotFoundError("payment method with token " + repr(credit_card_token) + " not found")
@@ -64,6 +73,7 @@ class CreditCardGateway(object):
         self.__check_for_deprecated_attributes(params)
         response = self.config.http().put(self.config.base_merchant_path() + "/payment_methods/credit_card/" + credit_card_token, {"credit_card": params})
         if "credit_card" in response:
+            VaultCache.invalidate_payment_method(self.config, credit_card_token, response["credit_card"].get("customer_id"))
             return SuccessfulResult({"credit_card": CreditCard(self.gateway, response["credit_card"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
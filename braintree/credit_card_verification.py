@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 from braintree.attribute_getter import AttributeGetter
 from braintree.configuration import Configuration
 from braintree.risk_data import RiskData
@@ -68,6 +69,7 @@ class CreditCardVerification(AttributeGetter):
         return Configuration.gateway().verification.create(params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         billing_address_params = [
                 "company", "country_code_alpha2", "country_code_alpha3", "country_code_numeric",
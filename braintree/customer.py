@@ -1,4 +1,5 @@
 import warnings
+from functools import lru_cache
 from braintree.util.http import Http
 from braintree.successful_result import SuccessfulResult
 from braintree.error_result import ErrorResult
@@ -124,7 +125,7 @@ class Customer(Resource):
         return Configuration.gateway().customer.delete(customer_id)
 
     @staticmethod
-    def find(customer_id, association_filter_id=None):
+    def find(customer_id, association_filter_id=None, fields=None):
         """
         Find an customer, given a customer_id.  This does not return a result
         object.  This will raise a :class:`NotFoundError <braintree.exceptions.not_found_error.NotFoundError>` if the provided customer_id
@@ -133,11 +134,11 @@ class Customer(Resource):
             customer = braintree.Customer.find("my_customer_id")
         """
 
-        return Configuration.gateway().customer.find(customer_id, association_filter_id)
+        return Configuration.gateway().customer.find(customer_id, association_filter_id, fields)
 
     @staticmethod
-    def search(*query):
-        return Configuration.gateway().customer.search(*query)
+    def search(*query, fields=None):
+        return Configuration.gateway().customer.search(*query, fields=fields)
 
     @staticmethod
     def update(customer_id, params=None):
@@ -156,6 +157,7 @@ class Customer(Resource):
         return Configuration.gateway().customer.update(customer_id, params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return [
             "company", "email", "fax", "first_name", "id", "last_name", "phone", "website", "device_data", "payment_method_nonce",
@@ -183,6 +185,7 @@ class Customer(Resource):
         ]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def update_signature():
         return [
             "company", "email", "fax", "first_name", "id", "last_name", "phone", "website", "device_data", "device_session_id", "fraud_merchant_id", "payment_method_nonce", "default_payment_method_token",
@@ -207,6 +210,14 @@ class Customer(Resource):
             ]}]},
         ]
 
+    _projected_defaults = {
+        "payment_methods": frozenset([
+            "credit_cards", "paypal_accounts", "apple_pay_cards", "android_pay_cards", "amex_express_checkout_cards",
+            "europe_bank_accounts", "venmo_accounts", "us_bank_accounts", "visa_checkout_cards", "masterpass_cards",
+            "samsung_pay_cards"
+        ])
+    }
+
     def __init__(self, gateway, attributes):
         Resource.__init__(self, gateway, attributes)
         self.payment_methods = []
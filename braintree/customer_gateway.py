@@ -7,6 +7,8 @@ from braintree.ids_search import IdsSearch
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
 from braintree.successful_result import SuccessfulResult
+from braintree.util.not_found_cache import NotFoundCache
+from braintree.util.vault_cache import VaultCache
 
 
 class CustomerGateway(object):
@@ -27,9 +29,11 @@ class CustomerGateway(object):
 
     def delete(self, customer_id):
         self.config.http().delete(self.config.base_merchant_path() + "/customers/" + customer_id)
+        # deleting a customer deletes its payment methods too
+        VaultCache.invalidate_customer(self.config, customer_id)
         return SuccessfulResult()
 
-    def find(self, customer_id, association_filter_id=None):
+    def find(self, customer_id, association_filter_id=None, fields=None):
         try:
             if customer_id is None or customer_id.strip() == "":
                 raise NotFoundError()
@@ -38,17 +42,24 @@ class CustomerGateway(object):
             if association_filter_id:
                 query_params = "?association_filter_id=" + association_filter_id
 
-            response = self.config.http().get(self.config.base_merchant_path() + "/customers/" + customer_id + query_params)
-            return Customer(self.gateway, response["customer"])
+            path = self.config.base_merchant_path() + "/customers/" + customer_id + query_params
+            fields = Resource.projected_fields(fields)
+            if query_params or fields is not None:
+                load = lambda: self.config.http().get(path, fields=fields)
+            else:
+                load = lambda: VaultCache.read_through(self.config, "customer/" + customer_id, lambda: self.config.http().get(path))
+            response = NotFoundCache.read_through(self.config, "customer/" + customer_id, load)
+            return Customer(self.gateway, response["customer"])._select_fields(fields)
         except NotFoundError:
             raise NotFoundError("customer with id " + repr(customer_id) + " not found")
 
-    def search(self, *query):
+    def search(self, *query, fields=None):
         if isinstance(query[0], list):
             query = query[0]
 
+        fields = Resource.projected_fields(fields)
         response = self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search_ids", {"search": self.__criteria(query)})
-        return ResourceCollection(query, response, self.__fetch)
+        return ResourceCollection(query, response, lambda query, ids: self.__fetch(query, ids, fields))
 
     def update(self, customer_id, params=None):
         if params is None:
@@ -57,6 +68,7 @@ class CustomerGateway(object):
         self.__check_for_deprecated_attributes(params)
         response = self.config.http().put(self.config.base_merchant_path() + "/customers/" + customer_id, {"customer": params})
         if "customer" in response:
+            VaultCache.invalidate(self.config, "customer/" + customer_id)
             return SuccessfulResult({"customer": Customer(self.gateway, response["customer"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
@@ -70,18 +82,27 @@ class CustomerGateway(object):
                 criteria[term.name] = term.to_param()
         return criteria
 
-    def __fetch(self, query, ids):
+    def __fetch(self, query, ids, fields=None):
         criteria = self.__criteria(query)
         criteria["ids"] = braintree.customer_search.CustomerSearch.ids.in_list(ids).to_param()
-        response = self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search", {"search": criteria})
-        return [Customer(self.gateway, item) for item in ResourceCollection._extract_as_array(response["customers"], "customer")]
+        if fields is None:
+            response = self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search", {"search": criteria})
+            return [Customer(self.gateway, item) for item in ResourceCollection._extract_as_array(response["customers"], "customer")]
+
+        elements = self.config.http().post_elements(
+            self.config.base_merchant_path() + "/customers/advanced_search", {"search": criteria}, "customer", fields=fields
+        )
+        return [Customer(self.gateway, item)._select_fields(fields) for item in elements]
 
     def _post(self, url, params=None):
         if params is None:
             params = {}
         response = self.config.http().post(self.config.base_merchant_path() + url, params)
         if "customer" in response:
-            return SuccessfulResult({"customer": Customer(self.gateway, response["customer"])})
+            customer = Customer(self.gateway, response["customer"])
+            NotFoundCache.forget(self.config, "customer", customer.id)
+            NotFoundCache.forget(self.config, "payment_method", *[payment_method.token for payment_method in customer.payment_methods])
+            return SuccessfulResult({"customer": customer})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
         else:
@@ -1,6 +1,8 @@
 import braintree
 from braintree.discount import Discount
+from braintree.exceptions.not_found_error import NotFoundError
 from braintree.resource_collection import ResourceCollection
+from braintree.util.catalog_cache import CatalogCache
 
 class DiscountGateway(object):
     def __init__(self, gateway):
@@ -8,6 +10,21 @@ class DiscountGateway(object):
         self.config = gateway.config
 
     def all(self):
+        return [Discount(self.gateway, item) for item in self.__all_attributes()]
+
+    def all_cached(self):
+        return CatalogCache.items_for(self.config, CatalogCache.Discounts, self.__all_attributes, self.__discount)
+
+    def get_cached(self, discount_id):
+        discount = CatalogCache.get_for(self.config, CatalogCache.Discounts, self.__all_attributes, self.__discount, discount_id)
+        if discount is None:
+            raise NotFoundError("Discount with id " + repr(discount_id) + " not found")
+        return discount
+
+    def __all_attributes(self):
         response = self.config.http().get(self.config.base_merchant_path() + "/discounts/")
         discounts = {"discount": response["discounts"]}
-        return [Discount(self.gateway, item) for item in ResourceCollection._extract_as_array(discounts, "discount")]
+        return ResourceCollection._extract_as_array(discounts, "discount")
+
+    def __discount(self, attributes):
+        return Discount(self.gateway, attributes)
@@ -1,4 +1,5 @@
 import mimetypes
+from functools import lru_cache
 from braintree.successful_result import SuccessfulResult
 from braintree.resource import Resource
 from braintree.configuration import Configuration
@@ -44,6 +45,7 @@ class DocumentUpload(Resource):
         return Configuration.gateway().document_upload.create(params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return [
             "kind",
@@ -1,5 +1,6 @@
 from braintree.exceptions.authentication_error import AuthenticationError
 from braintree.exceptions.authorization_error import AuthorizationError
+from braintree.exceptions.circuit_open_error import CircuitOpenError
 from braintree.exceptions.configuration_error import ConfigurationError
 from braintree.exceptions.gateway_timeout_error import GatewayTimeoutError
 from braintree.exceptions.invalid_challenge_error import InvalidChallengeError
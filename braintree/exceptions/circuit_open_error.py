@@ -0,0 +1,8 @@
+from braintree.exceptions.service_unavailable_error import ServiceUnavailableError
+
+class CircuitOpenError(ServiceUnavailableError):
+    """
+    Raised without contacting the gateway when the circuit breaker for an
+    endpoint family is open.
+    """
+    pass
@@ -1,3 +1,4 @@
 from braintree.exceptions.http.connection_error import ConnectionError
 from braintree.exceptions.http.invalid_response_error import InvalidResponseError
+from braintree.exceptions.http.timeout_error import DeadlineExceededError
 from braintree.exceptions.http.timeout_error import TimeoutError
@@ -10,3 +10,7 @@ class ConnectTimeoutError(TimeoutError):
 
 class ReadTimeoutError(TimeoutError):
     pass
+
+
+class DeadlineExceededError(TimeoutError):
+    pass
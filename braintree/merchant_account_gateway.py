@@ -1,3 +1,4 @@
+from functools import lru_cache
 from braintree.error_result import ErrorResult
 from braintree.merchant_account import MerchantAccount
 from braintree.paginated_collection import PaginatedCollection
@@ -6,6 +7,7 @@ from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
 from braintree.successful_result import SuccessfulResult
 from braintree.exceptions.not_found_error import NotFoundError
+from braintree.util.catalog_cache import CatalogCache
 
 
 class MerchantAccountGateway(object):
@@ -43,11 +45,32 @@ class MerchantAccountGateway(object):
         pc = PaginatedCollection(self._fetch_merchant_accounts)
         return SuccessfulResult({"merchant_accounts": pc})
 
+    def all_cached(self):
+        return CatalogCache.items_for(self.config, CatalogCache.MerchantAccounts, self.__all_attributes, self.__merchant_account)
+
+    def get_cached(self, merchant_account_id):
+        merchant_account = CatalogCache.get_for(
+            self.config, CatalogCache.MerchantAccounts, self.__all_attributes, self.__merchant_account, merchant_account_id
+        )
+        if merchant_account is None:
+            raise NotFoundError("merchant account with id " + repr(merchant_account_id) + " not found")
+        return merchant_account
+
+    def __all_attributes(self):
+        return list(PaginatedCollection(self.__fetch_merchant_account_attributes))
+
+    def __merchant_account(self, attributes):
+        return MerchantAccount(self.gateway, attributes)
+
     def _fetch_merchant_accounts(self, current_page):
+        result = self.__fetch_merchant_account_attributes(current_page)
+        merchant_accounts = [MerchantAccount(self.gateway, merchant_account) for merchant_account in result.current_page]
+        return PaginatedResult(result.total_items, result.page_size, merchant_accounts)
+
+    def __fetch_merchant_account_attributes(self, current_page):
         response = self.config.http().get(self.config.base_merchant_path() + "/merchant_accounts/?page=" + str(current_page))
         body = response["merchant_accounts"]
-        merchant_accounts = [MerchantAccount(self.gateway, merchant_account) for merchant_account in ResourceCollection._extract_as_array(body, "merchant_account")]
-        return PaginatedResult(body["total_items"], body["page_size"], merchant_accounts)
+        return PaginatedResult(body["total_items"], body["page_size"], ResourceCollection._extract_as_array(body, "merchant_account"))
 
     def _post(self, url, params=None):
         if params is None:
@@ -58,6 +81,7 @@ class MerchantAccountGateway(object):
             response = response["response"]
 
         if "merchant_account" in response:
+            CatalogCache.invalidate_for(self.config, CatalogCache.MerchantAccounts)
             return SuccessfulResult({"merchant_account": MerchantAccount(self.gateway, response["merchant_account"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
@@ -67,11 +91,13 @@ class MerchantAccountGateway(object):
             params = {}
         response = self.config.http().put(self.config.base_merchant_path() + url, params)
         if "merchant_account" in response:
+            CatalogCache.invalidate_for(self.config, CatalogCache.MerchantAccounts)
             return SuccessfulResult({"merchant_account": MerchantAccount(self.gateway, response["merchant_account"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _create_signature():
         return [
             {'individual': [
@@ -114,6 +140,7 @@ class MerchantAccountGateway(object):
         ]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _update_signature():
         return [
             {'individual': [
@@ -1,4 +1,5 @@
 import braintree
+from functools import lru_cache
 from braintree.address import Address
 from braintree.resource import Resource
 from braintree.configuration import Configuration
@@ -26,6 +27,7 @@ class PaymentMethod(Resource):
         return Configuration.gateway().payment_method.delete(payment_method_token, options)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return PaymentMethod.signature("create")
 
@@ -94,6 +96,7 @@ class PaymentMethod(Resource):
         return signature
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def update_signature():
         three_d_secure_pass_thru = [
             "cavv",
@@ -144,5 +147,6 @@ class PaymentMethod(Resource):
         return signature
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def delete_signature():
         return ["revoke_all_grants"]
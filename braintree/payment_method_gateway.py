@@ -22,6 +22,8 @@ from braintree.payment_method_parser import parse_payment_method
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
 from braintree.successful_result import SuccessfulResult
+from braintree.util.not_found_cache import NotFoundCache
+from braintree.util.vault_cache import VaultCache
 
 import sys
 from urllib.parse import urlencode
@@ -37,14 +39,24 @@ class PaymentMethodGateway(object):
             params = {}
         Resource.verify_keys(params, PaymentMethod.create_signature())
         self.__check_for_deprecated_attributes(params);
-        return self._post("/payment_methods", {"payment_method": params})
+        result = self._post("/payment_methods", {"payment_method": params})
+        if result.is_success:
+            NotFoundCache.forget(self.config, "payment_method", getattr(result.payment_method, "token", None))
+            if params.get("customer_id"):
+                VaultCache.invalidate(self.config, "customer/" + params["customer_id"])
+        return result
 
     def find(self, payment_method_token):
         try:
             if payment_method_token is None or payment_method_token.strip() == "":
                 raise NotFoundError()
 
-            response = self.config.http().get(self.config.base_merchant_path() + "/payment_methods/any/" + payment_method_token)
+            path = self.config.base_merchant_path() + "/payment_methods/any/" + payment_method_token
+            response = NotFoundCache.read_through(
+                self.config,
+                "payment_method/" + payment_method_token,
+                lambda: VaultCache.read_through(self.config, "payment_method/" + payment_method_token, lambda: self.config.http().get(path))
+            )
             return parse_payment_method(self.gateway, response)
         except NotFoundError:
             raise NotFoundError("payment method with token " + repr(payment_method_token) + " not found")
@@ -56,10 +68,13 @@ class PaymentMethodGateway(object):
             if payment_method_token is None or payment_method_token.strip() == "":
                 raise NotFoundError()
 
-            return self._put(
+            result = self._put(
                 "/payment_methods/any/" + payment_method_token,
                 {"payment_method": params}
             )
+            if result.is_success:
+                VaultCache.invalidate_payment_method(self.config, payment_method_token, getattr(result.payment_method, "customer_id", None))
+            return result
         except NotFoundError:
             raise NotFoundError("payment method with token " + repr(payment_method_token) + " not found")
 
@@ -74,6 +89,7 @@ class PaymentMethodGateway(object):
             query_param = "?" + urlencode(options)
 
         self.config.http().delete(self.config.base_merchant_path() + "/payment_methods/any/" + payment_method_token + query_param)
+        VaultCache.invalidate_payment_method(self.config, payment_method_token)
         return SuccessfulResult()
 
     def grant(self, payment_method_token, options=None):
@@ -107,7 +123,7 @@ class PaymentMethodGateway(object):
             raise ValueError
 
         try:
-            return self._post(
+            result = self._post(
                 "/payment_methods/revoke",
                 {
                     "payment_method": {
@@ -116,6 +132,9 @@ class PaymentMethodGateway(object):
                 },
                 "revoke"
             )
+            if result.is_success:
+                VaultCache.invalidate(self.config, "payment_method/" + payment_method_token, "credit_card/" + payment_method_token)
+            return result
         except NotFoundError:
             raise NotFoundError("payment method with payment_method_token " + repr(payment_method_token) + " not found")
 
@@ -8,14 +8,15 @@ from braintree.resource_collection import ResourceCollection
 from braintree.successful_result import SuccessfulResult
 
 class PaymentMethodNonceGateway(object):
+    __create_signature = [{"payment_method_nonce": ["merchant_account_id", "authentication_insight", {"authentication_insight_options": ["amount", "recurring_customer_consent", "recurring_max_amount"]}]}]
+
     def __init__(self, gateway):
         self.gateway = gateway
         self.config = gateway.config
 
     def create(self, payment_method_token, params = {"payment_method_nonce": {}}):
         try:
-            schema = [{"payment_method_nonce": ["merchant_account_id", "authentication_insight", {"authentication_insight_options": ["amount", "recurring_customer_consent", "recurring_max_amount"]}]}]
-            Resource.verify_keys(params, schema)
+            Resource.verify_keys(params, PaymentMethodNonceGateway.__create_signature)
             response = self.config.http().post(self.config.base_merchant_path() + "/payment_methods/" + payment_method_token + "/nonces", params)
             if "api_error_response" in response:
                 return ErrorResult(self.gateway, response["api_error_response"])
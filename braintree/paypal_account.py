@@ -1,4 +1,5 @@
 import braintree
+from functools import lru_cache
 from braintree.resource import Resource
 from braintree.configuration import Configuration
 
@@ -19,6 +20,7 @@ class PayPalAccount(Resource):
         return Configuration.gateway().paypal_account.update(paypal_account_token, params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def signature():
         signature = [
             "token",
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from braintree.util.http import Http
 import braintree
 from braintree.add_on import AddOn
@@ -38,6 +39,7 @@ class Plan(Resource):
         return Configuration.gateway().plan.update(subscription_id, params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return [
             "billing_day_of_month",
@@ -55,6 +57,7 @@ class Plan(Resource):
         ] + Plan._add_on_discount_signature()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def update_signature():
         return [
             "billing_day_of_month",
@@ -6,6 +6,7 @@ from braintree.exceptions.not_found_error import NotFoundError
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
 from braintree.successful_result import SuccessfulResult
+from braintree.util.catalog_cache import CatalogCache
 
 class PlanGateway(object):
     def __init__(self, gateway):
@@ -13,8 +14,10 @@ class PlanGateway(object):
         self.config = gateway.config
 
     def all(self):
-        response = self.config.http().get(self.config.base_merchant_path() + "/plans/")
-        return [Plan(self.gateway, item) for item in ResourceCollection._extract_as_array(response, "plans")]
+        return [Plan(self.gateway, item) for item in self.__all_attributes()]
+
+    def all_cached(self):
+        return CatalogCache.items_for(self.config, CatalogCache.Plans, self.__all_attributes, self.__plan)
 
     def create(self, params=None):
         if params is None:
@@ -22,6 +25,7 @@ class PlanGateway(object):
         Resource.verify_keys(params, Plan.create_signature())
         response = self.config.http().post(self.config.base_merchant_path() + "/plans", {"plan": params})
         if "plan" in response:
+            CatalogCache.invalidate_for(self.config, CatalogCache.Plans)
             return SuccessfulResult({"plan": Plan(self.gateway, response["plan"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
@@ -35,13 +39,26 @@ class PlanGateway(object):
         except NotFoundError:
             raise NotFoundError("Plan with id " + repr(plan_id) + " not found")
 
+    def get_cached(self, plan_id):
+        plan = CatalogCache.get_for(self.config, CatalogCache.Plans, self.__all_attributes, self.__plan, plan_id)
+        if plan is None:
+            raise NotFoundError("Plan with id " + repr(plan_id) + " not found")
+        return plan
+
     def update(self, plan_id, params=None):
         if params is None:
             params = {}
         Resource.verify_keys(params, Plan.update_signature())
         response = self.config.http().put(self.config.base_merchant_path() + "/plans/" + plan_id, {"plan": params})
         if "plan" in response:
+            CatalogCache.invalidate_for(self.config, CatalogCache.Plans)
             return SuccessfulResult({"plan": Plan(self.gateway, response["plan"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
 
+    def __all_attributes(self):
+        response = self.config.http().get(self.config.base_merchant_path() + "/plans/")
+        return ResourceCollection._extract_as_array(response, "plans")
+
+    def __plan(self, attributes):
+        return Plan(self.gateway, attributes)
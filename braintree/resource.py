@@ -7,34 +7,56 @@ text_type = str
 raw_type = bytes
 
 class Resource(AttributeGetter):
+    # attributes given a default when absent from the response, and the response fields they come from
+    _projected_defaults = {}
+
+    __compiled_signatures = {}
+    __max_compiled_signatures = 256
+
     @staticmethod
     def verify_keys(params, signature):
-        allowed_keys = Resource.__flattened_signature(signature)
-        params_keys = Resource.__flattened_params_keys(params)
+        allowed_keys, wildcard_keys = Resource.__compiled_signature(signature)
 
-        invalid_keys = [key for key in params_keys if key not in allowed_keys]
-        invalid_keys = Resource.__remove_wildcard_keys(allowed_keys, invalid_keys)
+        invalid_keys = []
+        Resource.__collect_invalid_keys(params, None, allowed_keys, wildcard_keys, invalid_keys)
 
         if len(invalid_keys) > 0:
             keys_string = ", ".join(invalid_keys)
             raise KeyError("Invalid keys: " + keys_string)
 
     @staticmethod
-    def __flattened_params_keys(params, parent=None):
+    def __compiled_signature(signature):
+        # the *_signature() methods return the same list on every call, so signatures are
+        # cached by identity; the entry keeps the list alive so its id cannot be reused
+        cached = Resource.__compiled_signatures.get(id(signature))
+        if cached is not None and cached[0] is signature:
+            return cached[1]
+        allowed_keys = Resource.__flattened_signature(signature)
+        compiled = (frozenset(allowed_keys), Resource.__wildcard_keys_regex(allowed_keys))
+        if len(Resource.__compiled_signatures) >= Resource.__max_compiled_signatures:
+            Resource.__compiled_signatures.clear()
+        Resource.__compiled_signatures[id(signature)] = (signature, compiled)
+        return compiled
+
+    @staticmethod
+    def __collect_invalid_keys(params, parent, allowed_keys, wildcard_keys, invalid_keys):
         if isinstance(params, text_type) or isinstance(params, raw_type):
-            return [ "%s[%s]" % (parent, params) ]
+            Resource.__check_key("%s[%s]" % (parent, params), allowed_keys, wildcard_keys, invalid_keys)
         else:
-            keys = []
             for key, val in params.items():
                 full_key = "%s[%s]" % (parent, key) if parent else key
                 if isinstance(val, dict):
-                    keys += Resource.__flattened_params_keys(val, full_key)
+                    Resource.__collect_invalid_keys(val, full_key, allowed_keys, wildcard_keys, invalid_keys)
                 elif isinstance(val, list):
                     for item in val:
-                        keys += Resource.__flattened_params_keys(item, full_key)
+                        Resource.__collect_invalid_keys(item, full_key, allowed_keys, wildcard_keys, invalid_keys)
                 else:
-                    keys.append(full_key)
-            return keys
+                    Resource.__check_key(full_key, allowed_keys, wildcard_keys, invalid_keys)
+
+    @staticmethod
+    def __check_key(key, allowed_keys, wildcard_keys, invalid_keys):
+        if key not in allowed_keys and (wildcard_keys is None or wildcard_keys.match(key) is None):
+            invalid_keys.append(key)
 
     @staticmethod
     def __flattened_signature(signature, parent=None):
@@ -50,19 +72,40 @@ class Resource(AttributeGetter):
         return flat_sig
 
     @staticmethod
-    def __remove_wildcard_keys(allowed_keys, invalid_keys):
+    def __wildcard_keys_regex(allowed_keys):
         wildcard_keys = [
             re.sub(r"(?<=[^\\])_", "\\_", re.escape(key)).replace(r"\[\_\_any\_key\_\_\]", r"\[[\w-]+\]")
             for key in allowed_keys
             if re.search(r"\[__any_key__\]", key)
         ]
-        new_keys = []
-        for key in invalid_keys:
-            if len([match for match in wildcard_keys if re.match(r"\A" + match + r"\Z", key)]) == 0:
-                new_keys.append(key)
-        return new_keys
+        if len(wildcard_keys) == 0:
+            return None
+        return re.compile(r"\A(?:" + "|".join(wildcard_keys) + r")\Z")
 
     def __init__(self, gateway, attributes):
         AttributeGetter.__init__(self, attributes)
         self.gateway = gateway
 
+    @staticmethod
+    def projected_fields(fields):
+        """ Returns the response fields to parse for a ``fields=`` projection, always including ``id``. """
+        return None if fields is None else frozenset(fields) | frozenset(["id"])
+
+    def _select_fields(self, fields):
+        if fields is not None:
+            self._selected_fields = fields
+            # a default would be mistaken for a value the response did not include
+            for name, sources in type(self)._projected_defaults.items():
+                if not sources <= fields:
+                    self.__dict__.pop(name, None)
+        return self
+
+    def __getattr__(self, name):
+        selected_fields = self.__dict__.get("_selected_fields")
+        if selected_fields is not None and not name.startswith("_"):
+            raise AttributeError(
+                "'" + type(self).__name__ + "' was loaded with fields=" + repr(sorted(selected_fields)) +
+                " and has no attribute '" + name + "'"
+            )
+        raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+
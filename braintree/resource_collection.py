@@ -1,5 +1,8 @@
 import braintree
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from braintree.exceptions.unexpected_error import UnexpectedError
+from braintree.util.deadline import Deadline
 
 class ResourceCollection(object):
     """
@@ -17,6 +20,7 @@ class ResourceCollection(object):
         self.__method = method
         self.__page_size = results["search_results"]["page_size"]
         self.__query = query
+        self.__deadline = Deadline.current()
 
     @property
     def maximum_size(self):
@@ -29,14 +33,62 @@ class ResourceCollection(object):
     @property
     def first(self):
         """ Returns the first item in the results. """
-        return self.__method(self.__query, self.__ids[0:1])[0]
+        with Deadline.within(self.__deadline):
+            items = iter(self.__method(self.__query, self.__ids[0:1]))
+            try:
+                return next(items)
+            finally:
+                ResourceCollection.__close(items)
 
     @property
     def items(self):
         """ Returns a generator allowing iteration over all of the results. """
         for batch in self.__batch_ids():
-            for item in self.__method(self.__query, batch):
-                yield item
+            with Deadline.within(self.__deadline):
+                items = iter(self.__method(self.__query, batch))
+            try:
+                for item in items:
+                    yield item
+            finally:
+                ResourceCollection.__close(items)
+
+    def items_parallel(self, max_workers=8, prefetch=2):
+        """
+        Returns a generator over all of the results, like :attr:`items`, but fetches pages
+        of results concurrently on a bounded pool of threads::
+
+            for transaction in results.items_parallel(max_workers=8, prefetch=2):
+                print transaction.id
+
+        Results are yielded in the original order. At most ``max_workers + prefetch`` pages,
+        counting the one being iterated over, are being fetched or held in memory at any
+        time. If fetching a page fails, the error is raised once iteration reaches that page
+        and the remaining fetches are cancelled.
+        """
+        batches = self.__batch_ids()
+        pending = deque()
+        deadline = Deadline.current()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for batch in batches:
+                pending.append(executor.submit(self.__fetch_batch, batch, deadline))
+                if len(pending) >= max_workers + prefetch:
+                    break
+
+            while pending:
+                items = pending.popleft().result()
+                for item in items:
+                    yield item
+
+                # the next page is requested only once this one is released
+                del items
+                for batch in batches:
+                    pending.append(executor.submit(self.__fetch_batch, batch, deadline))
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     @property
     def ids(self):
@@ -46,11 +98,23 @@ class ResourceCollection(object):
     def __iter__(self):
         return self.items
 
+    def __fetch_batch(self, batch, deadline=None):
+        # the deadline active when the search was made, and the one active where the page was requested
+        with Deadline.within(self.__deadline), Deadline.within(deadline):
+            return list(self.__method(self.__query, batch))
+
     def __batch_ids(self):
         for i in range(0, len(self.__ids), self.__page_size):
                 yield self.__ids[i:i+self.__page_size]
 
 
+    @staticmethod
+    def __close(items):
+        # a page that is still being read holds its connection until it is closed
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+
     @staticmethod
     def _extract_as_array(results, attribute):
         if not attribute in results:
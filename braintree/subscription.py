@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 from braintree.util.http import Http
 import braintree
 import warnings
@@ -90,6 +91,7 @@ class Subscription(Resource):
         return Configuration.gateway().subscription.create(params)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return [
             "billing_day_of_month",
@@ -189,6 +191,7 @@ class Subscription(Resource):
         return Configuration.gateway().subscription.search(*query)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def update_signature():
         return [
             "id",
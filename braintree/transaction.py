@@ -1,6 +1,7 @@
 import braintree
 import warnings
 from decimal import Decimal
+from functools import lru_cache
 from braintree.add_on import AddOn
 from braintree.address import Address
 from braintree.amex_express_checkout_card import AmexExpressCheckoutCard
@@ -35,6 +36,8 @@ from braintree.successful_result import SuccessfulResult
 from braintree.three_d_secure_info import ThreeDSecureInfo
 from braintree.transaction_line_item import TransactionLineItem
 from braintree.us_bank_account import UsBankAccount
+from braintree.util.constants import Constants
+from braintree.util.parser import Parser
 from braintree.venmo_account import VenmoAccount
 from braintree.visa_checkout_card import VisaCheckoutCard
 
@@ -311,7 +314,7 @@ class Transaction(Resource):
         return Configuration.gateway().transaction.cancel_release(transaction_id)
 
     @staticmethod
-    def credit(params=None):
+    def credit(params=None, deadline=None):
         """
         Creates a transaction of type Credit.
 
@@ -340,18 +343,23 @@ class Transaction(Resource):
         if params is None:
             params = {}
         params["type"] = Transaction.Type.Credit
-        return Transaction.create(params)
+        return Transaction.create(params, deadline)
 
     @staticmethod
-    def find(transaction_id):
+    def find(transaction_id, deadline=None, fields=None):
         """
         Find a transaction, given a transaction_id. This does not return
         a result object. This will raise a :class:`NotFoundError <braintree.exceptions.not_found_error.NotFoundError>` if the provided
         credit_card_id is not found. ::
 
             transaction = braintree.Transaction.find("my_transaction_id")
+
+        With ``fields``, only the listed response fields (and ``id``) are parsed;
+        reading any other attribute raises AttributeError. ::
+
+            transaction = braintree.Transaction.find("my_transaction_id", fields=["status", "amount"])
         """
-        return Configuration.gateway().transaction.find(transaction_id)
+        return Configuration.gateway().transaction.find(transaction_id, deadline, fields)
 
     @staticmethod
     def hold_in_escrow(transaction_id):
@@ -380,7 +388,7 @@ class Transaction(Resource):
 
 
     @staticmethod
-    def sale(params=None):
+    def sale(params=None, deadline=None):
         """
         Creates a transaction of type Sale. Amount is required. Also, a credit card,
         customer_id or payment_method_token is required. ::
@@ -402,17 +410,24 @@ class Transaction(Resource):
                 "amount": "100.00",
                 "customer_id": "my_customer_id"
             })
+
+        ``deadline`` limits the time, in seconds, spent on the call including retries;
+        see :class:`Deadline <braintree.util.deadline.Deadline>`.
         """
         if params is None:
             params = {}
         if "recurring" in params.keys():
             warnings.warn("Use transaction_source parameter instead", DeprecationWarning)
         params["type"] = Transaction.Type.Sale
-        return Transaction.create(params)
+        return Transaction.create(params, deadline)
+
+    @staticmethod
+    def search(*query, deadline=None, fields=None):
+        return Configuration.gateway().transaction.search(*query, deadline=deadline, fields=fields)
 
     @staticmethod
-    def search(*query):
-        return Configuration.gateway().transaction.search(*query)
+    def sharded_search(*query, **options):
+        return Configuration.gateway().transaction.sharded_search(*query, **options)
 
     @staticmethod
     def release_from_escrow(transaction_id):
@@ -477,7 +492,7 @@ class Transaction(Resource):
         return Configuration.gateway().transaction.void(transaction_id)
 
     @staticmethod
-    def create(params):
+    def create(params, deadline=None):
         """
         Creates a transaction. Amount and type are required. Also, a credit card,
         customer_id or payment_method_token is required. ::
@@ -503,13 +518,15 @@ class Transaction(Resource):
                 "customer_id": "my_customer_id"
             })
         """
-        return Configuration.gateway().transaction.create(params)
+        return Configuration.gateway().transaction.create(params, deadline)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def clone_signature():
         return ["amount", "channel", {"options": ["submit_for_settlement"]}]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_signature():
         return [
             "amount", "customer_id", "merchant_account_id", "order_id", "channel",
@@ -653,6 +670,7 @@ class Transaction(Resource):
         ]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def submit_for_settlement_signature():
         return [
                 "order_id",
@@ -671,10 +689,12 @@ class Transaction(Resource):
             ]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def update_details_signature():
         return ["amount", "order_id", {"descriptor": ["name", "phone", "url"]}]
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def refund_signature():
         return ["amount", "order_id", "merchant_account_id"]
 
@@ -692,88 +712,100 @@ class Transaction(Resource):
             params = {}
         return Configuration.gateway().transaction.submit_for_partial_settlement(transaction_id, amount, params)
 
-    def __init__(self, gateway, attributes):
-        Resource.__init__(self, gateway, attributes)
-
-        self.amount = Decimal(self.amount)
-        if "tax_amount" in attributes and getattr(self, "tax_amount", None):
-            self.tax_amount = Decimal(self.tax_amount)
-        if "discount_amount" in attributes and getattr(self, "discount_amount", None):
-            self.discount_amount = Decimal(self.discount_amount)
-        if "shipping_amount" in attributes and getattr(self, "shipping_amount", None):
-            self.shipping_amount = Decimal(self.shipping_amount)
-        if "billing" in attributes:
-            self.billing_details = Address(gateway, attributes.pop("billing"))
-        if "credit_card" in attributes:
-            self.credit_card_details = CreditCard(gateway, attributes.pop("credit_card"))
-        if "paypal" in attributes:
-            self.paypal_details = PayPalAccount(gateway, attributes.pop("paypal"))
-        if "paypal_here" in attributes:
-            self.paypal_here_details = PayPalHere(gateway, attributes.pop("paypal_here"))
-        if "local_payment" in attributes:
-            self.local_payment_details = LocalPayment(gateway, attributes.pop("local_payment"))
-        if "europe_bank_account" in attributes:
-            self.europe_bank_account_details = EuropeBankAccount(gateway, attributes.pop("europe_bank_account"))
-        if "us_bank_account" in attributes:
-            self.us_bank_account = UsBankAccount(gateway, attributes.pop("us_bank_account"))
-        if "apple_pay" in attributes:
-            self.apple_pay_details = ApplePayCard(gateway, attributes.pop("apple_pay"))
+    _projected_defaults = {
+        "risk_data": frozenset(["risk_data"]),
+        "sca_exemption_requested": frozenset(["sca_exemption_requested"]),
+        "three_d_secure_info": frozenset(["three_d_secure_info"])
+    }
+
+    # (attribute, response key, builder, whether the key is popped from the response attributes)
+    _nested_attributes = [
+        ("tax_amount", "tax_amount", lambda gateway, value: Decimal(value) if value else value, False),
+        ("discount_amount", "discount_amount", lambda gateway, value: Decimal(value) if value else value, False),
+        ("shipping_amount", "shipping_amount", lambda gateway, value: Decimal(value) if value else value, False),
+        ("billing_details", "billing", Address, True),
+        ("credit_card_details", "credit_card", CreditCard, True),
+        ("paypal_details", "paypal", PayPalAccount, True),
+        ("paypal_here_details", "paypal_here", PayPalHere, True),
+        ("local_payment_details", "local_payment", LocalPayment, True),
+        ("europe_bank_account_details", "europe_bank_account", EuropeBankAccount, True),
+        ("us_bank_account", "us_bank_account", UsBankAccount, True),
+        ("apple_pay_details", "apple_pay", ApplePayCard, True),
         # NEXT_MAJOR_VERSION rename to google_pay_card_details
-        if "android_pay_card" in attributes:
-            self.android_pay_card_details = AndroidPayCard(gateway, attributes.pop("android_pay_card"))
+        ("android_pay_card_details", "android_pay_card", AndroidPayCard, True),
         # NEXT_MAJOR_VERSION remove amex express checkout
-        if "amex_express_checkout_card" in attributes:
-            self.amex_express_checkout_card_details = AmexExpressCheckoutCard(gateway, attributes.pop("amex_express_checkout_card"))
-        if "venmo_account" in attributes:
-            self.venmo_account_details = VenmoAccount(gateway, attributes.pop("venmo_account"))
-        if "visa_checkout_card" in attributes:
-            self.visa_checkout_card_details = VisaCheckoutCard(gateway, attributes.pop("visa_checkout_card"))
+        ("amex_express_checkout_card_details", "amex_express_checkout_card", AmexExpressCheckoutCard, True),
+        ("venmo_account_details", "venmo_account", VenmoAccount, True),
+        ("visa_checkout_card_details", "visa_checkout_card", VisaCheckoutCard, True),
         # NEXt_MAJOR_VERSION remove masterpass
-        if "masterpass_card" in attributes:
-            self.masterpass_card_details = MasterpassCard(gateway, attributes.pop("masterpass_card"))
-        if "samsung_pay_card" in attributes:
-            self.samsung_pay_card_details = SamsungPayCard(gateway, attributes.pop("samsung_pay_card"))
+        ("masterpass_card_details", "masterpass_card", MasterpassCard, True),
+        ("samsung_pay_card_details", "samsung_pay_card", SamsungPayCard, True),
+        ("customer_details", "customer", Customer, True),
+        ("shipping_details", "shipping", Address, True),
+        ("add_ons", "add_ons", lambda gateway, value: [AddOn(gateway, add_on) for add_on in value], False),
+        ("discounts", "discounts", lambda gateway, value: [Discount(gateway, discount) for discount in value], False),
+        ("status_history", "status_history", lambda gateway, value: [StatusEvent(gateway, status_event) for status_event in value], False),
+        ("subscription_details", "subscription", lambda gateway, value: SubscriptionDetails(value), True),
+        ("descriptor", "descriptor", Descriptor, True),
+        ("disbursement_details", "disbursement_details", lambda gateway, value: DisbursementDetail(value), True),
+        ("disputes", "disputes", lambda gateway, value: [Dispute(dispute) for dispute in value], False),
+        ("authorization_adjustments", "authorization_adjustments",
+            lambda gateway, value: [AuthorizationAdjustment(authorization_adjustment) for authorization_adjustment in value], False),
+        ("risk_data", "risk_data", lambda gateway, value: RiskData(value), False),
+        ("three_d_secure_info", "three_d_secure_info", lambda gateway, value: None if value is None else ThreeDSecureInfo(value), False),
+        ("facilitated_details", "facilitated_details", lambda gateway, value: FacilitatedDetails(value), True),
+        ("facilitator_details", "facilitator_details", lambda gateway, value: FacilitatorDetails(value), True)
+    ]
+
+    # raw response attributes that _nested_attributes built into objects under another name
+    _superseded_attributes = frozenset(key for name, key, build, pop in _nested_attributes if name != key)
+
+    def __init__(self, gateway, attributes):
+        Resource.__init__(self, gateway, attributes)
+
+        # with lazy_resources, nested objects and decimals are built on first access
+        lazy = getattr(getattr(gateway, "config", None), "lazy_resources", False) is True
+        if lazy:
+            self._lazy_attributes = {}
+
+        if lazy and "amount" in attributes:
+            del self.amount
+            self._lazy_attributes["amount"] = (lambda gateway, value: Decimal(value), attributes["amount"])
+        elif "amount" in attributes:
+            self.amount = Decimal(self.amount)
+
+        for name, key, build, pop in Transaction._nested_attributes:
+            if key in attributes:
+                value = attributes.pop(key) if pop else attributes[key]
+                if lazy:
+                    self.__dict__.pop(name, None)
+                    self._lazy_attributes[name] = (build, value)
+                else:
+                    setattr(self, name, build(gateway, value))
+
         if "sca_exemption_requested" in attributes:
             self.sca_exemption_requested = attributes.pop("sca_exemption_requested")
         else:
             self.sca_exemption_requested = None
-        if "customer" in attributes:
-            self.customer_details = Customer(gateway, attributes.pop("customer"))
-        if "shipping" in attributes:
-            self.shipping_details = Address(gateway, attributes.pop("shipping"))
-        if "add_ons" in attributes:
-            self.add_ons = [AddOn(gateway, add_on) for add_on in self.add_ons]
-        if "discounts" in attributes:
-            self.discounts = [Discount(gateway, discount) for discount in self.discounts]
-        if "status_history" in attributes:
-            self.status_history = [StatusEvent(gateway, status_event) for status_event in self.status_history]
-        if "subscription" in attributes:
-            self.subscription_details = SubscriptionDetails(attributes.pop("subscription"))
-        if "descriptor" in attributes:
-            self.descriptor = Descriptor(gateway, attributes.pop("descriptor"))
-        if "disbursement_details" in attributes:
-            self.disbursement_details = DisbursementDetail(attributes.pop("disbursement_details"))
-        if "disputes" in attributes:
-            self.disputes = [Dispute(dispute) for dispute in self.disputes]
-        if "authorization_adjustments" in attributes:
-            self.authorization_adjustments = [AuthorizationAdjustment(authorization_adjustment) for authorization_adjustment in self.authorization_adjustments]
         if "payment_instrument_type" in attributes:
             self.payment_instrument_type = attributes["payment_instrument_type"]
-        if "risk_data" in attributes:
-            self.risk_data = RiskData(attributes["risk_data"])
-        else:
+        if "risk_data" not in attributes:
             self.risk_data = None
-        if "three_d_secure_info" in attributes and not attributes["three_d_secure_info"] is None:
-            self.three_d_secure_info = ThreeDSecureInfo(attributes["three_d_secure_info"])
-        else:
+        if "three_d_secure_info" not in attributes:
             self.three_d_secure_info = None
-        if "facilitated_details" in attributes:
-            self.facilitated_details = FacilitatedDetails(attributes.pop("facilitated_details"))
-        if "facilitator_details" in attributes:
-            self.facilitator_details = FacilitatorDetails(attributes.pop("facilitator_details"))
         if "network_transaction_id" in attributes:
             self.network_transaction_id = attributes["network_transaction_id"]
 
+    def __getattr__(self, name):
+        lazy_attributes = self.__dict__.get("_lazy_attributes")
+        if lazy_attributes is not None and name in lazy_attributes:
+            build, value = lazy_attributes[name]
+            built = build(self.gateway, value)
+            setattr(self, name, built)
+            lazy_attributes.pop(name, None)
+            return built
+        return Resource.__getattr__(self, name)
+
     @property
     def vault_billing_address(self):
         """
@@ -810,3 +842,10 @@ class Transaction(Resource):
         The line items associated with this transaction
         """
         return self.gateway.transaction_line_item.find_all(self.id)
+
+Parser.intern_values(
+    Constants.get_all_constant_values_from_class(Transaction.Status) +
+    Constants.get_all_constant_values_from_class(Transaction.Type) +
+    Constants.get_all_constant_values_from_class(Transaction.EscrowStatus) +
+    Constants.get_all_constant_values_from_class(Transaction.GatewayRejectionReason)
+)
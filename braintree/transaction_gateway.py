@@ -1,5 +1,8 @@
 import braintree
 import warnings
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from braintree.error_result import ErrorResult
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
@@ -7,6 +10,9 @@ from braintree.successful_result import SuccessfulResult
 from braintree.transaction import Transaction
 from braintree.exceptions.not_found_error import NotFoundError
 from braintree.exceptions.request_timeout_error import RequestTimeoutError
+from braintree.exceptions.unexpected_error import UnexpectedError
+from braintree.util.deadline import Deadline
+from braintree.util.not_found_cache import NotFoundCache
 
 
 class TransactionGateway(object):
@@ -33,23 +39,27 @@ class TransactionGateway(object):
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
 
-    def create(self, params):
+    def create(self, params, deadline=None):
         Resource.verify_keys(params, Transaction.create_signature())
         self.__check_for_deprecated_attributes(params)
-        return self._post("/transactions", {"transaction": params})
+        with Deadline.within(deadline):
+            return self._post("/transactions", {"transaction": params})
 
-    def credit(self, params):
+    def credit(self, params, deadline=None):
         if params is None:
             params = {}
         params["type"] = Transaction.Type.Credit
-        return self.create(params)
+        return self.create(params, deadline)
 
-    def find(self, transaction_id):
+    def find(self, transaction_id, deadline=None, fields=None):
         try:
             if transaction_id is None or transaction_id.strip() == "":
                 raise NotFoundError()
-            response = self.config.http().get(self.config.base_merchant_path() + "/transactions/" + transaction_id)
-            return Transaction(self.gateway, response["transaction"])
+            fields = Resource.projected_fields(fields)
+            path = self.config.base_merchant_path() + "/transactions/" + transaction_id
+            with Deadline.within(deadline):
+                response = NotFoundCache.read_through(self.config, "transaction/" + transaction_id, lambda: self.config.http().get(path, fields=fields))
+            return Transaction(self.gateway, response["transaction"])._select_fields(fields)
         except NotFoundError:
             raise NotFoundError("transaction with id " + repr(transaction_id) + " not found")
 
@@ -85,21 +95,105 @@ class TransactionGateway(object):
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
 
-    def sale(self, params):
+    def sale(self, params, deadline=None):
         if "recurring" in params.keys():
             warnings.warn("Use transaction_source parameter instead", DeprecationWarning)
         params.update({"type": "sale"})
-        return self.create(params)
+        return self.create(params, deadline)
 
-    def search(self, *query):
+    def search(self, *query, deadline=None, fields=None):
         if isinstance(query[0], list):
             query = query[0]
 
-        response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search_ids", {"search": self.__criteria(query)})
-        if "search_results" in response:
-            return ResourceCollection(query, response, self.__fetch)
-        else:
-            raise RequestTimeoutError("search timeout")
+        fields = Resource.projected_fields(fields)
+        with Deadline.within(deadline):
+            response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search_ids", {"search": self.__criteria(query)})
+            if "search_results" in response:
+                return ResourceCollection(query, response, lambda query, ids: self.__fetch(query, ids, fields))
+            else:
+                raise RequestTimeoutError("search timeout")
+
+    def sharded_search(self, *query, shard_by=None, max_workers=4, max_results=50000, min_window=None):
+        """
+        Searches for transactions like :meth:`search`, splitting a range criterion into
+        sub-windows that are searched concurrently. Windows that time out or return
+        ``max_results`` ids or more are split in half and searched again. ::
+
+            results = gateway.transaction.sharded_search(
+                braintree.TransactionSearch.created_at.between(start, end),
+                max_workers=8
+            )
+
+        The range is taken from the ``shard_by`` criterion (``TransactionSearch.created_at``
+        by default), which must have both a minimum and a maximum that are dates or numbers,
+        such as the strings given to ``TransactionSearch.amount.between("10.00", "20.00")``.
+        Windows no wider than ``min_window`` (one second for datetimes) are not split
+        further, and decimal windows are split no finer than their bounds' precision. Ids
+        are de-duplicated across windows and returned as a single ResourceCollection.
+        """
+        if isinstance(query[0], list):
+            query = query[0]
+
+        name = (shard_by or braintree.transaction_search.TransactionSearch.created_at).name
+        criteria = self.__criteria(query)
+        if name not in criteria or "min" not in criteria[name] or "max" not in criteria[name]:
+            raise ValueError("sharded_search requires a " + name + " criterion with a minimum and a maximum")
+        if min_window is None and isinstance(criteria[name]["min"], datetime):
+            min_window = timedelta(seconds=1)
+
+        windows = [(self.__shard_bound(name, criteria[name]["min"]), self.__shard_bound(name, criteria[name]["max"]))]
+        while len(windows) < max_workers:
+            split_windows = []
+            for window in windows:
+                split_windows += self.__split_window(window, min_window) or [window]
+            if len(split_windows) == len(windows):
+                break
+            windows = split_windows
+
+        search_results = {}
+        pending = {}
+        deadline = Deadline.current()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = dict((executor.submit(self.__search_window, criteria, name, window, deadline), window) for window in windows)
+            while pending:
+                done, _ = wait(list(pending.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    window = pending.pop(future)
+                    try:
+                        results = future.result()
+                        overflowed = len(results["ids"]) >= max_results
+                    except RequestTimeoutError:
+                        results = None
+                        overflowed = True
+
+                    if not overflowed:
+                        search_results[window] = results
+                        continue
+
+                    split_windows = self.__split_window(window, min_window)
+                    if split_windows is None:
+                        if results is None:
+                            raise RequestTimeoutError("search timeout")
+                        raise UnexpectedError("search results for " + name + " window " + repr(window) + " exceed " + str(max_results) + " ids")
+                    for split_window in split_windows:
+                        pending[executor.submit(self.__search_window, criteria, name, split_window, deadline)] = split_window
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+        ids = []
+        seen_ids = set()
+        page_size = 50
+        for window in sorted(search_results.keys()):
+            page_size = search_results[window]["page_size"]
+            for transaction_id in search_results[window]["ids"]:
+                if transaction_id not in seen_ids:
+                    seen_ids.add(transaction_id)
+                    ids.append(transaction_id)
+
+        return ResourceCollection(query, {"search_results": {"ids": ids, "page_size": page_size}}, self.__fetch)
 
     def release_from_escrow(self, transaction_id):
         response = self.config.http().put(self.config.base_merchant_path() + "/transactions/" + transaction_id + "/release_from_escrow", {})
@@ -152,15 +246,64 @@ class TransactionGateway(object):
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
 
-    def __fetch(self, query, ids):
+    def __fetch(self, query, ids, fields=None):
         criteria = self.__criteria(query)
         criteria["ids"] = braintree.transaction_search.TransactionSearch.ids.in_list(ids).to_param()
-        response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search", {"search": criteria})
-        if "credit_card_transactions" in response:
-            return [Transaction(self.gateway, item) for item in ResourceCollection._extract_as_array(response["credit_card_transactions"], "transaction")]
+        elements = self.config.http().post_elements(
+            self.config.base_merchant_path() + "/transactions/advanced_search", {"search": criteria}, "transaction", fields=fields
+        )
+        return self.__transactions(elements, fields)
+
+    def __transactions(self, elements, fields=None):
+        # the page holds its connection until it is read, so release it if iteration stops early
+        try:
+            for attributes in elements:
+                yield Transaction(self.gateway, attributes)._select_fields(fields)
+            if elements.root != "credit_card_transactions":
+                raise RequestTimeoutError("search timeout")
+        finally:
+            elements.close()
+
+    def __search_window(self, criteria, name, window, deadline=None):
+        window_criteria = dict(criteria)
+        window_criteria[name] = dict(criteria[name], min=self.__format_bound(window[0]), max=self.__format_bound(window[1]))
+        # runs on a pool thread, which does not see the caller's deadline
+        with Deadline.within(deadline):
+            response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search_ids", {"search": window_criteria})
+        if "search_results" in response:
+            return response["search_results"]
         else:
             raise RequestTimeoutError("search timeout")
 
+    def __split_window(self, window, min_window):
+        low, high = window
+        if min_window is not None and high - low <= min_window:
+            return None
+        if isinstance(low, int):
+            middle = low + (high - low) // 2
+        elif isinstance(low, Decimal):
+            exponent = min(low.as_tuple().exponent, high.as_tuple().exponent)
+            middle = (low + (high - low) / 2).quantize(Decimal(1).scaleb(exponent))
+        else:
+            middle = low + (high - low) / 2
+        if not low < middle < high:
+            return None
+        return [(low, middle), (middle, high)]
+
+    def __shard_bound(self, name, bound):
+        # range criteria take amounts as strings, which are split as decimals
+        if isinstance(bound, (date, int, float, Decimal)):
+            return bound
+        try:
+            return Decimal(bound)
+        except (TypeError, ValueError, ArithmeticError):
+            raise ValueError("sharded_search cannot split " + name + " on " + repr(bound) + ", which is neither a date nor a number")
+
+    def __format_bound(self, bound):
+        if isinstance(bound, Decimal):
+            return str(bound)
+        return bound
+
     def __criteria(self, query):
         criteria = {}
         for term in query:
@@ -175,6 +318,7 @@ class TransactionGateway(object):
             params = {}
         response = self.config.http().post(self.config.base_merchant_path() + url, params)
         if "transaction" in response:
+            NotFoundCache.forget(self.config, "transaction", response["transaction"].get("id"))
             return SuccessfulResult({"transaction": Transaction(self.gateway, response["transaction"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
@@ -1,7 +1,20 @@
+from braintree.util.async_http import AsyncHttp
+from braintree.util.catalog_cache import CatalogCache
 from braintree.util.constants import Constants
+from braintree.util.circuit_breaker import CircuitBreaker
+from braintree.util.connection_pool import ConnectionPool
 from braintree.util.crypto import Crypto
+from braintree.util.deadline import Deadline
 from braintree.util.generator import Generator
+from braintree.util.hedging_policy import HedgingPolicy
 from braintree.util.http import Http
 from braintree.util.graphql_client import GraphQLClient
+from braintree.util.not_found_cache import NotFoundCache
 from braintree.util.parser import Parser
+from braintree.util.rate_limiter import RateLimiter
+from braintree.util.response_body import ResponseBody
+from braintree.util.retry_policy import RetryPolicy
+from braintree.util.shared_catalog_cache import SharedCatalogCache
+from braintree.util.single_flight import SingleFlight
+from braintree.util.vault_cache import VaultCache
 from braintree.util.xml_util import XmlUtil
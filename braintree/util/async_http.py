@@ -0,0 +1,262 @@
+import asyncio
+import gzip
+import json
+import ssl
+from urllib.parse import urlsplit
+from braintree.environment import Environment
+from braintree.exceptions.http.connection_error import ConnectionError
+from braintree.exceptions.http.invalid_response_error import InvalidResponseError
+from braintree.exceptions.http.timeout_error import TimeoutError
+from braintree.exceptions.unexpected_error import UnexpectedError
+from braintree.util.deadline import Deadline
+from braintree.util.http import Http
+from braintree.util.request_context import RequestContext
+from braintree.util.retry_policy import RetryPolicy
+from braintree.util.xml_util import XmlUtil
+
+class AsyncHttp(object):
+    """
+    The asyncio counterpart of :class:`Http <braintree.util.http.Http>`.
+
+    Requests are sent through ``config.async_http_strategy()``, any object with a
+    coroutine ``http_do(http_verb, path, headers, request_body)`` returning
+    ``[status, body]``. By default this is the AsyncHttp itself, which speaks
+    HTTP/1.1 over asyncio streams and keeps up to the configured ``pool_size`` of
+    idle connections per host and event loop open for reuse.
+
+    Unlike :class:`Http <braintree.util.http.Http>`, AsyncHttp does not apply the
+    configuration's ``retry_policy``, ``rate_limiter``, ``circuit_breaker`` or
+    ``hedging_policy``, and the active :class:`Deadline <braintree.util.deadline.Deadline>`
+    only bounds how long a request waits for an identical one coalesced by
+    ``single_flight``.
+    """
+
+    def __init__(self, config, environment=None):
+        self.config = config
+        self.environment = environment or self.config.environment
+        self.__context = None
+        self.__idle_connections = {}
+
+    def context(self):
+        if self.__context is None:
+            self.__context = RequestContext(self.config)
+        return self.__context
+
+    async def post(self, path, params=None):
+        return await self._make_request("POST", path, Http.ContentType.Xml, params)
+
+    async def delete(self, path):
+        return await self._make_request("DELETE", path, Http.ContentType.Xml)
+
+    async def get(self, path):
+        return await self._make_request("GET", path, Http.ContentType.Xml)
+
+    async def put(self, path, params=None):
+        return await self._make_request("PUT", path, Http.ContentType.Xml, params)
+
+    async def _make_request(self, http_verb, path, content_type, params=None, header_overrides=None):
+        single_flight = getattr(self.config, "single_flight", None)
+        if single_flight is None or http_verb != "GET":
+            return await self.__make_request(http_verb, path, content_type, params, header_overrides)
+
+        deadline = Deadline.current()
+        return await single_flight.do_async(
+            (http_verb, self.__full_path(path), content_type, None, self.__authorization_digest(header_overrides)),
+            lambda: self.__make_request(http_verb, path, content_type, params, header_overrides),
+            None if deadline is None else deadline.remaining()
+        )
+
+    async def __make_request(self, http_verb, path, content_type, params, header_overrides):
+        http_strategy = self.config.async_http_strategy()
+        headers = self.__headers(content_type, header_overrides)
+        request_body = self.__request_body(content_type, params)
+        full_path = self.__full_path(path)
+
+        try:
+            status, response_body = await http_strategy.http_do(http_verb, full_path, headers, request_body)
+        except Exception as e:
+            if self.config.wrap_http_exceptions:
+                http_strategy.handle_exception(e)
+            else:
+                raise
+
+        if Http.is_error_status(status):
+            Http.raise_exception_from_status(status)
+        else:
+            if len(response_body.strip()) == 0:
+                return {}
+            else:
+                if content_type == Http.ContentType.Json:
+                    return json.loads(response_body)
+                else:
+                    return XmlUtil.dict_from_xml(response_body)
+
+    async def http_do(self, http_verb, path, headers, request_body):
+        url = urlsplit(path)
+        is_ssl = url.scheme == "https"
+        key = (url.hostname, url.port or (443 if is_ssl else 80), is_ssl)
+        target = path[len(url.scheme + "://" + url.netloc):] or "/"
+
+        if isinstance(request_body, str):
+            request_body = request_body.encode("utf-8")
+        request = self.__serialize_request(http_verb, url.netloc, target, headers, request_body or b"")
+
+        while True:
+            reader, writer, reused = await self.__connection(key)
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, response_headers, response_body = await asyncio.wait_for(
+                    self.__read_response(reader, http_verb),
+                    getattr(self.config, "read_timeout", None) or self.config.timeout
+                )
+            except (ConnectionResetError, asyncio.IncompleteReadError) as e:
+                writer.close()
+                # the server may close an idle keep-alive connection at any time, but it may also have
+                # processed the request first, so only requests that are safe to repeat are sent again
+                if reused and http_verb in RetryPolicy.IdempotentVerbs and (not isinstance(e, asyncio.IncompleteReadError) or len(e.partial) == 0):
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            break
+
+        idle_connections = self.__idle_connections.setdefault((asyncio.get_event_loop(), key), [])
+        if response_headers.get("connection", "").lower() == "close" or len(idle_connections) >= self.__max_idle_connections():
+            writer.close()
+        else:
+            idle_connections.append((reader, writer))
+
+        if response_headers.get("content-encoding", "").lower() == "gzip":
+            response_body = gzip.decompress(response_body)
+
+        return [status, response_body]
+
+    def handle_exception(self, exception):
+        if isinstance(exception, asyncio.TimeoutError):
+            raise TimeoutError(exception)
+        elif isinstance(exception, (OSError, asyncio.IncompleteReadError)):
+            raise ConnectionError(exception)
+        elif isinstance(exception, ValueError):
+            raise InvalidResponseError(exception)
+        else:
+            raise UnexpectedError(exception)
+
+    async def close(self):
+        """ Closes the idle connections of the running event loop. """
+        loop = asyncio.get_event_loop()
+        self.__forget_closed_loops()
+        for connection_key in [connection_key for connection_key in self.__idle_connections if connection_key[0] is loop]:
+            for _, writer in self.__idle_connections.pop(connection_key):
+                writer.close()
+
+    async def __connection(self, key):
+        # connections belong to the event loop that opened them, which may since have been closed
+        self.__forget_closed_loops()
+        connections = self.__idle_connections.get((asyncio.get_event_loop(), key), [])
+        while connections:
+            reader, writer = connections.pop()
+            if not writer.transport.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        host, port, is_ssl = key
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self.__ssl_context() if is_ssl else None),
+            getattr(self.config, "connect_timeout", None) or self.config.timeout
+        )
+        return reader, writer, False
+
+    def __max_idle_connections(self):
+        connection_pool = getattr(self.config, "connection_pool", None)
+        return 10 if connection_pool is None else connection_pool().pool_size
+
+    def __forget_closed_loops(self):
+        for connection_key in [connection_key for connection_key in self.__idle_connections if connection_key[0].is_closed()]:
+            del self.__idle_connections[connection_key]
+
+    def __ssl_context(self):
+        if self.config.environment == Environment.Development:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            return context
+        return ssl.create_default_context(cafile=self.environment.ssl_certificate)
+
+    def __serialize_request(self, http_verb, host, target, headers, body):
+        lines = [http_verb + " " + target + " HTTP/1.1", "Host: " + host]
+        for name, value in headers.items():
+            if isinstance(value, bytes):
+                value = value.decode("latin-1")
+            lines.append(name + ": " + value)
+        lines.append("Content-Length: " + str(len(body)))
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+    async def __read_response(self, reader, http_verb):
+        status_line = await reader.readuntil(b"\r\n")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise ValueError("invalid HTTP status line " + repr(status_line))
+
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if http_verb == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self.__read_chunked_body(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            headers["connection"] = "close"
+            body = await reader.read()
+
+        return status, headers, body
+
+    async def __read_chunked_body(self, reader):
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    def __authorization_digest(self, header_overrides):
+        # requests made with different credentials must not share a response
+        authorization = (header_overrides or {}).get("Authorization")
+        if authorization is None:
+            return self.context().authorization_digest
+        return RequestContext.digest(authorization)
+
+    def __headers(self, content_type, header_overrides=None):
+        if content_type == Http.ContentType.Xml:
+            headers = self.context().xml_headers
+        else:
+            headers = self.context().headers
+
+        if header_overrides:
+            headers = dict(headers, **header_overrides)
+        else:
+            headers = headers.copy()
+
+        return headers
+
+    def __request_body(self, content_type, params):
+        if content_type == Http.ContentType.Xml:
+            return XmlUtil.xml_from_dict(params) if params else ''
+        else:
+            return params
+
+    def __full_path(self, path):
+        base_url = self.context().base_url
+        return path if path.startswith(base_url) or path.startswith(self.config.graphql_base_url()) else (base_url + path)
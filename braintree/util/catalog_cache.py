@@ -0,0 +1,144 @@
+import threading
+import time
+
+
+class CatalogCache(object):
+    """
+    Caches slowly changing catalogs: plans, add-ons, discounts and merchant accounts. ::
+
+        catalog_cache = braintree.util.CatalogCache(ttl=300, stale_ttl=3600)
+        gateway = braintree.BraintreeGateway(braintree.Configuration(..., catalog_cache=catalog_cache))
+        plan = gateway.plan.get_cached("gold")
+
+    A catalog is loaded with the gateway's ``all`` request the first time it is used
+    and is served from memory for ``ttl`` seconds. For ``stale_ttl`` seconds after
+    that, the stale catalog is still served while a background thread reloads it;
+    after both have passed it is reloaded before returning. ``invalidate`` drops one
+    catalog, such as ``CatalogCache.Plans``, or all of them, so the next lookup
+    reloads it. Plan and merchant account writes made through the gateway
+    invalidate their catalog.
+    """
+
+    Plans = "plans"
+    AddOns = "add_ons"
+    Discounts = "discounts"
+    MerchantAccounts = "merchant_accounts"
+
+    class _Entry(object):
+        def __init__(self, items, loaded_at):
+            self.items = items
+            self.by_id = dict((item.id, item) for item in items)
+            self.loaded_at = loaded_at
+            self.refreshing = False
+
+    def __init__(self, ttl=300, stale_ttl=3600, refresh_in_background=True):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_in_background = refresh_in_background
+        self.__entries = {}
+        self.__generation = 0
+        self.__lock = threading.Lock()
+        self.__load_locks = {}
+
+    def items(self, key, load, build):
+        """
+        Returns the catalog cached under ``key``. ``load`` returns the catalog's
+        parsed response attributes, and ``build`` makes a resource from each.
+        """
+        return self.__entry(key, load, build).items
+
+    def get(self, key, load, build, item_id):
+        """ Returns the item with ``item_id``, or None if the catalog has no such item. """
+        return self.__entry(key, load, build).by_id.get(item_id)
+
+    def invalidate(self, name=None):
+        with self.__lock:
+            self.__generation += 1
+            for key in list(self.__entries):
+                if name is None or key[1] == name:
+                    del self.__entries[key]
+
+    @staticmethod
+    def items_for(config, name, load, build):
+        """
+        Returns the catalog ``name`` from ``config.catalog_cache``, or builds it from
+        ``load`` if no catalog cache is configured.
+        """
+        cache = getattr(config, "catalog_cache", None)
+        if cache is None:
+            return [build(attributes) for attributes in load()]
+        return list(cache.items(CatalogCache.__scoped_key(config, name), load, build))
+
+    @staticmethod
+    def get_for(config, name, load, build, item_id):
+        cache = getattr(config, "catalog_cache", None)
+        if cache is None:
+            return next((build(attributes) for attributes in load() if attributes.get("id") == item_id), None)
+        return cache.get(CatalogCache.__scoped_key(config, name), load, build, item_id)
+
+    @staticmethod
+    def invalidate_for(config, name):
+        cache = getattr(config, "catalog_cache", None)
+        if cache is not None:
+            cache.invalidate(name)
+
+    def _now(self):
+        return time.monotonic()
+
+    def _cached_entry(self, key, build):
+        return self.__entries.get(key)
+
+    def _load(self, key, load, build):
+        generation = self.__generation
+        entry = CatalogCache._Entry([build(attributes) for attributes in load()], self._now())
+        with self.__lock:
+            # a catalog loaded across an invalidation may predate the write that caused it
+            if generation == self.__generation:
+                self.__entries[key] = entry
+        return entry
+
+    def __entry(self, key, load, build):
+        entry = self._cached_entry(key, build)
+        if entry is not None:
+            age = self._now() - entry.loaded_at
+            if age < self.ttl:
+                return entry
+            if age < self.ttl + self.stale_ttl:
+                self.__refresh(key, load, build, entry)
+                return entry
+
+        with self.__load_lock(key):
+            # another thread may have loaded the catalog while this one waited
+            entry = self._cached_entry(key, build)
+            if entry is not None and self._now() - entry.loaded_at < self.ttl:
+                return entry
+            return self._load(key, load, build)
+
+    def __refresh(self, key, load, build, entry):
+        with self.__lock:
+            if entry.refreshing:
+                return
+            entry.refreshing = True
+
+        def refresh():
+            try:
+                with self.__load_lock(key):
+                    self._load(key, load, build)
+            except Exception:
+                # keep serving the stale catalog; the next lookup tries again
+                pass
+            finally:
+                entry.refreshing = False
+
+        if self.refresh_in_background:
+            threading.Thread(target=refresh, daemon=True).start()
+        else:
+            refresh()
+
+    def __load_lock(self, key):
+        with self.__lock:
+            return self.__load_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def __scoped_key(config, name):
+        return (config.merchant_id, name)
@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import deque
+
+from braintree.exceptions.circuit_open_error import CircuitOpenError
+
+class CircuitBreaker(object):
+    """
+    Fails requests fast while an endpoint family of the gateway is unhealthy. ::
+
+        circuit_breaker = braintree.util.CircuitBreaker(failure_rate_threshold=0.5, slow_call_threshold=5)
+        config = braintree.Configuration(..., circuit_breaker=circuit_breaker)
+
+    Each endpoint family returned by :meth:`Http.endpoint_family <braintree.util.http.Http.endpoint_family>`
+    has its own circuit, tracking the outcome of its last ``window_size`` requests. A request
+    fails if it raises, returns one of ``failure_statuses`` or takes longer than
+    ``slow_call_threshold`` seconds. Once at least ``minimum_requests`` have been recorded
+    and the failure rate reaches ``failure_rate_threshold``, the circuit opens and requests
+    raise CircuitOpenError for ``open_duration`` seconds. The circuit then lets
+    ``half_open_requests`` probe requests through: it closes if they all succeed and opens
+    again on the first failure.
+
+    :meth:`state` and :meth:`states` expose circuit states for monitoring, and
+    ``on_state_change`` is called with ``(family, old_state, new_state)`` on every transition.
+    """
+
+    Closed = "closed"
+    Open = "open"
+    HalfOpen = "half_open"
+
+    class _Circuit(object):
+        def __init__(self, window_size):
+            self.state = CircuitBreaker.Closed
+            self.outcomes = deque(maxlen=window_size)
+            self.opened_at = None
+            self.probes_in_flight = 0
+            self.probe_successes = 0
+
+    def __init__(self, failure_rate_threshold=0.5, minimum_requests=20, window_size=100, slow_call_threshold=None,
+                 open_duration=30, half_open_requests=1, failure_statuses=None, on_state_change=None):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.window_size = window_size
+        self.slow_call_threshold = slow_call_threshold
+        self.open_duration = open_duration
+        self.half_open_requests = half_open_requests
+        self.failure_statuses = failure_statuses or [500, 502, 503, 504]
+        self.on_state_change = on_state_change
+        self.__circuits = {}
+        self.__lock = threading.Lock()
+
+    def before_request(self, family):
+        with self.__lock:
+            circuit = self.__circuit(family)
+            if circuit.state == CircuitBreaker.Open:
+                if time.monotonic() - circuit.opened_at < self.open_duration:
+                    raise CircuitOpenError("circuit open for " + family + " requests")
+                self.__transition(family, circuit, CircuitBreaker.HalfOpen)
+
+            if circuit.state == CircuitBreaker.HalfOpen:
+                if circuit.probes_in_flight + circuit.probe_successes >= self.half_open_requests:
+                    raise CircuitOpenError("circuit half open for " + family + " requests")
+                circuit.probes_in_flight += 1
+
+    def record(self, family, status=None, duration=0, exception=None):
+        failed = exception is not None or status in self.failure_statuses or \
+            (self.slow_call_threshold is not None and duration > self.slow_call_threshold)
+
+        with self.__lock:
+            circuit = self.__circuit(family)
+            if circuit.state == CircuitBreaker.HalfOpen:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+                if failed:
+                    self.__open(family, circuit)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_requests:
+                        circuit.outcomes.clear()
+                        self.__transition(family, circuit, CircuitBreaker.Closed)
+            elif circuit.state == CircuitBreaker.Closed:
+                circuit.outcomes.append(failed)
+                if len(circuit.outcomes) >= self.minimum_requests and \
+                        sum(circuit.outcomes) >= self.failure_rate_threshold * len(circuit.outcomes):
+                    self.__open(family, circuit)
+
+    def release(self, family):
+        # frees the probe slot of a request that ended without an outcome, such as one interrupted by KeyboardInterrupt
+        with self.__lock:
+            circuit = self.__circuit(family)
+            if circuit.state == CircuitBreaker.HalfOpen:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+
+    def state(self, family):
+        with self.__lock:
+            circuit = self.__circuits.get(family)
+            return circuit.state if circuit else CircuitBreaker.Closed
+
+    def states(self):
+        with self.__lock:
+            return dict((family, circuit.state) for family, circuit in self.__circuits.items())
+
+    def __circuit(self, family):
+        circuit = self.__circuits.get(family)
+        if circuit is None:
+            circuit = self.__circuits[family] = CircuitBreaker._Circuit(self.window_size)
+        return circuit
+
+    def __open(self, family, circuit):
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+        self.__transition(family, circuit, CircuitBreaker.Open)
+
+    def __transition(self, family, circuit, state):
+        old_state = circuit.state
+        circuit.state = state
+        circuit.probes_in_flight = 0
+        circuit.probe_successes = 0
+        if self.on_state_change is not None and old_state != state:
+            self.on_state_change(family, old_state, state)
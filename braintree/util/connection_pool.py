@@ -0,0 +1,72 @@
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+class ConnectionPool(object):
+    """
+    A long-lived, thread-safe pool of keep-alive connections to the gateway.
+
+    A single pool is owned by a :class:`Configuration <braintree.configuration.Configuration>`
+    and shared by every request it makes, so the TCP connect and TLS handshake
+    are only paid when a new connection is opened. ::
+
+        pool = braintree.util.ConnectionPool(pool_size=20, max_idle=30)
+
+    The underlying session is transparently re-created after a fork, and after
+    it has been idle for longer than ``max_idle`` seconds. A replaced session is
+    not closed, since another thread may still be sending a request or reading a
+    response through it; its connections are closed once nothing refers to it.
+    """
+
+    def __init__(self, pool_size=10, keep_alive=True, max_idle=None):
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.max_idle = max_idle
+        self.__lock = threading.Lock()
+        self.__session = None
+        self.__pid = None
+        self.__last_used = None
+
+    def send(self, prepared_request, **kwargs):
+        if not self.keep_alive:
+            prepared_request.headers["Connection"] = "close"
+        try:
+            return self.session().send(prepared_request, **kwargs)
+        finally:
+            # a slow request must not make the session look idle
+            with self.__lock:
+                self.__last_used = time.monotonic()
+
+    def session(self):
+        with self.__lock:
+            now = time.monotonic()
+            # connections inherited from the parent process must never be used
+            # or closed by the child, and an idle session may still be in use by
+            # another thread, so both are simply forgotten
+            if self.__pid != os.getpid() or (self.__session is not None and self.__is_idle(now)):
+                self.__session = None
+
+            if self.__session is None:
+                self.__session = self.__build_session()
+                self.__pid = os.getpid()
+            self.__last_used = now
+            return self.__session
+
+    def close(self):
+        with self.__lock:
+            if self.__session is not None and self.__pid == os.getpid():
+                self.__session.close()
+            self.__session = None
+
+    def __is_idle(self, now):
+        return self.max_idle is not None and now - self.__last_used > self.max_idle
+
+    def __build_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
@@ -1,13 +1,38 @@
 import re
+from datetime import date
 from datetime import datetime
 from datetime import timedelta
+from functools import lru_cache
 
 
 _OFFSET_REGEX = re.compile(r'(\+|\-)(\d\d):(\d\d)$')
 _SYMBOLS_REGEX = re.compile(r'[-:Z]')
 
 
+@lru_cache(maxsize=4096)
 def parse_datetime(timestamp):
+    # the gateway sends timestamps as YYYY-MM-DDTHH:MM:SSZ; anything else takes the general path
+    if (len(timestamp) == 20 and timestamp[19] == 'Z' and timestamp[10] == 'T'
+            and timestamp[4] == '-' and timestamp[7] == '-' and timestamp[13] == ':' and timestamp[16] == ':'):
+        digits = timestamp[0:4] + timestamp[5:7] + timestamp[8:10] + timestamp[11:13] + timestamp[14:16] + timestamp[17:19]
+        if digits.isdigit() and digits[12:14] < '60':
+            return datetime(
+                int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                int(digits[8:10]), int(digits[10:12]), int(digits[12:14])
+            )
+    return _parse_datetime(timestamp)
+
+
+@lru_cache(maxsize=1024)
+def parse_date(value):
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        digits = value[0:4] + value[5:7] + value[8:10]
+        if digits.isdigit():
+            return date(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]))
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _parse_datetime(timestamp):
     offset_matches = _OFFSET_REGEX.findall(timestamp)
 
     if len(offset_matches) == 0:
@@ -16,7 +41,7 @@ def parse_datetime(timestamp):
         seconds = timedelta(seconds=float(timestamp[13:]))
         return without_seconds + seconds
     else:
-        time_without_offset = parse_datetime(timestamp[:-6])
+        time_without_offset = _parse_datetime(timestamp[:-6])
 
         try:
             offset_matches = offset_matches[0]
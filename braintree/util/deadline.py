@@ -0,0 +1,95 @@
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+from braintree.exceptions.http.timeout_error import DeadlineExceededError
+
+class Deadline(object):
+    """
+    An overall time budget for one or more gateway calls, including their retries. ::
+
+        with braintree.util.Deadline(2.5):
+            result = gateway.transaction.sale({...})
+
+    While a deadline is active in a thread, or in an asyncio task, each request is sent with its timeouts
+    capped to the time remaining, retries that would not finish in time are not
+    attempted, and a request started after the deadline has passed raises
+    DeadlineExceededError. Nested deadlines never extend an outer one.
+    Search results capture the deadline active when they were created and apply it
+    while fetching their pages, including from :meth:`items_parallel
+    <braintree.resource_collection.ResourceCollection.items_parallel>` threads.
+
+    Active deadlines are kept in a ``contextvars.ContextVar``, so concurrent asyncio
+    tasks each see their own; on Python versions without ``contextvars`` they are
+    kept per thread.
+    """
+
+    if contextvars is not None:
+        __active = contextvars.ContextVar("braintree_deadlines", default=())
+    else:
+        __local = threading.local()
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.__previous = []
+
+    @staticmethod
+    def current():
+        """ Returns the earliest deadline active in this context, or None. """
+        active = Deadline.__get_active()
+        if not active:
+            return None
+        return min(active, key=lambda deadline: deadline.expires_at)
+
+    @staticmethod
+    @contextmanager
+    def within(deadline):
+        """
+        Activates ``deadline``, which may be a Deadline, a number of seconds or None
+        for no deadline, for the duration of a ``with`` block.
+        """
+        if deadline is None:
+            yield None
+        else:
+            if not isinstance(deadline, Deadline):
+                deadline = Deadline(deadline)
+            with deadline:
+                yield deadline
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def check(self):
+        if self.expired():
+            raise DeadlineExceededError("deadline of " + str(self.seconds) + "s exceeded")
+
+    def __enter__(self):
+        active = Deadline.__get_active()
+        self.__previous.append(active)
+        Deadline.__set_active(active + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        Deadline.__set_active(self.__previous.pop())
+
+    @staticmethod
+    def __get_active():
+        if contextvars is not None:
+            return Deadline.__active.get()
+        return getattr(Deadline.__local, "active", ())
+
+    @staticmethod
+    def __set_active(active):
+        if contextvars is not None:
+            Deadline.__active.set(active)
+        else:
+            Deadline.__local.active = active
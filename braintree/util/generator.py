@@ -1,20 +1,50 @@
 import datetime
 import sys
+import re
 from decimal import Decimal
+from functools import lru_cache
 
 integer_types = int
 text_type = str
 binary_type = bytes
 
+_ESCAPES = {
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "'": "&apos;",
+    '"': "&quot;"
+}
+_ESCAPE_REGEX = re.compile("[&<>'\"]")
+
+def _escape_match(match):
+    return _ESCAPES[match.group()]
+
+def _escape(value):
+    if _ESCAPE_REGEX.search(value) is None:
+        return value
+    return _ESCAPE_REGEX.sub(_escape_match, value)
+
+@lru_cache(maxsize=2048)
+def _tags(key):
+    escaped_key = _escape(key)
+    return ("<" + escaped_key + ">", "</" + escaped_key + ">")
+
+@lru_cache(maxsize=2048)
+def _typed_open_tag(key, type):
+    return "<" + key + " type=\"" + type + "\">"
+
 class Generator(object):
     def __init__(self, dict):
         self.dict = dict
 
     def generate(self):
-        return self.__generate_dict(self.dict)
+        xml = []
+        self.__generate_dict(xml, self.dict)
+        return "".join(xml)
 
     def __escape(self, value):
-        return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("'", "&apos;").replace('"', "&quot;")
+        return _escape(value)
 
     def __generate_boolean(self, value):
         return str(value).lower()
@@ -22,43 +52,44 @@ class Generator(object):
     def __generate_datetime(self, value):
         return value.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    def __generate_dict(self, dictionary):
-        xml = ""
+    def __generate_dict(self, xml, dictionary):
         for key, val in dictionary.items():
-            xml += self.__generate_node(key, val)
-        return xml
+            self.__generate_node(xml, key, val)
 
-    def __generate_list(self, list):
-        xml = ""
+    def __generate_list(self, xml, list):
         for item in list:
-            xml += self.__generate_node("item", item)
-        return xml
+            self.__generate_node(xml, "item", item)
 
-    def __generate_node(self, key, value):
-        open_tag = "<" + self.__escape(key) + ">"
-        close_tag = "</" + self.__escape(key) + ">"
+    def __generate_node(self, xml, key, value):
+        open_tag, close_tag = _tags(key)
 
         if isinstance(value, text_type):
-            return open_tag + self.__escape(value).encode('ascii', 'xmlcharrefreplace').decode('utf-8') + close_tag
+            xml.append(open_tag)
+            xml.append(self.__escape(value).encode('ascii', 'xmlcharrefreplace').decode('utf-8'))
         elif isinstance(value, binary_type):
-            return open_tag + self.__escape(value) + close_tag
+            xml.append(open_tag)
+            xml.append(self.__escape(value))
         elif isinstance(value, Decimal):
-            return open_tag + str(value) + close_tag
+            xml.append(open_tag)
+            xml.append(str(value))
         elif isinstance(value, dict):
-            return open_tag + self.__generate_dict(value) + close_tag
+            xml.append(open_tag)
+            self.__generate_dict(xml, value)
         elif isinstance(value, list):
-            open_tag = "<" + key + " type=\"array\">"
-            return open_tag + self.__generate_list(value) + close_tag
+            xml.append(_typed_open_tag(key, "array"))
+            self.__generate_list(xml, value)
         elif isinstance(value, bool):
-            open_tag = "<" + key + " type=\"boolean\">"
-            return open_tag + self.__generate_boolean(value) + close_tag
-        elif isinstance(value, integer_types) and not isinstance(value, bool):
-            open_tag = "<" + key + " type=\"integer\">"
-            return open_tag + str(value) + close_tag
+            xml.append(_typed_open_tag(key, "boolean"))
+            xml.append(self.__generate_boolean(value))
+        elif isinstance(value, integer_types):
+            xml.append(_typed_open_tag(key, "integer"))
+            xml.append(str(value))
         elif isinstance(value, type(None)):
-            return open_tag + close_tag
+            xml.append(open_tag)
         elif isinstance(value, datetime.datetime) or isinstance(value, datetime.date):
-            open_tag = "<" + key + " type=\"datetime\">"
-            return open_tag + self.__generate_datetime(value) + close_tag
+            xml.append(_typed_open_tag(key, "datetime"))
+            xml.append(self.__generate_datetime(value))
         else:
             raise RuntimeError("Unexpected XML node type: " + str(type(value)))
+
+        xml.append(close_tag)
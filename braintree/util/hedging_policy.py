@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from braintree.util.deadline import Deadline
+
+class HedgingPolicy(object):
+    """
+    Sends a second, identical GET request when the first one is slower than usual,
+    and uses its response if the first request fails. ::
+
+        hedging_policy = braintree.util.HedgingPolicy(percentile=0.95, budget=0.05)
+        config = braintree.Configuration(..., hedging_policy=hedging_policy)
+
+    The hedge is sent after ``delay`` seconds if given, otherwise after the observed
+    ``percentile`` latency of recent GETs to the same endpoint family, bounded by
+    ``min_delay`` and ``max_delay``; no hedges are sent until ``min_samples`` latencies
+    have been observed. At most ``budget`` of all GETs are hedged. ``hedged_count``
+    holds the number of hedges sent and ``hedge_wins`` the number whose response was used.
+
+    The first request is sent from the caller's thread, which returns as soon as that
+    request does. Hedges are sent from a pool of at most ``max_workers`` threads, and
+    a pool thread waiting to send one is released as soon as the first request
+    completes.
+    """
+
+    def __init__(self, delay=None, percentile=0.95, min_delay=0.01, max_delay=2.0, budget=0.05,
+                 min_samples=20, window_size=1000, max_workers=16):
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.max_workers = max_workers
+        self.request_count = 0
+        self.hedged_count = 0
+        self.hedge_wins = 0
+        self.__latencies = {}
+        self.__delays = {}
+        self.__sample_counts = {}
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    __not_sent = object()
+
+    def hedge_delay(self, family):
+        """ Returns how long to wait before hedging a request, or None to not hedge it. """
+        if self.delay is not None:
+            return self.delay
+        return self.__delays.get(family)
+
+    def execute(self, family, send, discard=None, before_hedge=None):
+        """
+        Calls ``send``, hedging it if it is slower than :meth:`hedge_delay`. The
+        result of a hedge that is not used is passed to ``discard``, and
+        ``before_hedge``, such as a rate limiter's ``acquire``, is called before
+        the hedge is sent.
+        """
+        with self.__lock:
+            self.request_count += 1
+        delay = self.hedge_delay(family)
+        if delay is None or not self.__may_hedge():
+            return self.__timed(family, send, Deadline.current())
+
+        deadline = Deadline.current()
+        first_done = threading.Event()
+        started_at = time.monotonic()
+        hedge = self.__shared_executor().submit(self.__hedge, family, send, deadline, before_hedge, delay, started_at, first_done)
+        try:
+            result = self.__timed(family, send, deadline)
+        except Exception:
+            first_done.set()
+            if hedge.exception() is not None or hedge.result() is HedgingPolicy.__not_sent:
+                raise
+            with self.__lock:
+                self.hedge_wins += 1
+            return hedge.result()
+        finally:
+            first_done.set()
+        if discard is not None:
+            hedge.add_done_callback(lambda hedge: HedgingPolicy.__discard(hedge, discard))
+        return result
+
+    def record(self, family, latency):
+        with self.__lock:
+            latencies = self.__latencies.get(family)
+            if latencies is None:
+                latencies = self.__latencies[family] = deque(maxlen=self.window_size)
+                self.__sample_counts[family] = 0
+            latencies.append(latency)
+            self.__sample_counts[family] += 1
+
+            count = self.__sample_counts[family]
+            if count == self.min_samples or (count > self.min_samples and count % 50 == 0):
+                ordered = sorted(latencies)
+                observed = ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+                self.__delays[family] = min(self.max_delay, max(self.min_delay, observed))
+
+    def __hedge(self, family, send, deadline, before_hedge, delay, started_at, first_done):
+        if first_done.wait(max(0, started_at + delay - time.monotonic())) or not self.__take_hedge():
+            return HedgingPolicy.__not_sent
+        if before_hedge is not None:
+            before_hedge()
+        return self.__timed(family, send, deadline)
+
+    @staticmethod
+    def __discard(hedge, discard):
+        if hedge.exception() is None and hedge.result() is not HedgingPolicy.__not_sent:
+            discard(hedge.result())
+
+    def __timed(self, family, send, deadline):
+        started_at = time.monotonic()
+        with Deadline.within(deadline):
+            result = send()
+        self.record(family, time.monotonic() - started_at)
+        return result
+
+    def __may_hedge(self):
+        with self.__lock:
+            return self.hedged_count + 1 <= self.budget * self.request_count
+
+    def __take_hedge(self):
+        with self.__lock:
+            if self.hedged_count + 1 > self.budget * self.request_count:
+                return False
+            self.hedged_count += 1
+            return True
+
+    def __shared_executor(self):
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self.__executor
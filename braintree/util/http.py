@@ -1,10 +1,12 @@
 import sys
+import threading
+import time
 import requests
-from base64 import encodebytes
 import json
-import braintree
-from braintree import version
 from braintree.environment import Environment
+from braintree.util.deadline import Deadline
+from braintree.util.request_context import RequestContext
+from braintree.util.response_body import ResponseBody
 from braintree.util.xml_util import XmlUtil
 from braintree.exceptions.authentication_error import AuthenticationError
 from braintree.exceptions.authorization_error import AuthorizationError
@@ -28,10 +30,61 @@ class Http(object):
         Multipart = "multipart/form-data"
         Json = "application/json"
 
+    class _Elements(object):
+        """
+        Yields the elements of a streamed response, raising errors that occur while
+        the rest of the response is read as the strategy's wrapped exceptions, and
+        DeadlineExceededError once the request's deadline has passed.
+        """
+
+        def __init__(self, parser, config, http_strategy, deadline):
+            self.parser = parser
+            self.config = config
+            self.http_strategy = http_strategy
+            self.deadline = deadline
+
+        @property
+        def root(self):
+            return self.parser.root
+
+        def close(self):
+            self.parser.close()
+
+        def __iter__(self):
+            elements = iter(self.parser)
+            while True:
+                try:
+                    element = next(elements)
+                except StopIteration:
+                    return
+                except Exception as e:
+                    if self.config.wrap_http_exceptions:
+                        self.http_strategy.handle_exception(e)
+                    else:
+                        raise
+                if self.deadline is not None:
+                    self.deadline.check()
+                yield element
+
+    VaultPaths = ["/customers", "/payment_methods", "/credit_cards", "/addresses", "/paypal_accounts", "/us_bank_accounts"]
+
     @staticmethod
     def is_error_status(status):
         return status not in [200, 201, 204, 422]
 
+    @staticmethod
+    def endpoint_family(path):
+        if "advanced_search" in path:
+            return "search"
+        elif path.endswith("/graphql"):
+            return "graphql"
+        elif "/transactions" in path:
+            return "transactions"
+        elif any(vault_path in path for vault_path in Http.VaultPaths):
+            return "vault"
+        else:
+            return "other"
+
     @staticmethod
     def raise_exception_from_status(status, message=None):
         if status == 401:
@@ -58,6 +111,13 @@ class Http(object):
     def __init__(self, config, environment=None):
         self.config = config
         self.environment = environment or self.config.environment
+        self.__context = None
+        self.__local = threading.local()
+
+    def context(self):
+        if self.__context is None:
+            self.__context = RequestContext(self.config)
+        return self.__context
 
     def post(self, path, params=None):
         return self._make_request("POST", path, Http.ContentType.Xml, params)
@@ -65,8 +125,8 @@ class Http(object):
     def delete(self, path):
         return self._make_request("DELETE", path, Http.ContentType.Xml)
 
-    def get(self, path):
-        return self._make_request("GET", path, Http.ContentType.Xml)
+    def get(self, path, fields=None):
+        return self._make_request("GET", path, Http.ContentType.Xml, fields=fields)
 
     def put(self, path, params=None):
         return self._make_request("PUT", path, Http.ContentType.Xml, params)
@@ -74,32 +134,121 @@ class Http(object):
     def post_multipart(self, path, files, params=None):
         return self._make_request("POST", path, Http.ContentType.Multipart, params, files)
 
-    def _make_request(self, http_verb, path, content_type, params=None, files=None, header_overrides=None):
+    def post_elements(self, path, params, element_name, fields=None):
+        """
+        Posts like :meth:`post`, but returns a :class:`Parser <braintree.util.parser.Parser>`
+        that yields each ``element_name`` child of the response's root element as it is read.
+        """
+        return self._make_request("POST", path, Http.ContentType.Xml, params, element_name=element_name, fields=fields)
+
+    def _make_request(self, http_verb, path, content_type, params=None, files=None, header_overrides=None, element_name=None, fields=None):
+        single_flight = getattr(self.config, "single_flight", None)
+        if single_flight is None or http_verb != "GET" or element_name is not None:
+            return self.__make_request(http_verb, path, content_type, params, files, header_overrides, element_name, fields)
+
+        deadline = Deadline.current()
+        return single_flight.do(
+            (http_verb, self.__full_path(path), content_type, fields, self.__authorization_digest(header_overrides)),
+            lambda: self.__make_request(http_verb, path, content_type, params, files, header_overrides, element_name, fields),
+            None if deadline is None else deadline.remaining()
+        )
+
+    def __make_request(self, http_verb, path, content_type, params, files, header_overrides, element_name, fields):
         http_strategy = self.config.http_strategy()
         headers = self.__headers(content_type, header_overrides)
         request_body = self.__request_body(content_type, params, files)
         full_path = self.__full_path(path)
 
-        try:
-            status, response_body = http_strategy.http_do(http_verb, full_path, headers, request_body)
-        except Exception as e:
-            if self.config.wrap_http_exceptions:
-                http_strategy.handle_exception(e)
-            else:
+        retry_policy = getattr(self.config, "retry_policy", None)
+        if retry_policy is not None and not retry_policy.is_retryable_request(http_verb, full_path):
+            retry_policy = None
+
+        rate_limiter = getattr(self.config, "rate_limiter", None)
+        circuit_breaker = getattr(self.config, "circuit_breaker", None)
+        hedging_policy = getattr(self.config, "hedging_policy", None) if http_verb == "GET" else None
+        endpoint_family = Http.endpoint_family(full_path)
+        deadline = Deadline.current()
+        parse = lambda response_body: self.__parse(http_strategy, response_body, content_type, element_name, fields, deadline)
+
+        attempt = 1
+        while True:
+            if deadline is not None:
+                deadline.check()
+            if rate_limiter is not None:
+                rate_limiter.acquire(endpoint_family)
+            if circuit_breaker is not None:
+                circuit_breaker.before_request(endpoint_family)
+            started_at = time.monotonic()
+            try:
+                if hedging_policy is not None:
+                    status, response_body, response_headers = hedging_policy.execute(
+                        endpoint_family,
+                        lambda: self.__send(http_strategy, http_verb, full_path, headers, request_body, parse),
+                        discard=lambda response: Http.__discard(response[1]),
+                        before_hedge=None if rate_limiter is None else lambda: rate_limiter.acquire(endpoint_family)
+                    )
+                else:
+                    status, response_body, response_headers = self.__send(http_strategy, http_verb, full_path, headers, request_body, parse)
+            except Exception as e:
+                if circuit_breaker is not None:
+                    circuit_breaker.record(endpoint_family, duration=time.monotonic() - started_at, exception=e)
+                if deadline is not None:
+                    deadline.check()
+                delay = self.__retry_delay(retry_policy, attempt, deadline) if retry_policy and retry_policy.is_retryable_exception(e) else None
+                if delay is not None:
+                    retry_policy.sleep(http_verb, full_path, attempt, delay, e)
+                    attempt += 1
+                    continue
+                if self.config.wrap_http_exceptions:
+                    http_strategy.handle_exception(e)
+                else:
+                    raise
+            except BaseException:
+                if circuit_breaker is not None:
+                    circuit_breaker.release(endpoint_family)
                 raise
 
+            if circuit_breaker is not None:
+                circuit_breaker.record(endpoint_family, status, time.monotonic() - started_at)
+            if rate_limiter is not None:
+                if status == 429:
+                    rate_limiter.throttled(endpoint_family)
+                else:
+                    rate_limiter.succeeded(endpoint_family)
+
+            if retry_policy is not None and retry_policy.is_retryable_status(status):
+                delay = self.__retry_delay(retry_policy, attempt, deadline, response_headers)
+                if delay is not None:
+                    Http.__discard(response_body)
+                    retry_policy.sleep(http_verb, full_path, attempt, delay, status)
+                    attempt += 1
+                    continue
+            break
+
         if Http.is_error_status(status):
+            Http.__discard(response_body)
             Http.raise_exception_from_status(status)
-        else:
-            if len(response_body.strip()) == 0:
-                return {}
-            else:
-                if content_type == Http.ContentType.Json:
-                    return json.loads(response_body)
-                else:
-                    return XmlUtil.dict_from_xml(response_body)
+        return response_body
 
     def http_do(self, http_verb, path, headers, request_body):
+        response = self.__send_request(http_verb, path, headers, request_body, stream=False)
+        return [response.status_code, response.text]
+
+    def http_do_stream(self, http_verb, path, headers, request_body):
+        """
+        Like :meth:`http_do`, but returns the body as a :class:`ResponseBody
+        <braintree.util.response_body.ResponseBody>` that is decompressed and parsed
+        as it is read from the connection.
+
+        A subclass that overrides :meth:`http_do` keeps being called through it,
+        with the body read up front.
+        """
+        if type(self).http_do is not Http.http_do:
+            return self.http_do(http_verb, path, headers, request_body)
+        response = self.__send_request(http_verb, path, headers, request_body, stream=True)
+        return [response.status_code, ResponseBody(response)]
+
+    def __send_request(self, http_verb, path, headers, request_body, stream):
         data = request_body
         files = None
         full_path = self.__full_path(path)
@@ -113,28 +262,52 @@ class Http(object):
         else:
           verify = self.environment.ssl_certificate
 
-        with requests.Session() as session:
-            request = requests.Request(
-                method=http_verb,
-                url=full_path,
-                headers=headers,
-                data=data,
-                files=files)
-            prepared_request = request.prepare()
-            prepared_request.url = full_path
+        request = requests.Request(
+            method=http_verb,
+            url=full_path,
+            headers=headers,
+            data=data,
+            files=files)
+        prepared_request = request.prepare()
+        prepared_request.url = full_path
 
-            response = session.send(prepared_request,
-                verify=verify,
-                timeout=self.config.timeout)
+        response = self.config.connection_pool().send(prepared_request,
+            verify=verify,
+            timeout=self.timeout(),
+            stream=stream)
 
-        return [response.status_code, response.text]
+        self.__local.response_headers = response.headers
+        return response
+
+    def timeout(self):
+        """
+        Returns the timeout for a request sent now: ``(connect_timeout, read_timeout)``
+        from the configuration, each capped to the time left before the active
+        :class:`Deadline <braintree.util.deadline.Deadline>`.
+        """
+        connect_timeout = getattr(self.config, "connect_timeout", None) or self.config.timeout
+        read_timeout = getattr(self.config, "read_timeout", None) or self.config.timeout
+
+        deadline = Deadline.current()
+        if deadline is not None:
+            remaining = max(0.001, deadline.remaining())
+            connect_timeout = remaining if connect_timeout is None else min(connect_timeout, remaining)
+            read_timeout = remaining if read_timeout is None else min(read_timeout, remaining)
+
+        if connect_timeout == read_timeout:
+            return read_timeout
+        return (connect_timeout, read_timeout)
+
+    def response_headers(self):
+        """ Returns the headers of the last response received by this thread. """
+        return getattr(self.__local, "response_headers", {})
 
     def handle_exception(self, exception):
         if isinstance(exception, requests.exceptions.ReadTimeout):
             raise ReadTimeoutError(exception)
         elif isinstance(exception, requests.exceptions.ConnectTimeout):
             raise ConnectTimeoutError(exception)
-        elif isinstance(exception, requests.exceptions.ConnectionError):
+        elif isinstance(exception, (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError)):
             raise ConnectionError(exception)
         elif isinstance(exception, requests.exceptions.HTTPError):
             raise InvalidResponseError(exception)
@@ -143,38 +316,75 @@ class Http(object):
         else:
             raise UnexpectedError(exception)
 
-    def __authorization_header(self):
-        if self.config.has_client_credentials():
-            return b"Basic " + encodebytes(
-                        self.config.client_id.encode('ascii') +
-                        b":" +
-                        self.config.client_secret.encode('ascii')
-                    ).replace(b"\n", b"").strip()
-        elif self.config.has_access_token():
-            return b"Bearer " + self.config.access_token.encode('ascii')
-        else:
-            return b"Basic " + encodebytes(
-                        self.config.public_key.encode('ascii') +
-                        b":" +
-                        self.config.private_key.encode('ascii')
-                    ).replace(b"\n", b"").strip()
+    def __authorization_digest(self, header_overrides):
+        # requests made with different credentials must not share a response
+        authorization = (header_overrides or {}).get("Authorization")
+        if authorization is None:
+            return self.context().authorization_digest
+        return RequestContext.digest(authorization)
 
     def __headers(self, content_type, header_overrides=None):
-        headers = {
-            "Accept": "application/xml",
-            "Authorization": self.__authorization_header(),
-            "User-Agent": "Braintree Python " + version.Version,
-            "Accept-Encoding": "gzip",
-            "X-ApiVersion": braintree.configuration.Configuration.api_version()
-        }
-
         if content_type == Http.ContentType.Xml:
-            headers["Content-type"] = Http.ContentType.Xml
+            headers = self.context().xml_headers
+        else:
+            headers = self.context().headers
 
-        headers.update(header_overrides or {})
+        if header_overrides:
+            headers = dict(headers, **header_overrides)
+        else:
+            headers = headers.copy()
 
         return headers
 
+    def __send(self, http_strategy, http_verb, full_path, headers, request_body, parse):
+        http_do = getattr(http_strategy, "http_do_stream", None) or http_strategy.http_do
+        status, response_body = http_do(http_verb, full_path, headers, request_body)
+        response_headers = self.__response_headers(http_strategy)
+        if Http.is_error_status(status):
+            return status, response_body, response_headers
+
+        # the body is read here, so errors reading it are retried and counted like errors sending the request
+        try:
+            return status, parse(response_body), response_headers
+        except BaseException:
+            Http.__discard(response_body)
+            raise
+
+    def __parse(self, http_strategy, response_body, content_type, element_name, fields, deadline):
+        if element_name is not None:
+            return Http._Elements(XmlUtil.elements_from_xml(response_body, element_name, fields), self.config, http_strategy, deadline)
+        elif isinstance(response_body, ResponseBody):
+            if response_body.is_blank():
+                response_body.close()
+                return {}
+            elif content_type == Http.ContentType.Json:
+                return json.loads(response_body.read().decode("utf-8"))
+            else:
+                return XmlUtil.dict_from_xml(response_body, fields)
+        else:
+            if len(response_body.strip()) == 0:
+                return {}
+            else:
+                if content_type == Http.ContentType.Json:
+                    return json.loads(response_body)
+                else:
+                    return XmlUtil.dict_from_xml(response_body, fields)
+
+    @staticmethod
+    def __discard(response_body):
+        if isinstance(response_body, ResponseBody):
+            response_body.close()
+
+    def __retry_delay(self, retry_policy, attempt, deadline, response_headers=None):
+        delay = retry_policy.delay(attempt, response_headers)
+        if delay is not None and deadline is not None and delay >= deadline.remaining():
+            return None
+        return delay
+
+    def __response_headers(self, http_strategy):
+        response_headers = getattr(http_strategy, "response_headers", None)
+        return response_headers() if callable(response_headers) else None
+
     def __request_body(self, content_type, params, files):
         if content_type == Http.ContentType.Xml:
             request_body = XmlUtil.xml_from_dict(params) if params else ''
@@ -185,5 +395,6 @@ class Http(object):
             return (params, files)
 
     def __full_path(self, path):
-        return path if path.startswith(self.config.base_url()) or path.startswith(self.config.graphql_base_url()) else (self.config.base_url() + path)
+        base_url = self.context().base_url
+        return path if path.startswith(base_url) or path.startswith(self.config.graphql_base_url()) else (base_url + path)
 
@@ -0,0 +1,67 @@
+from braintree.exceptions.not_found_error import NotFoundError
+from braintree.util.vault_cache import VaultCache
+
+class NotFoundCache(object):
+    """
+    Remembers ids that were recently not found, so repeated lookups of unknown ids
+    raise NotFoundError without a request. ::
+
+        not_found_cache = braintree.util.NotFoundCache(max_size=10000, ttl=10)
+        gateway = braintree.BraintreeGateway(braintree.Configuration(..., not_found_cache=not_found_cache))
+
+    ``transaction.find``, ``customer.find`` and ``payment_method.find`` consult it.
+    An id is remembered for ``ttl`` seconds, up to ``max_size`` ids, and is
+    forgotten as soon as the gateway creates a transaction, customer or payment
+    method with that id or token. ``stats()`` counts rejected lookups as hits.
+    """
+
+    def __init__(self, max_size=10000, ttl=10):
+        self.__ids = VaultCache(max_size=max_size, ttl=ttl)
+
+    def contains(self, key):
+        return self.__ids.get(key) is not None
+
+    def add(self, key):
+        self.__ids.set(key, True)
+
+    def discard(self, key):
+        self.__ids.delete(key)
+
+    def clear(self):
+        self.__ids.clear()
+
+    def stats(self):
+        return self.__ids.stats()
+
+    @staticmethod
+    def read_through(config, key, load):
+        """
+        Raises NotFoundError if ``key`` was recently not found in ``config.not_found_cache``,
+        and otherwise returns the result of ``load``, remembering ``key`` if it raises
+        NotFoundError.
+        """
+        cache = getattr(config, "not_found_cache", None)
+        if cache is None:
+            return load()
+
+        key = NotFoundCache.__scoped_key(config, key)
+        if cache.contains(key):
+            raise NotFoundError()
+        try:
+            return load()
+        except NotFoundError:
+            cache.add(key)
+            raise
+
+    @staticmethod
+    def forget(config, kind, *ids):
+        """ Forgets that the ``kind`` resources with ``ids`` were not found; None ids are skipped. """
+        cache = getattr(config, "not_found_cache", None)
+        if cache is not None:
+            for id in ids:
+                if id is not None:
+                    cache.discard(NotFoundCache.__scoped_key(config, kind + "/" + id))
+
+    @staticmethod
+    def __scoped_key(config, key):
+        return str(config.merchant_id) + "/" + key
@@ -1,30 +1,205 @@
-from xml.dom import minidom
-from datetime import datetime
-from braintree.util.datetime_parser import parse_datetime
-import re
 import sys
-
-binary_type = bytes
+from xml.parsers import expat
+from braintree.util.datetime_parser import parse_date, parse_datetime
 
 class Parser(object):
-    def __init__(self, xml):
-        if isinstance(xml, binary_type):
-            xml = xml.decode('utf-8')
-        self.doc = minidom.parseString("><".join(re.split(r">\s+<", xml)).strip())
+    """
+    Converts a gateway XML document into nested dicts and lists.
+
+    The document is parsed in a single streaming pass with expat, so no DOM
+    is built and ``bytes`` responses are parsed without being decoded first.
+    The document may also be an iterable of ``bytes`` chunks, such as a
+    :class:`ResponseBody <braintree.util.response_body.ResponseBody>`, which is
+    parsed as the chunks arrive. Whitespace between tags is ignored.
+
+    Iterating over a Parser created with an ``element_name`` instead yields the
+    value of each such child of the root element as soon as it closes, without
+    keeping it in the document, and sets ``root`` to the name of the root element::
+
+        parser = Parser(response_body, "transaction")
+        for attributes in parser:
+            ...
+
+    With ``fields``, only the listed children of the resource (the root element, or
+    each ``element_name`` element) are kept; other subtrees are skipped as they are
+    read, without being converted.
+
+    Tag names, and the text of the low-cardinality fields in ``InternedFields``, are
+    interned in tables shared by every Parser, so a value repeated across a page of
+    results is held once. :meth:`intern_values` seeds the value table with known
+    constants, such as ``Transaction.Status``, so parsed values are those constants.
+    """
+
+    InternedFields = frozenset([
+        "card_type", "currency_iso_code", "escrow_status", "gateway_rejection_reason", "kind",
+        "merchant_account_id", "payment_instrument_type", "processor_response_code",
+        "processor_response_type", "status", "type"
+    ])
+
+    _MAX_INTERNED_VALUES = 10000
+    _interned_values = {}
+    _tag_names = {}
+    _underscored_names = {}
+
+    class _Node(object):
+        __slots__ = ("name", "type", "nil", "first_child", "text", "value")
+
+        def __init__(self, name, type, nil):
+            self.name = name
+            self.type = type
+            self.nil = nil
+            self.first_child = None
+            self.text = None
+            self.value = [] if type == "array" else None
+
+    _TEXT = "text"
+    _ELEMENT = "element"
+
+    def __init__(self, xml, element_name=None, fields=None):
+        self.xml = xml
+        self.element_name = element_name
+        self.fields = None if fields is None else frozenset(fields)
+        self.root = None
+        self.__fields_depth = 1 if element_name is None else 2
+
+    @staticmethod
+    def intern_values(values):
+        for value in values:
+            if isinstance(value, str):
+                Parser._interned_values.setdefault(value, value)
+
+    def close(self):
+        """ Closes the document if it is being read from a connection, such as a ResponseBody. """
+        close = getattr(self.xml, "close", None)
+        if close is not None:
+            close()
 
     def parse(self):
-        return {self.__underscored(self.doc.documentElement.tagName): self.__parse_node(self.doc.documentElement)}
-
-    def __parse_node(self, root):
-        child = root.firstChild
-        if self.__get_node_attribute(root, "type") == "array":
-            return self.__build_list(child)
-        elif not child:
-            return self.__node_content(root, None)
-        elif (child.nodeType == minidom.Node.TEXT_NODE):
-            return self.__node_content(root, child.nodeValue)
+        parser = self.__create_parser()
+        for chunk in self.__chunks():
+            parser.Parse(chunk, False)
+        parser.Parse(b"", True)
+
+        return self.__result
+
+    def __iter__(self):
+        parser = self.__create_parser()
+        elements = self.__elements
+        started = False
+        for chunk in self.__chunks():
+            started = True
+            parser.Parse(chunk, False)
+            if elements:
+                for element in elements:
+                    yield element
+                del elements[:]
+
+        if started:
+            parser.Parse(b"", True)
+            for element in elements:
+                yield element
+            del elements[:]
+
+    def __create_parser(self):
+        self.__stack = []
+        self.__text = []
+        self.__elements = []
+        self.__result = None
+        self.__skipped_depth = 0
+
+        parser = expat.ParserCreate(intern=Parser._tag_names)
+        parser.buffer_text = True
+        parser.StartElementHandler = self.__start_element
+        parser.EndElementHandler = self.__end_element
+        parser.CharacterDataHandler = self.__text.append
+        return parser
+
+    def __chunks(self):
+        if isinstance(self.xml, (str, bytes)):
+            xml = self.xml.strip()
+            if xml:
+                yield xml
         else:
-            return self.__build_dict(child)
+            started = False
+            for chunk in self.xml:
+                if not started:
+                    chunk = chunk.lstrip()
+                    started = len(chunk) > 0
+                if chunk:
+                    yield chunk
+
+    def __start_element(self, name, attributes):
+        if self.__skipped_depth:
+            self.__skipped_depth += 1
+            return
+        stack = self.__stack
+        if self.__text:
+            self.__flush_text()
+        if not stack:
+            self.root = self.__underscored(name)
+        elif stack[-1].first_child is None:
+            stack[-1].first_child = Parser._ELEMENT
+
+        name = self.__underscored(name)
+        if self.fields is not None and len(stack) == self.__fields_depth and name not in self.fields:
+            self.__skipped_depth = 1
+        else:
+            stack.append(Parser._Node(name, attributes.get("type"), attributes.get("nil")))
+
+    def __end_element(self, name):
+        if self.__skipped_depth:
+            self.__skipped_depth -= 1
+            del self.__text[:]
+            return
+        if self.__text:
+            self.__flush_text()
+        node = self.__stack.pop()
+        value = self.__node_value(node)
+        if node.name in Parser.InternedFields and isinstance(value, str):
+            value = self.__intern_value(value)
+
+        if not self.__stack:
+            self.__result = {node.name: value}
+        elif len(self.__stack) == 1 and node.name == self.element_name:
+            self.__elements.append(value)
+        else:
+            self.__add_to_parent(self.__stack[-1], node, value)
+
+    def __flush_text(self):
+        text = "".join(self.__text)
+        del self.__text[:]
+        if self.__stack and not text.isspace():
+            node = self.__stack[-1]
+            if node.first_child is None:
+                node.first_child = Parser._TEXT
+                node.text = text
+
+    def __add_to_parent(self, parent, node, value):
+        if parent.type == "array":
+            parent.value.append(value)
+        elif parent.first_child is Parser._ELEMENT:
+            if parent.value is None:
+                parent.value = {}
+            d = parent.value
+            if node.type == "array" or node.first_child is Parser._TEXT:
+                d[node.name] = value
+            elif not d.get(node.name):
+                d[node.name] = value
+            else:
+                self.__convert_to_list(d, node.name)
+                d[node.name].append(value)
+
+    def __node_value(self, node):
+        if node.type == "array":
+            return node.value
+        elif node.first_child is None:
+            return self.__node_content(node, None)
+        elif node.first_child is Parser._TEXT:
+            return self.__node_content(node, node.text)
+        elif node.value is None:
+            return {}
+        else:
+            return node.value
 
     def __convert_to_boolean(self, value):
         if value == "true" or value == "1":
@@ -33,7 +208,7 @@ class Parser(object):
             return False
 
     def __convert_to_date(self, value):
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        return parse_date(value)
 
     def __convert_to_datetime(self, value):
         return parse_datetime(value)
@@ -43,51 +218,30 @@ class Parser(object):
         if not isinstance(val, list):
             dict[key] = [val]
 
-    def __build_list(self, child):
-        l = []
-        while child is not None:
-            if (child.nodeType == minidom.Node.ELEMENT_NODE):
-                l.append(self.__parse_node(child))
-            child = child.nextSibling
-        return l
-
-    def __build_dict(self, child):
-        d = {}
-        while child is not None:
-            if (child.nodeType == minidom.Node.ELEMENT_NODE):
-                child_tag = self.__underscored(child.tagName)
-                if self.__get_node_attribute(child, "type") == "array" or child.firstChild and child.firstChild.nodeType == minidom.Node.TEXT_NODE:
-                    d[child_tag] = self.__parse_node(child)
-                else:
-                    if not d.get(child_tag):
-                        d[child_tag] = self.__parse_node(child)
-                    else:
-                        self.__convert_to_list(d, child_tag)
-                        d[child_tag].append(self.__parse_node(child))
-
-            child = child.nextSibling
-        return d
-
-    def __get_node_attribute(self, node, attribute):
-        attribute_node = node.attributes.get(attribute)
-        return attribute_node and attribute_node.value
-
-    def __node_content(self, parent, content):
-        parent_type = self.__get_node_attribute(parent, "type")
-        parent_nil = self.__get_node_attribute(parent, "nil")
-
-        if parent_type == "integer":
+    def __node_content(self, node, content):
+        if node.type == "integer":
             return int(content)
-        elif parent_type == "boolean":
+        elif node.type == "boolean":
             return self.__convert_to_boolean(content)
-        elif parent_type == "datetime":
+        elif node.type == "datetime":
             return self.__convert_to_datetime(content)
-        elif parent_type == "date":
+        elif node.type == "date":
             return self.__convert_to_date(content)
-        elif parent_nil == "true":
+        elif node.nil == "true":
             return None
         else:
             return content or ""
 
+    def __intern_value(self, value):
+        interned = Parser._interned_values.get(value)
+        if interned is None:
+            if len(Parser._interned_values) >= Parser._MAX_INTERNED_VALUES:
+                return value
+            interned = Parser._interned_values.setdefault(value, value)
+        return interned
+
     def __underscored(self, string):
-        return string.replace("-", "_")
+        name = Parser._underscored_names.get(string)
+        if name is None:
+            name = Parser._underscored_names.setdefault(string, sys.intern(string.replace("-", "_")))
+        return name
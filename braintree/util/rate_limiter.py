@@ -0,0 +1,98 @@
+import threading
+import time
+
+from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.exceptions.too_many_requests_error import TooManyRequestsError
+
+class RateLimiter(object):
+    """
+    A client-side token bucket limiter, shared by every thread and gateway that
+    uses the Configuration it is attached to. ::
+
+        rate_limiter = braintree.util.RateLimiter(rate=20, rates={"search": 5})
+        config = braintree.Configuration(..., rate_limiter=rate_limiter)
+
+    Each endpoint family returned by :meth:`Http.endpoint_family <braintree.util.http.Http.endpoint_family>`
+    (``"transactions"``, ``"search"``, ``"vault"``, ``"graphql"`` or ``"other"``) has its own
+    budget of ``rates.get(family, rate)`` requests per second with bursts of up to ``burst``
+    requests; a family with a rate of None is not limited. When the budget is exhausted a
+    request waits for a token, or raises TooManyRequestsError if ``block`` is False or the
+    wait would exceed ``max_wait`` seconds.
+
+    A 429 from the gateway halves the family's rate (down to ``min_rate``, or the configured
+    rate if that is lower); each successful request then restores ``recovery`` of the
+    configured rate. Rates must be positive.
+    """
+
+    class _Bucket(object):
+        def __init__(self, rate, burst):
+            self.configured_rate = rate
+            self.rate = rate
+            self.burst = burst or max(1.0, rate)
+            self.tokens = self.burst
+            self.updated_at = time.monotonic()
+            self.lock = threading.Lock()
+
+        def refill(self, now):
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def __init__(self, rate=None, rates=None, burst=None, block=True, max_wait=None, min_rate=0.5, recovery=0.05):
+        for family, family_rate in [(None, rate)] + sorted((rates or {}).items()):
+            if family_rate is not None and family_rate <= 0:
+                raise ConfigurationError("rate" + ("" if family is None else " for " + family) + " must be positive, not " + repr(family_rate))
+        self.rate = rate
+        self.rates = rates or {}
+        self.burst = burst
+        self.block = block
+        self.max_wait = max_wait
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    def acquire(self, family):
+        bucket = self.__bucket(family)
+        if bucket is None:
+            return
+
+        waited = 0.0
+        while True:
+            with bucket.lock:
+                bucket.refill(time.monotonic())
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                wait = (1 - bucket.tokens) / bucket.rate
+
+            if not self.block or (self.max_wait is not None and waited + wait > self.max_wait):
+                raise TooManyRequestsError("client-side rate limit exceeded for " + family + " requests")
+            time.sleep(wait)
+            waited += wait
+
+    def throttled(self, family):
+        bucket = self.__bucket(family)
+        if bucket is not None:
+            with bucket.lock:
+                bucket.rate = max(min(self.min_rate, bucket.configured_rate), bucket.rate / 2)
+                bucket.tokens = min(bucket.tokens, 0)
+
+    def succeeded(self, family):
+        bucket = self.__bucket(family)
+        if bucket is not None and bucket.rate < bucket.configured_rate:
+            with bucket.lock:
+                bucket.rate = min(bucket.configured_rate, bucket.rate + bucket.configured_rate * self.recovery)
+
+    def current_rate(self, family):
+        bucket = self.__bucket(family)
+        return bucket and bucket.rate
+
+    def __bucket(self, family):
+        bucket = self.__buckets.get(family)
+        if bucket is None:
+            rate = self.rates.get(family, self.rate)
+            if rate is None:
+                return None
+            with self.__lock:
+                bucket = self.__buckets.setdefault(family, RateLimiter._Bucket(rate, self.burst))
+        return bucket
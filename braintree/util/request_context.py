@@ -0,0 +1,52 @@
+import hashlib
+from base64 import encodebytes
+import braintree
+from braintree import version
+
+class RequestContext(object):
+    """
+    The parts of a gateway request that only depend on the configuration:
+    the ``Authorization`` header, the default headers and the base url.
+
+    It is computed once per :class:`Http <braintree.util.http.Http>` and
+    shared by every request made through it, so it must be treated as
+    immutable.
+    """
+
+    def __init__(self, config):
+        self.authorization = RequestContext.authorization_header(config)
+        self.authorization_digest = RequestContext.digest(self.authorization)
+        self.base_url = config.base_url()
+        self.headers = {
+            "Accept": "application/xml",
+            "Authorization": self.authorization,
+            "User-Agent": "Braintree Python " + version.Version,
+            "Accept-Encoding": "gzip",
+            "X-ApiVersion": braintree.configuration.Configuration.api_version()
+        }
+        self.xml_headers = self.headers.copy()
+        self.xml_headers["Content-type"] = "application/xml"
+
+    @staticmethod
+    def digest(authorization):
+        """ Returns a digest that identifies the credentials in an ``Authorization`` header without holding them. """
+        if isinstance(authorization, str):
+            authorization = authorization.encode("utf-8")
+        return hashlib.sha256(authorization).hexdigest()
+
+    @staticmethod
+    def authorization_header(config):
+        if config.has_client_credentials():
+            return b"Basic " + encodebytes(
+                        config.client_id.encode('ascii') +
+                        b":" +
+                        config.client_secret.encode('ascii')
+                    ).replace(b"\n", b"").strip()
+        elif config.has_access_token():
+            return b"Bearer " + config.access_token.encode('ascii')
+        else:
+            return b"Basic " + encodebytes(
+                        config.public_key.encode('ascii') +
+                        b":" +
+                        config.private_key.encode('ascii')
+                    ).replace(b"\n", b"").strip()
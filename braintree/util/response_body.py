@@ -0,0 +1,38 @@
+class ResponseBody(object):
+    """
+    A gateway response body that is read incrementally, as decompressed chunks of
+    bytes, instead of being decoded into one string up front.
+
+    Iterating over the body yields its chunks and releases the connection back to
+    the pool once the body has been consumed. :meth:`close` discards an unread body.
+    """
+
+    def __init__(self, response, chunk_size=65536):
+        self.__response = response
+        self.__chunks = iter(response.iter_content(chunk_size))
+        self.__head = b""
+
+    def is_blank(self):
+        """ Returns True if the body holds nothing but whitespace. """
+        while not self.__head.strip():
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                return True
+            self.__head += chunk
+        return False
+
+    def read(self):
+        return b"".join(self)
+
+    def close(self):
+        self.__response.close()
+
+    def __iter__(self):
+        try:
+            if self.__head:
+                head, self.__head = self.__head, b""
+                yield head
+            for chunk in self.__chunks:
+                yield chunk
+        finally:
+            self.close()
@@ -0,0 +1,85 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from braintree.exceptions.http.connection_error import ConnectionError
+
+class RetryPolicy(object):
+    """
+    Retries requests that fail with a throttling or availability status, or that
+    cannot connect, using exponential backoff with full jitter. ::
+
+        retry_policy = braintree.util.RetryPolicy(max_attempts=4, backoff_base=0.2, backoff_cap=5)
+        gateway = braintree.BraintreeGateway(braintree.Configuration(..., retry_policy=retry_policy))
+
+    By default only GET, HEAD, DELETE and OPTIONS requests and searches are retried.
+    PUTs such as ``submit_for_settlement`` and ``void`` change state, so set
+    ``retry_unsafe_requests`` to also retry them and other POSTs. A ``Retry-After`` header
+    is honored when it asks for no more than ``max_retry_after`` seconds.
+    ``retry_count`` holds the number of retries made so far, and ``on_retry`` is
+    called with ``(http_verb, path, attempt, delay, reason)`` before each retry.
+    """
+
+    IdempotentVerbs = ["GET", "HEAD", "DELETE", "OPTIONS"]
+    RetryableStatuses = [429, 503, 504]
+
+    def __init__(self, max_attempts=3, backoff_base=0.1, backoff_cap=5.0, retry_statuses=None,
+                 retry_unsafe_requests=False, respect_retry_after=True, max_retry_after=30, on_retry=None):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = retry_statuses or RetryPolicy.RetryableStatuses
+        self.retry_unsafe_requests = retry_unsafe_requests
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.on_retry = on_retry
+        self.retry_count = 0
+        self.__lock = threading.Lock()
+
+    def is_retryable_request(self, http_verb, path):
+        return self.retry_unsafe_requests or http_verb in RetryPolicy.IdempotentVerbs or "advanced_search" in path
+
+    def is_retryable_status(self, status):
+        return status in self.retry_statuses
+
+    def is_retryable_exception(self, exception):
+        return isinstance(exception, (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError, ConnectionError))
+
+    def delay(self, attempt, response_headers=None):
+        """
+        Returns the number of seconds to wait before retrying after ``attempt``
+        failed attempts, or None if the request should not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        backoff = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1))))
+        retry_after = self.__retry_after(response_headers) if self.respect_retry_after else None
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            backoff = max(backoff, retry_after)
+        return backoff
+
+    def sleep(self, http_verb, path, attempt, delay, reason):
+        with self.__lock:
+            self.retry_count += 1
+        if self.on_retry is not None:
+            self.on_retry(http_verb, path, attempt, delay, reason)
+        time.sleep(delay)
+
+    def __retry_after(self, response_headers):
+        value = (response_headers or {}).get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,177 @@
+import mmap
+import os
+import pickle
+import stat
+import struct
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.util.catalog_cache import CatalogCache
+
+
+class SharedCatalogCache(CatalogCache):
+    """
+    A :class:`CatalogCache <braintree.util.catalog_cache.CatalogCache>` shared by every
+    process on a host, such as pre-fork web server workers. ::
+
+        catalog_cache = braintree.util.SharedCatalogCache("/var/run/myapp/braintree-catalog", ttl=300)
+        gateway = braintree.BraintreeGateway(braintree.Configuration(..., catalog_cache=catalog_cache))
+
+    Each catalog's parsed response attributes are pickled into a snapshot at
+    ``path``, which each process memory-maps and only maps again after another
+    process has replaced it. A process unpickles a catalog from the mapping when it
+    first uses it, builds the catalog's resources and drops the attributes, so the
+    snapshot itself stays in the page cache shared by every process. Loads, refreshes
+    and invalidations hold an exclusive lock on ``path + ".lock"``, and a process that
+    waited for the lock uses the catalog the previous holder loaded, so each catalog
+    is fetched once per host per ``ttl``. The snapshot is written with 0600
+    permissions and is only read if it belongs to the current user and no one else
+    can write to it.
+
+    Requires ``fcntl``, which is not available on Windows.
+    """
+
+    # the snapshot starts with the length of its pickled index, which maps each
+    # catalog to when it was loaded and where its pickled records are
+    _Header = struct.Struct(">Q")
+
+    def __init__(self, path, ttl=300, stale_ttl=3600, refresh_in_background=True):
+        if fcntl is None:
+            raise ConfigurationError("SharedCatalogCache requires fcntl, which is not available on this platform")
+        super(SharedCatalogCache, self).__init__(ttl, stale_ttl, refresh_in_background)
+        self.path = path
+        self.__identity = None
+        self.__mapping = None
+        self.__index = {}
+        self.__entries = {}
+        self.__lock = threading.Lock()
+
+    def invalidate(self, name=None):
+        with self.__file_lock():
+            catalogs = self.__catalogs()
+            for key in list(catalogs):
+                if name is None or key[1] == name:
+                    del catalogs[key]
+            self.__write(catalogs)
+
+    def _now(self):
+        return time.time()
+
+    def _cached_entry(self, key, build):
+        self.__read()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None and key in self.__index:
+                loaded_at, start, end = self.__index[key]
+                records = pickle.loads(self.__mapping[start:end])
+                entry = CatalogCache._Entry([build(attributes) for attributes in records], loaded_at)
+                self.__entries[key] = entry
+            return entry
+
+    def _load(self, key, load, build):
+        with self.__file_lock():
+            # another process may have loaded the catalog while this one waited
+            entry = self._cached_entry(key, build)
+            if entry is not None and self._now() - entry.loaded_at < self.ttl:
+                return entry
+
+            records = list(load())
+            catalogs = self.__catalogs()
+            catalogs[key] = (self._now(), pickle.dumps(records, pickle.HIGHEST_PROTOCOL))
+            self.__write(catalogs)
+        return self._cached_entry(key, build)
+
+    def __catalogs(self):
+        """ Returns each catalog's load time and pickled records, without unpickling them. """
+        self.__read()
+        with self.__lock:
+            return dict(
+                (key, (loaded_at, self.__mapping[start:end]))
+                for key, (loaded_at, start, end) in self.__index.items()
+            )
+
+    def __read(self):
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return self.__replace(None, None, {})
+        if self.__identity == self.__identity_of(current):
+            return
+
+        with open(self.path, "rb") as f:
+            current = os.fstat(f.fileno())
+            if current.st_uid != os.getuid() or current.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                raise ConfigurationError("catalog cache " + repr(self.path) + " must be owned by this user and writable only by it")
+            if current.st_size == 0:
+                return self.__replace(self.__identity_of(current), None, {})
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = SharedCatalogCache._Header.size
+        index_end = header_end + SharedCatalogCache._Header.unpack(mapping[:header_end])[0]
+        index = pickle.loads(mapping[header_end:index_end])
+        index = dict((key, (loaded_at, index_end + start, index_end + end)) for key, (loaded_at, start, end) in index.items())
+        self.__replace(self.__identity_of(current), mapping, index)
+
+    def __replace(self, identity, mapping, index):
+        with self.__lock:
+            if identity == self.__identity:
+                if mapping is not None:
+                    mapping.close()
+                return
+            if self.__mapping is not None:
+                self.__mapping.close()
+            self.__identity = identity
+            self.__mapping = mapping
+            self.__index = index
+            self.__entries = {}
+
+    def __write(self, catalogs):
+        index = {}
+        offset = 0
+        for key, (loaded_at, records) in catalogs.items():
+            index[key] = (loaded_at, offset, offset + len(records))
+            offset += len(records)
+        pickled_index = pickle.dumps(index, pickle.HIGHEST_PROTOCOL)
+
+        fd, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(SharedCatalogCache._Header.pack(len(pickled_index)))
+                f.write(pickled_index)
+                for _, records in catalogs.values():
+                    f.write(records)
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        self.__read()
+
+    def __file_lock(self):
+        return _FileLock(self.path + ".lock")
+
+    @staticmethod
+    def __identity_of(file_stat):
+        return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+class _FileLock(object):
+    def __init__(self, path):
+        self.path = path
+        self.fd = None
+
+    def __enter__(self):
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        os.close(self.fd)
+        self.fd = None
@@ -0,0 +1,122 @@
+import asyncio
+import copy
+import threading
+
+from braintree.exceptions.http.timeout_error import DeadlineExceededError
+
+class SingleFlight(object):
+    """
+    Coalesces identical read requests that are in flight at the same time, so that
+    one request is sent and every caller receives its result. ::
+
+        single_flight = braintree.util.SingleFlight()
+        gateway = braintree.BraintreeGateway(braintree.Configuration(..., single_flight=single_flight))
+
+    GET requests made through :class:`Http <braintree.util.http.Http>` and
+    :class:`AsyncHttp <braintree.util.async_http.AsyncHttp>` are keyed by verb,
+    path, the fields being parsed and a digest of the credentials they are sent with. The first caller sends the request; callers
+    with the same key that arrive before it completes wait for it, and receive a
+    deep copy of its parsed response or the exception it raised. A waiter gives up
+    with DeadlineExceededError when its own :class:`Deadline
+    <braintree.util.deadline.Deadline>` passes. If the coroutine sending a request is
+    cancelled, one of its waiters sends the request instead. ``coalesced_count``
+    holds the number of requests that were not sent because an identical one was in
+    flight.
+    """
+
+    class _Abandoned(Exception):
+        """ Raised to the waiters of a call whose caller was cancelled, so one of them sends it instead. """
+
+    class _Call(object):
+        def __init__(self):
+            self.done = threading.Event()
+            self.waiters = 0
+            self.result = None
+            self.exception = None
+
+    def __init__(self):
+        self.coalesced_count = 0
+        self.__calls = {}
+        self.__futures = {}
+        self.__lock = threading.Lock()
+
+    def do(self, key, fn, timeout=None):
+        with self.__lock:
+            call = self.__calls.get(key)
+            if call is None:
+                call = SingleFlight._Call()
+                self.__calls[key] = call
+                leader = True
+            else:
+                call.waiters += 1
+                self.coalesced_count += 1
+                leader = False
+
+        if leader:
+            try:
+                result = fn()
+            except BaseException as e:
+                call.exception = e
+                raise
+            else:
+                # waiters copy from a snapshot taken before the caller can modify the result
+                with self.__lock:
+                    del self.__calls[key]
+                    if call.waiters:
+                        call.result = copy.deepcopy(result)
+                return result
+            finally:
+                with self.__lock:
+                    if self.__calls.get(key) is call:
+                        del self.__calls[key]
+                call.done.set()
+
+        if not call.done.wait(timeout):
+            raise DeadlineExceededError("deadline exceeded while waiting for an identical request")
+        if call.exception is not None:
+            raise call.exception
+        return copy.deepcopy(call.result)
+
+    async def do_async(self, key, fn, timeout=None):
+        loop = asyncio.get_event_loop()
+        with self.__lock:
+            flight = self.__futures.get((loop, key))
+            if flight is None:
+                flight = [loop.create_future(), 0]
+                self.__futures[(loop, key)] = flight
+                leader = True
+            else:
+                flight[1] += 1
+                self.coalesced_count += 1
+                leader = False
+
+        future = flight[0]
+        if leader:
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                future.set_exception(SingleFlight._Abandoned())
+                future.exception()
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                # the leader raises the exception itself, so waiters need not retrieve it
+                future.exception()
+                raise
+            else:
+                future.set_result(copy.deepcopy(result) if flight[1] else None)
+                return result
+            finally:
+                with self.__lock:
+                    del self.__futures[(loop, key)]
+
+        started_at = loop.time()
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError("deadline exceeded while waiting for an identical request")
+        except SingleFlight._Abandoned:
+            if timeout is not None:
+                timeout = max(0, timeout - (loop.time() - started_at))
+            return await self.do_async(key, fn, timeout)
+        return copy.deepcopy(result)
@@ -0,0 +1,171 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+
+class VaultCache(object):
+    """
+    An in-memory LRU cache of vault lookups, with entries expiring ``ttl`` seconds
+    after they are stored. ::
+
+        vault_cache = braintree.util.VaultCache(max_size=1000, ttl=60)
+        gateway = braintree.BraintreeGateway(braintree.Configuration(..., vault_cache=vault_cache))
+
+    With a vault cache configured, ``customer.find``, ``payment_method.find`` and
+    ``credit_card.find`` first look for the parsed response in the cache, and the
+    ``update``, ``delete`` and ``revoke`` calls of those gateways remove the entries
+    they make stale. Writes made through other gateways, or by other processes, are
+    only seen once the entry expires.
+
+    Any object with ``get(key)``, ``set(key, value)``, ``delete(key)`` and ``clear()``
+    methods can be used instead, such as a wrapper around a shared external store;
+    ``get`` returns None for a missing key, and values are parsed responses made of
+    dicts, lists and scalars. An optional ``peek(key)`` is used to read entries while
+    invalidating without counting them as hits or misses. ``stats()`` returns the hits, misses, evictions and invalidations
+    counted so far.
+    """
+
+    def __init__(self, max_size=1000, ttl=60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def peek(self, key):
+        """ Returns the entry under ``key`` like :meth:`get`, without counting it or marking it as recently used. """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[1]
+
+    def set(self, key, value):
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self.__lock:
+            if self.__entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self.__lock:
+            self.invalidations += len(self.__entries)
+            self.__entries.clear()
+
+    def stats(self):
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self.__entries)
+            }
+
+    @staticmethod
+    def read_through(config, key, load):
+        """
+        Returns a copy of the response cached under ``key`` in ``config.vault_cache``,
+        calling ``load`` and caching its response on a miss.
+        """
+        cache = getattr(config, "vault_cache", None)
+        if cache is None:
+            return load()
+
+        key = VaultCache.__scoped_key(config, key)
+        response = cache.get(key)
+        if response is None:
+            response = load()
+            cache.set(key, copy.deepcopy(response))
+            return response
+        return copy.deepcopy(response)
+
+    @staticmethod
+    def invalidate(config, *keys):
+        cache = getattr(config, "vault_cache", None)
+        if cache is not None:
+            for key in keys:
+                cache.delete(VaultCache.__scoped_key(config, key))
+
+    @staticmethod
+    def invalidate_payment_method(config, token, customer_id=None):
+        """
+        Removes the cached payment method and its customer, whose response lists the
+        customer's payment methods. When the customer is not known from the write or
+        a cached payment method, the whole cache is cleared.
+        """
+        cache = getattr(config, "vault_cache", None)
+        if cache is None:
+            return
+
+        keys = ["payment_method/" + token, "credit_card/" + token]
+        if customer_id is None:
+            for key in keys:
+                response = VaultCache.__peek(cache, VaultCache.__scoped_key(config, key))
+                attributes = next(iter(response.values()), None) if response else None
+                if isinstance(attributes, dict):
+                    customer_id = attributes.get("customer_id")
+                if customer_id is not None:
+                    break
+
+        if customer_id is None:
+            cache.clear()
+        else:
+            VaultCache.invalidate(config, "customer/" + customer_id, *keys)
+
+    @staticmethod
+    def invalidate_customer(config, customer_id):
+        """
+        Removes the cached customer and the payment methods listed in its cached
+        response. When the customer is not cached, its payment methods are not known
+        and the whole cache is cleared.
+        """
+        cache = getattr(config, "vault_cache", None)
+        if cache is None:
+            return
+
+        response = VaultCache.__peek(cache, VaultCache.__scoped_key(config, "customer/" + customer_id))
+        attributes = response.get("customer") if response else None
+        if not isinstance(attributes, dict):
+            cache.clear()
+            return
+
+        keys = ["customer/" + customer_id]
+        for value in attributes.values():
+            if isinstance(value, list):
+                for payment_method in value:
+                    if isinstance(payment_method, dict) and payment_method.get("token") is not None:
+                        keys += ["payment_method/" + payment_method["token"], "credit_card/" + payment_method["token"]]
+        VaultCache.invalidate(config, *keys)
+
+    @staticmethod
+    def __peek(cache, key):
+        peek = getattr(cache, "peek", None)
+        return cache.get(key) if peek is None else peek(key)
+
+    @staticmethod
+    def __scoped_key(config, key):
+        return str(config.merchant_id) + "/" + key
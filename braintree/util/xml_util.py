@@ -7,5 +7,9 @@ class XmlUtil(object):
         return Generator(dict).generate()
 
     @staticmethod
-    def dict_from_xml(xml):
-        return Parser(xml).parse()
+    def dict_from_xml(xml, fields=None):
+        return Parser(xml, fields=fields).parse()
+
+    @staticmethod
+    def elements_from_xml(xml, element_name, fields=None):
+        return Parser(xml, element_name, fields)
@@ -0,0 +1,239 @@
+from tests.test_helper import *
+import asyncio
+import gzip
+import threading
+
+class LocalGatewayServer(object):
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+        self.drop_next_response = False
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                verb, path, _ = request_line.decode("latin-1").split(" ")
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line == b"\r\n":
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((verb, path, headers, body))
+                if self.drop_next_response:
+                    self.drop_next_response = False
+                    break
+                writer.write(self.respond(verb, path.split("/merchants/integration_merchant_id")[-1], body))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def respond(self, verb, path, body):
+        if verb == "GET" and path == "/transactions/my_id":
+            xml = b"<transaction><id>my_id</id><amount>10.00</amount><status>authorized</status></transaction>"
+            return self.response(200, gzip.compress(xml), [("Content-Encoding", "gzip")])
+        elif verb == "POST" and path == "/transactions":
+            amount = re.search(b"<amount>(.*)</amount>", body).group(1)
+            xml = b"<transaction><id>new_id</id><amount>" + amount + b"</amount><status>authorized</status></transaction>"
+            return self.response(201, xml)
+        elif verb == "POST" and path == "/transactions/advanced_search_ids":
+            xml = b'<search-results><page-size type="integer">2</page-size><ids type="array"><item>a</item><item>b</item><item>c</item></ids></search-results>'
+            return self.response(200, xml)
+        elif verb == "POST" and path == "/transactions/advanced_search":
+            ids = re.findall(b"<item>(\\w+)</item>", body)
+            xml = b'<credit-card-transactions type="collection">' + b"".join(
+                b"<transaction><id>" + transaction_id + b"</id><amount>1.00</amount></transaction>" for transaction_id in ids
+            ) + b"</credit-card-transactions>"
+            chunked = b"".join(b"%x\r\n%s\r\n" % (len(xml[i:i + 10]), xml[i:i + 10]) for i in range(0, len(xml), 10)) + b"0\r\n\r\n"
+            return self.response(200, chunked, [("Transfer-Encoding", "chunked")], content_length=False)
+        elif verb == "DELETE" and path == "/customers/my_customer":
+            return self.response(200, b" ")
+        else:
+            return self.response(404, b"")
+
+    def response(self, status, body, headers=None, content_length=True):
+        lines = ["HTTP/1.1 %d Status" % status, "Content-Type: application/xml"]
+        lines += ["%s: %s" % header for header in headers or []]
+        if content_length:
+            lines.append("Content-Length: %d" % len(body))
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class TestAsyncBraintreeGateway(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = LocalGatewayServer()
+        self.loop.run_until_complete(self.server.start())
+        config = Configuration(
+            Environment("test", "127.0.0.1", str(self.server.port), "http://auth.venmo.dev:9292", False, None),
+            "integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key"
+        )
+        self.gateway = AsyncBraintreeGateway(config)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.gateway.close())
+        self.loop.run_until_complete(self.server.stop())
+        # connections left open by event loops a test closed keep their handlers waiting
+        async def cancel_handlers():
+            handlers = asyncio.all_tasks(self.loop) - set([asyncio.current_task()])
+            for handler in handlers:
+                handler.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+        self.loop.run_until_complete(cancel_handlers())
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_find_returns_a_transaction(self):
+        transaction = self.run_async(self.gateway.transaction.find("my_id"))
+
+        self.assertIsInstance(transaction, Transaction)
+        self.assertEqual("my_id", transaction.id)
+        self.assertEqual(Decimal("10.00"), transaction.amount)
+        _, _, headers, _ = self.server.requests[0]
+        self.assertEqual("gzip", headers["accept-encoding"])
+        self.assertTrue(headers["authorization"].startswith("Basic "))
+
+    def test_find_raises_not_found(self):
+        with self.assertRaises(NotFoundError):
+            self.run_async(self.gateway.transaction.find("missing_id"))
+
+    def test_sale_returns_a_successful_result(self):
+        result = self.run_async(self.gateway.transaction.sale({"amount": "12.34", "payment_method_nonce": Nonces.Transactable}))
+
+        self.assertIsInstance(result, SuccessfulResult)
+        self.assertEqual(Decimal("12.34"), result.transaction.amount)
+
+    def test_sale_validates_keys(self):
+        with self.assertRaises(KeyError):
+            self.run_async(self.gateway.transaction.sale({"bad_key": "value"}))
+
+    def test_async_for_over_search_results(self):
+        async def collect():
+            results = await self.gateway.transaction.search(TransactionSearch.amount == "1.00")
+            return [transaction.id async for transaction in results]
+
+        self.assertEqual(["a", "b", "c"], self.run_async(collect()))
+
+    def test_concurrent_requests_reuse_connections(self):
+        async def find_many():
+            for _ in range(3):
+                await asyncio.gather(*[self.gateway.transaction.find("my_id") for _ in range(5)])
+
+        self.run_async(find_many())
+
+        self.assertEqual(15, len(self.server.requests))
+        self.assertEqual(5, self.server.connections)
+
+    def test_idle_connections_are_limited_to_the_pool_size(self):
+        config = Configuration(
+            Environment("test", "127.0.0.1", str(self.server.port), "http://auth.venmo.dev:9292", False, None),
+            "integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            pool_size=2
+        )
+        gateway = AsyncBraintreeGateway(config)
+        async def find_many():
+            for _ in range(3):
+                await asyncio.gather(*[gateway.transaction.find("my_id") for _ in range(5)])
+
+        self.run_async(find_many())
+        self.run_async(gateway.close())
+
+        self.assertEqual(5 + 3 + 3, self.server.connections)
+
+    def test_connections_are_not_reused_across_event_loops(self):
+        server_thread = threading.Thread(target=self.loop.run_forever)
+        server_thread.start()
+        try:
+            for _ in range(2):
+                loop = asyncio.new_event_loop()
+                try:
+                    transaction = loop.run_until_complete(self.gateway.transaction.find("my_id"))
+                finally:
+                    loop.close()
+                self.assertEqual("my_id", transaction.id)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            server_thread.join()
+
+        self.assertEqual(2, self.server.connections)
+
+    def test_delete_customer(self):
+        result = self.run_async(self.gateway.customer.delete("my_customer"))
+        self.assertTrue(result.is_success)
+
+    def test_idempotent_requests_are_resent_when_a_reused_connection_closes(self):
+        self.run_async(self.gateway.transaction.find("my_id"))
+        self.server.drop_next_response = True
+
+        transaction = self.run_async(self.gateway.transaction.find("my_id"))
+
+        self.assertEqual("my_id", transaction.id)
+        self.assertEqual(["GET", "GET", "GET"], [request[0] for request in self.server.requests])
+
+    def test_posts_are_not_resent_when_a_reused_connection_closes(self):
+        self.run_async(self.gateway.transaction.find("my_id"))
+        self.server.drop_next_response = True
+
+        with self.assertRaises(asyncio.IncompleteReadError):
+            self.run_async(self.gateway.transaction.sale({"amount": "12.34", "payment_method_nonce": Nonces.Transactable}))
+        self.assertEqual(["GET", "POST"], [request[0] for request in self.server.requests])
+
+    def test_puts_are_not_resent_when_a_reused_connection_closes(self):
+        self.run_async(self.gateway.transaction.find("my_id"))
+        self.server.drop_next_response = True
+
+        with self.assertRaises(asyncio.IncompleteReadError):
+            self.run_async(self.gateway.transaction.void("my_id"))
+        self.assertEqual(["GET", "PUT"], [request[0] for request in self.server.requests])
+
+    def test_wraps_connection_errors(self):
+        config = Configuration(
+            Environment("test", "127.0.0.1", "1", "http://auth.venmo.dev:9292", False, None),
+            "integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            wrap_http_exceptions=True
+        )
+        with self.assertRaises(braintree.exceptions.http.ConnectionError):
+            self.run_async(AsyncBraintreeGateway(config).transaction.find("my_id"))
+
+    def test_pluggable_async_http_strategy(self):
+        class FakeStrategy(object):
+            def __init__(self, config, environment):
+                self.paths = []
+
+            async def http_do(self, http_verb, path, headers, request_body):
+                self.paths.append(path)
+                return [200, "<customer><id>my_customer</id></customer>"]
+
+        config = Configuration(
+            Environment.Development,
+            "integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            async_http_strategy=FakeStrategy
+        )
+        customer = self.run_async(AsyncBraintreeGateway(config).customer.find("my_customer"))
+
+        self.assertEqual("my_customer", customer.id)
+        self.assertTrue(config.async_http_strategy().paths[0].endswith("/customers/my_customer"))
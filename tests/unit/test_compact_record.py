@@ -0,0 +1,81 @@
+from tests.test_helper import *
+from braintree.attribute_getter import AttributeGetter
+
+class TestCompactRecord(unittest.TestCase):
+    def transaction(self, **extra_attributes):
+        attributes = self.transaction_attributes()
+        attributes.update(extra_attributes)
+        return Transaction(AttributeGetter({"config": AttributeGetter({"lazy_resources": False})}), attributes)
+
+    def transaction_attributes(self):
+        return {
+            "id": "abc",
+            "amount": "27.00",
+            "status": "settled",
+            "billing": {"id": "billing_id", "postal_code": "60606"},
+            "status_history": [{"status": "authorized", "amount": "27.00"}],
+            "disbursement_details": {"disbursement_date": date(2013, 4, 10), "settlement_amount": "27.00"}
+        }
+
+    def test_keeps_attributes_and_nested_resources(self):
+        record = self.transaction().compact()
+
+        self.assertEqual("abc", record.id)
+        self.assertEqual(Decimal("27.00"), record.amount)
+        self.assertEqual("60606", record.billing_details.postal_code)
+        self.assertEqual(Decimal("27.00"), record.status_history[0].amount)
+        self.assertIsInstance(record, CompactRecord)
+
+    def test_leaves_out_raw_attributes_replaced_by_nested_resources(self):
+        record = self.transaction().compact()
+
+        self.assertEqual("60606", record.billing_details.postal_code)
+        self.assertNotIn("billing", type(record)._fields)
+        with self.assertRaises(AttributeError):
+            record.billing
+
+    def test_has_no_per_instance_dict(self):
+        record = self.transaction().compact()
+
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertFalse(hasattr(record.billing_details, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.not_an_attribute = True
+
+    def test_resource_properties_and_constants_still_work(self):
+        record = self.transaction().compact()
+
+        self.assertTrue(record.is_disbursed)
+        self.assertEqual("settled", record.Status.Settled)
+        with self.assertRaises(AttributeError):
+            record.paypal_details
+
+    def test_records_of_the_same_shape_share_a_class(self):
+        first = self.transaction().compact()
+        second = self.transaction(id="def").compact()
+        other_shape = self.transaction(order_id="123").compact()
+
+        self.assertIs(type(first), type(second))
+        self.assertIsNot(type(first), type(other_shape))
+        self.assertEqual("Transaction", type(first).__name__)
+
+    def test_attributes_in_another_order_share_a_class(self):
+        first = self.transaction(order_id="123", purchase_order_number="456").compact()
+        attributes = dict(reversed(list(dict(self.transaction_attributes(), order_id="123", purchase_order_number="456").items())))
+        second = Transaction(AttributeGetter({"config": AttributeGetter({"lazy_resources": False})}), attributes).compact()
+
+        self.assertIs(type(first), type(second))
+        self.assertEqual("456", second.purchase_order_number)
+
+    def test_compacts_lazy_transactions(self):
+        transaction = Transaction(
+            AttributeGetter({"config": AttributeGetter({"lazy_resources": True})}),
+            {"id": "abc", "amount": "1.00", "billing": {"postal_code": "60606"}}
+        )
+        record = transaction.compact()
+
+        self.assertEqual(Decimal("1.00"), record.amount)
+        self.assertEqual("60606", record.billing_details.postal_code)
+
+    def test_repr(self):
+        self.assertTrue(repr(self.transaction().compact()).startswith("<Transaction {id: 'abc', amount: Decimal('27.00')"))
@@ -23,6 +23,11 @@ class TestConfiguration(unittest.TestCase):
             import tests.test_helper
             imp.reload(tests.test_helper)
 
+    def test_http_is_cached_per_configuration(self):
+        config = Configuration.instantiate()
+        self.assertIs(config.http(), config.http())
+        self.assertIs(config.http(), config.http_strategy())
+
     def test_base_merchant_path_for_development(self):
         self.assertEqual("/merchants/integration_merchant_id", Configuration.instantiate().base_merchant_path())
 
@@ -1,4 +1,8 @@
 from tests.test_helper import *
+from braintree.customer_gateway import CustomerGateway
+from braintree.util.not_found_cache import NotFoundCache
+from braintree.util.vault_cache import VaultCache
+from unittest.mock import MagicMock
 
 class TestCustomer(unittest.TestCase):
     def test_create_raise_exception_with_bad_keys(self):
@@ -25,6 +29,56 @@ class TestCustomer(unittest.TestCase):
         with self.assertRaises(NotFoundError):
             Customer.find(None)
 
+    def test_find_with_fields_does_not_default_payment_methods(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        http = MagicMock(get=MagicMock(return_value={"customer": {"id": "c1", "credit_cards": [{"token": "t1"}]}}))
+        gateway.config.http = MagicMock(return_value=http)
+
+        customer = CustomerGateway(gateway).find("c1", fields=["credit_cards"])
+
+        self.assertEqual(["t1"], [credit_card.token for credit_card in customer.credit_cards])
+        with self.assertRaisesRegex(AttributeError, "has no attribute 'payment_methods'"):
+            customer.payment_methods
+
+    def test_find_reads_through_the_vault_cache_until_the_customer_is_updated(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.vault_cache = VaultCache()
+        http = MagicMock(
+            get=MagicMock(return_value={"customer": {"id": "c1", "first_name": "Jo"}}),
+            put=MagicMock(return_value={"customer": {"id": "c1", "first_name": "Al"}})
+        )
+        gateway.config.http = MagicMock(return_value=http)
+        customers = CustomerGateway(gateway)
+
+        self.assertEqual("Jo", customers.find("c1").first_name)
+        self.assertEqual("Jo", customers.find("c1").first_name)
+        self.assertEqual(1, http.get.call_count)
+
+        customers.update("c1", {"first_name": "Al"})
+        customers.find("c1")
+        self.assertEqual(2, http.get.call_count)
+        self.assertEqual({"hits": 1, "misses": 2, "evictions": 0, "invalidations": 1, "size": 1}, gateway.config.vault_cache.stats())
+
+    def test_unknown_customers_are_not_looked_up_again_until_created(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.not_found_cache = NotFoundCache()
+        http = MagicMock(
+            get=MagicMock(side_effect=NotFoundError()),
+            post=MagicMock(return_value={"customer": {"id": "c1", "credit_cards": [{"token": "t1"}]}})
+        )
+        gateway.config.http = MagicMock(return_value=http)
+        customers = CustomerGateway(gateway)
+
+        for _ in range(3):
+            with self.assertRaisesRegex(NotFoundError, "customer with id 'c1' not found"):
+                customers.find("c1")
+        self.assertEqual(1, http.get.call_count)
+
+        customers.create({"id": "c1"})
+        http.get.side_effect = None
+        http.get.return_value = {"customer": {"id": "c1"}}
+        self.assertEqual("c1", customers.find("c1").id)
+
     def test_initialize_sets_paypal_accounts(self):
         customer = Customer("gateway", {
             "paypal_accounts": [
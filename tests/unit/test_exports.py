@@ -10,9 +10,11 @@ class TestExports(unittest.TestCase):
         self.assertNotEqual(braintree.AddressGateway, None)
         self.assertNotEqual(braintree.AmexExpressCheckoutCard, None)
         self.assertNotEqual(braintree.AndroidPayCard, None)
+        self.assertNotEqual(braintree.AsyncBraintreeGateway, None)
         self.assertNotEqual(braintree.ApplePayCard, None)
         self.assertNotEqual(braintree.BraintreeGateway, None)
         self.assertNotEqual(braintree.ClientToken, None)
+        self.assertNotEqual(braintree.CompactRecord, None)
         self.assertNotEqual(braintree.Configuration, None)
         self.assertNotEqual(braintree.CredentialsParser, None)
         self.assertNotEqual(braintree.CreditCard, None)
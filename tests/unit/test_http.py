@@ -1,9 +1,11 @@
+import threading
 import traceback
 
 from tests.test_helper import *
 from braintree.exceptions.http.timeout_error import *
+from braintree.exceptions.http.connection_error import ConnectionError
 from braintree.attribute_getter import AttributeGetter
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 class TestHttp(unittest.TestCase):
     def test_raise_exception_from_request_timeout(self):
@@ -37,6 +39,33 @@ class TestHttp(unittest.TestCase):
         self.assertTrue('Accept-Encoding' in headers)
         self.assertEqual('gzip', headers["Accept-Encoding"])
 
+    def test_headers_are_computed_once_per_http(self):
+        config = AttributeGetter({
+                "base_url": (lambda: ""),
+                "has_access_token": (lambda: False),
+                "has_client_credentials": (lambda: False),
+                "public_key": "public",
+                "private_key": "private"})
+        http = Http(config, "fake_environment")
+        self.assertIs(http.context(), http.context())
+        self.assertEqual(b"Basic cHVibGljOnByaXZhdGU=", http._Http__headers(Http.ContentType.Xml)["Authorization"])
+
+    def test_header_overrides_do_not_leak_into_shared_headers(self):
+        config = AttributeGetter({
+                "base_url": (lambda: ""),
+                "has_access_token": (lambda: False),
+                "has_client_credentials": (lambda: False),
+                "public_key": "",
+                "private_key": ""})
+        http = Http(config, "fake_environment")
+        headers = http._Http__headers(Http.ContentType.Json, {"Accept": "application/json"})
+        headers["X-Extra"] = "mutated"
+
+        self.assertEqual("application/json", headers["Accept"])
+        self.assertEqual("application/xml", http._Http__headers(Http.ContentType.Json)["Accept"])
+        self.assertFalse("X-Extra" in http._Http__headers(Http.ContentType.Json))
+        self.assertFalse("Content-type" in http._Http__headers(Http.ContentType.Json))
+
     def test_backtrace_preserved_when_not_wrapping_exceptions(self):
         class Error(Exception):
             pass
@@ -111,7 +140,363 @@ class TestHttp(unittest.TestCase):
         http = self.setup_http_strategy(test_http_do_strategy)
         http.post_multipart("/some_path", "files", params)
 
-    def setup_http_strategy(self, http_do):
+    def test_retries_retryable_statuses_for_idempotent_requests(self):
+        responses = [(503, ""), (429, ""), (200, "<customer><id>123</id></customer>")]
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            return responses.pop(0)
+
+        http = self.setup_http_strategy(test_http_do_strategy, RetryPolicy(max_attempts=3))
+        with patch("time.sleep"):
+            self.assertEqual({"customer": {"id": "123"}}, http.get("/customers/123"))
+        self.assertEqual(2, http.config.retry_policy.retry_count)
+
+    def test_raises_after_max_retry_attempts(self):
+        calls = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            calls.append(path)
+            return (504, "")
+
+        http = self.setup_http_strategy(test_http_do_strategy, RetryPolicy(max_attempts=3))
+        with patch("time.sleep"), self.assertRaises(GatewayTimeoutError):
+            http.get("/customers/123")
+        self.assertEqual(3, len(calls))
+
+    def test_does_not_retry_unsafe_posts_by_default(self):
+        calls = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            calls.append(path)
+            return (503, "")
+
+        http = self.setup_http_strategy(test_http_do_strategy, RetryPolicy(max_attempts=3))
+        with patch("time.sleep"), self.assertRaises(ServiceUnavailableError):
+            http.post("/transactions", {"amount": "10.00"})
+        self.assertEqual(1, len(calls))
+
+    def test_retries_connection_errors(self):
+        responses = [requests.exceptions.ConnectionError(), (200, "")]
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        http = self.setup_http_strategy(test_http_do_strategy, RetryPolicy(max_attempts=2))
+        with patch("time.sleep"):
+            self.assertEqual({}, http.post("/transactions/advanced_search_ids", {"search": {}}))
+
+    def test_honors_retry_after_header_from_http_strategy(self):
+        responses = [(429, ""), (200, "")]
+        http_strategy = AttributeGetter({
+            "http_do": (lambda *_: responses.pop(0)),
+            "response_headers": (lambda: {"Retry-After": "2"})})
+        config = AttributeGetter({
+                "base_url": (lambda: ""),
+                "has_access_token": (lambda: False),
+                "has_client_credentials": (lambda: False),
+                "http_strategy": (lambda: http_strategy),
+                "public_key": "",
+                "private_key": "",
+                "retry_policy": RetryPolicy(backoff_base=0.01),
+                "wrap_http_exceptions": False})
+
+        with patch("time.sleep") as sleep:
+            Http(config, "fake_environment").get("/some_path")
+        sleep.assert_called_once_with(2.0)
+
+    def test_endpoint_family(self):
+        self.assertEqual("search", Http.endpoint_family("https://api/merchants/id/transactions/advanced_search_ids"))
+        self.assertEqual("transactions", Http.endpoint_family("https://api/merchants/id/transactions/abc/void"))
+        self.assertEqual("vault", Http.endpoint_family("https://api/merchants/id/customers/abc"))
+        self.assertEqual("vault", Http.endpoint_family("https://api/merchants/id/payment_methods/any/token"))
+        self.assertEqual("graphql", Http.endpoint_family("https://payments.braintree-api.com/graphql"))
+        self.assertEqual("other", Http.endpoint_family("https://api/merchants/id/plans"))
+
+    def test_rate_limiter_paces_requests_and_adapts_to_throttling(self):
+        responses = [(429, ""), (200, "")]
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            return responses.pop(0)
+
+        rate_limiter = RateLimiter(rate=10)
+        http = self.setup_http_strategy(test_http_do_strategy, RetryPolicy(), rate_limiter)
+        with patch("time.sleep"):
+            http.get("/transactions/abc")
+
+        self.assertTrue(rate_limiter.current_rate("transactions") < 10)
+
+    def test_circuit_breaker_fails_fast_once_open(self):
+        calls = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            calls.append(path)
+            return (503, "")
+
+        circuit_breaker = CircuitBreaker(minimum_requests=2, open_duration=60)
+        http = self.setup_http_strategy(test_http_do_strategy, circuit_breaker=circuit_breaker)
+        for _ in range(2):
+            with self.assertRaises(ServiceUnavailableError):
+                http.get("/transactions/abc")
+
+        with self.assertRaises(CircuitOpenError):
+            http.get("/transactions/abc")
+        self.assertEqual(2, len(calls))
+        self.assertEqual({"transactions": CircuitBreaker.Open}, circuit_breaker.states())
+
+    def test_circuit_breaker_releases_probes_interrupted_by_a_base_exception(self):
+        responses = [(503, ""), KeyboardInterrupt(), (200, "")]
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            response = responses.pop(0)
+            if isinstance(response, BaseException):
+                raise response
+            return response
+
+        circuit_breaker = CircuitBreaker(minimum_requests=1, open_duration=0)
+        http = self.setup_http_strategy(test_http_do_strategy, circuit_breaker=circuit_breaker)
+        with self.assertRaises(ServiceUnavailableError):
+            http.get("/transactions/abc")
+        with self.assertRaises(KeyboardInterrupt):
+            http.get("/transactions/abc")
+
+        http.get("/transactions/abc")
+        self.assertEqual({"transactions": CircuitBreaker.Closed}, circuit_breaker.states())
+
+    def test_deadline_stops_retries_that_would_not_finish_in_time(self):
+        calls = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            calls.append(path)
+            return (503, "")
+
+        http = self.setup_http_strategy(test_http_do_strategy, RetryPolicy(max_attempts=5, backoff_base=10, backoff_cap=10))
+        with patch("random.uniform", return_value=10), patch("time.sleep") as sleep:
+            with Deadline(5):
+                with self.assertRaises(ServiceUnavailableError):
+                    http.get("/transactions/abc")
+
+        self.assertEqual(1, len(calls))
+        self.assertFalse(sleep.called)
+
+    def test_expired_deadline_raises_before_sending(self):
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            self.fail("request sent after the deadline")
+
+        http = self.setup_http_strategy(test_http_do_strategy)
+        with Deadline(-1):
+            with self.assertRaises(DeadlineExceededError):
+                http.get("/transactions/abc")
+
+    def test_timeout_uses_separate_connect_and_read_timeouts_capped_by_the_deadline(self):
+        config = Configuration(
+            Environment.Development,
+            "integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            timeout=60,
+            connect_timeout=2,
+            read_timeout=20
+        )
+        http = config.http()
+        self.assertEqual((2, 20), http.timeout())
+        self.assertEqual(60, Configuration(Environment.Development, "id", "key", "secret").http().timeout())
+
+        with patch("time.monotonic", return_value=100.0):
+            deadline = Deadline(5)
+            with deadline:
+                self.assertEqual((2, 5), http.timeout())
+
+    def test_http_do_sends_configured_timeouts(self):
+        with patch('requests.Session.send') as send:
+            send.return_value.status_code = 200
+            send.return_value.text = ""
+            config = Configuration(
+                Environment.Development,
+                "integration_merchant_id",
+                public_key="integration_public_key",
+                private_key="integration_private_key",
+                connect_timeout=3,
+                read_timeout=30
+            )
+            config.http().http_do("GET", "/customers/", {}, "")
+
+            self.assertEqual((3, 30), send.call_args[1]["timeout"])
+
+    def test_hedging_policy_only_hedges_get_requests(self):
+        calls = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            calls.append(http_verb)
+            time.sleep(0.02)
+            return (200, "")
+
+        hedging_policy = HedgingPolicy(delay=0.001, budget=1)
+        http = self.setup_http_strategy(test_http_do_strategy, hedging_policy=hedging_policy)
+        http.get("/customers/abc")
+        http.post("/customers", {})
+
+        self.assertEqual(["GET", "GET", "POST"], sorted(calls))
+        self.assertEqual(1, hedging_policy.hedged_count)
+
+    def test_make_request_streams_response_bodies_to_the_parser(self):
+        with patch('requests.Session.send') as send:
+            send.return_value.status_code = 200
+            send.return_value.iter_content.return_value = iter([b"<customer><id>", b"abc</id></customer>"])
+            config = Configuration(
+                Environment.Development,
+                "integration_merchant_id",
+                public_key="integration_public_key",
+                private_key="integration_private_key"
+            )
+
+            self.assertEqual({"customer": {"id": "abc"}}, config.http().get("/customers/abc"))
+            self.assertTrue(send.call_args[1]["stream"])
+            send.return_value.close.assert_called_once_with()
+
+    def test_make_request_calls_http_do_overridden_by_a_strategy_subclass(self):
+        calls = []
+        class LoggingHttp(Http):
+            def http_do(self, http_verb, path, headers, request_body):
+                calls.append((http_verb, path))
+                return [200, "<customer><id>abc</id></customer>"]
+
+        config = Configuration(
+            Environment.Development,
+            "integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            http_strategy=LoggingHttp
+        )
+
+        self.assertEqual({"customer": {"id": "abc"}}, config.http().get("/customers/abc"))
+        self.assertEqual(1, len(calls))
+
+    def test_make_request_closes_unread_bodies_of_error_responses(self):
+        with patch('requests.Session.send') as send:
+            send.return_value.status_code = 500
+            config = Configuration(
+                Environment.Development,
+                "integration_merchant_id",
+                public_key="integration_public_key",
+                private_key="integration_private_key"
+            )
+
+            with self.assertRaises(ServerError):
+                config.http().get("/customers/abc")
+            send.return_value.close.assert_called_once_with()
+
+    def test_make_request_retries_bodies_that_fail_while_being_read(self):
+        def truncated_body(chunk_size):
+            yield b"<customer><id>"
+            raise requests.exceptions.ChunkedEncodingError()
+
+        with patch('requests.Session.send') as send:
+            truncated = MagicMock(status_code=200)
+            truncated.iter_content.side_effect = truncated_body
+            complete = MagicMock(status_code=200)
+            complete.iter_content.return_value = iter([b"<customer><id>abc</id></customer>"])
+            send.side_effect = [truncated, complete]
+            circuit_breaker = MagicMock()
+            config = Configuration(
+                Environment.Development,
+                "integration_merchant_id",
+                public_key="integration_public_key",
+                private_key="integration_private_key",
+                retry_policy=RetryPolicy(max_attempts=2),
+                circuit_breaker=circuit_breaker
+            )
+
+            with patch("time.sleep"):
+                self.assertEqual({"customer": {"id": "abc"}}, config.http().get("/customers/abc"))
+            self.assertIsInstance(circuit_breaker.record.call_args_list[0][1]["exception"], requests.exceptions.ChunkedEncodingError)
+            truncated.close.assert_called_with()
+
+    def test_make_request_wraps_errors_reading_streamed_elements(self):
+        def truncated_body(chunk_size):
+            yield b"<credit_card_transactions><transaction><id>a</id></transaction>"
+            raise requests.exceptions.ChunkedEncodingError()
+
+        with patch('requests.Session.send') as send:
+            send.return_value.status_code = 200
+            send.return_value.iter_content.side_effect = truncated_body
+            config = Configuration(
+                Environment.Development,
+                "integration_merchant_id",
+                public_key="integration_public_key",
+                private_key="integration_private_key",
+                wrap_http_exceptions=True
+            )
+
+            elements = iter(config.http().post_elements("/transactions/advanced_search", {}, "transaction"))
+            self.assertEqual({"id": "a"}, next(elements))
+            with self.assertRaises(ConnectionError):
+                next(elements)
+
+    def test_make_request_applies_the_deadline_while_streamed_elements_are_read(self):
+        with patch('requests.Session.send') as send:
+            send.return_value.status_code = 200
+            send.return_value.iter_content.return_value = iter([
+                b"<credit_card_transactions><transaction><id>a</id></transaction>",
+                b"<transaction><id>b</id></transaction></credit_card_transactions>"
+            ])
+            config = Configuration(
+                Environment.Development,
+                "integration_merchant_id",
+                public_key="integration_public_key",
+                private_key="integration_private_key"
+            )
+
+            with Deadline(30):
+                elements = iter(config.http().post_elements("/transactions/advanced_search", {}, "transaction"))
+            self.assertEqual({"id": "a"}, next(elements))
+            with patch("time.monotonic", return_value=time.monotonic() + 60), self.assertRaises(DeadlineExceededError):
+                next(elements)
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        release = threading.Event()
+        requests_sent = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            requests_sent.append((http_verb, path))
+            if http_verb == "GET":
+                release.wait(5)
+            return (200, "<customer><id>c1</id></customer>")
+
+        single_flight = SingleFlight()
+        http = self.setup_http_strategy(test_http_do_strategy, single_flight=single_flight)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(http.get("/customers/c1"))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while single_flight.coalesced_count < 2:
+            time.sleep(0.001)
+        http.post("/customers/c1", {})
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([("GET", "/customers/c1"), ("POST", "/customers/c1")], requests_sent)
+        self.assertEqual([{"customer": {"id": "c1"}}] * 3, results)
+
+    def test_gets_with_different_credentials_are_not_coalesced(self):
+        release = threading.Event()
+        requests_sent = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            requests_sent.append(headers["Authorization"])
+            release.wait(5)
+            return (200, "<customer><id>c1</id></customer>")
+
+        single_flight = SingleFlight()
+        http = self.setup_http_strategy(test_http_do_strategy, single_flight=single_flight)
+        threads = [
+            threading.Thread(target=lambda: http.get("/customers/c1")),
+            threading.Thread(target=lambda: http._make_request("GET", "/customers/c1", Http.ContentType.Xml, header_overrides={"Authorization": "Bearer other"}))
+        ]
+        for thread in threads:
+            thread.start()
+        while len(requests_sent) < 2 and single_flight.coalesced_count == 0:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(0, single_flight.coalesced_count)
+        self.assertIn("Bearer other", requests_sent)
+
+    def setup_http_strategy(self, http_do, retry_policy=None, rate_limiter=None, circuit_breaker=None, hedging_policy=None, single_flight=None):
         config = AttributeGetter({
                 "base_url": (lambda: ""),
                 "has_access_token": (lambda: False),
@@ -119,6 +504,12 @@ class TestHttp(unittest.TestCase):
                 "http_strategy": (lambda: AttributeGetter({"http_do": http_do})),
                 "public_key": "",
                 "private_key": "",
+                "retry_policy": retry_policy,
+                "rate_limiter": rate_limiter,
+                "timeout": 60,
+                "circuit_breaker": circuit_breaker,
+                "hedging_policy": hedging_policy,
+                "single_flight": single_flight,
                 "wrap_http_exceptions": False})
 
         return Http(config, "fake_environment")
@@ -156,7 +547,7 @@ class TestHttp(unittest.TestCase):
             request_url = prepared_request.url
             self.assertTrue(request_url.endswith("/../../customers/"))
 
-    def test_sessions_close_after_request(self):
+    def test_sessions_are_reused_across_requests(self):
         with patch('requests.Session.send') as send, patch('requests.Session.close') as close:
             send.return_value.status_code = 200
             config = Configuration(
@@ -168,5 +559,26 @@ class TestHttp(unittest.TestCase):
             )
             http = config.http()
             http.get("/../../customers/")
+            http.get("/../../customers/")
+
+            self.assertEqual(2, send.call_count)
+            self.assertFalse(close.called)
+            self.assertIs(config.connection_pool().session(), config.connection_pool().session())
+
+    def test_instantiated_configurations_share_a_connection_pool(self):
+        self.assertIs(Configuration.instantiate().connection_pool(), Configuration.instantiate().connection_pool())
+
+    def test_http_do_records_response_headers_per_thread(self):
+        with patch('requests.Session.send') as send:
+            send.return_value.status_code = 429
+            send.return_value.headers = {"Retry-After": "1"}
+            config = Configuration(
+                Environment.Development,
+                "integration_merchant_id",
+                public_key="integration_public_key",
+                private_key="integration_private_key"
+            )
+            http = config.http()
+            http.http_do("GET", "/customers/", {}, "")
 
-            self.assertTrue(close.called)
+            self.assertEqual({"Retry-After": "1"}, http.response_headers())
@@ -1,5 +1,6 @@
 from tests.test_helper import *
 from braintree.payment_method_gateway import PaymentMethodGateway
+from braintree.util.vault_cache import VaultCache
 from unittest.mock import MagicMock
 
 class TestPaymentMethodGateway(unittest.TestCase):
@@ -177,6 +178,25 @@ class TestPaymentMethodGateway(unittest.TestCase):
         with self.assertRaises(KeyError):
             payment_method_gateway.delete("some_token", {"invalid_keys": False})
 
+    def test_delete_invalidates_the_cached_payment_method_and_its_customer(self):
+        payment_method_gateway, http_mock = self.setup_payment_method_gateway_and_mock_http()
+        vault_cache = VaultCache()
+        payment_method_gateway.config.vault_cache = vault_cache
+        http_mock.return_value.get.return_value = {
+            "credit_card": {"token": "some_token", "customer_id": "c1", "bin": "411111", "last_4": "1111"}
+        }
+        payment_method_gateway.find("some_token")
+        payment_method_gateway.find("some_token")
+        self.assertEqual(1, http_mock.return_value.get.call_count)
+
+        VaultCache.read_through(payment_method_gateway.config, "customer/c1", lambda: {"customer": {"id": "c1"}})
+        VaultCache.read_through(payment_method_gateway.config, "customer/c2", lambda: {"customer": {"id": "c2"}})
+        payment_method_gateway.delete("some_token")
+
+        self.assertEqual(1, vault_cache.stats()["size"])
+        payment_method_gateway.find("some_token")
+        self.assertEqual(2, http_mock.return_value.get.call_count)
+
     def setup_payment_method_gateway_and_mock_http(self):
         braintree_gateway = BraintreeGateway(Configuration.instantiate())
         payment_method_gateway = PaymentMethodGateway(braintree_gateway)
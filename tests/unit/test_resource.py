@@ -1,5 +1,6 @@
 from tests.test_helper import *
 from braintree.resource import Resource
+from unittest.mock import patch
 
 class TestResource(unittest.TestCase):
     def test_verify_keys_allows_wildcard_keys(self):
@@ -113,3 +114,35 @@ class TestResource(unittest.TestCase):
             }
         }
         Resource.verify_keys(params, signature)
+
+    def test_verify_keys_does_not_reuse_results_for_a_different_signature(self):
+        params = {"customer": {"one": "foo"}}
+        Resource.verify_keys(params, [{"customer": ["one", "two"]}])
+        with self.assertRaises(KeyError):
+            Resource.verify_keys(params, [{"customer": ["two"]}])
+        Resource.verify_keys(params, [{"customer": ["one", "two"]}])
+
+    def test_verify_keys_reports_invalid_keys_in_params_order(self):
+        signature = [
+            "amount",
+            {"custom_fields": ["__any_key__"]},
+            {"options": ["submit_for_settlement"]}
+        ]
+        params = {
+            "bogus": "value",
+            "custom_fields": {"valid-key": "value", "invalid key": "value"},
+            "options": {"invalid": True, "submit_for_settlement": True}
+        }
+        with self.assertRaises(KeyError) as context:
+            Resource.verify_keys(params, signature)
+
+        self.assertEqual("'Invalid keys: bogus, custom_fields[invalid key], options[invalid]'", str(context.exception))
+
+    def test_verify_keys_compiles_a_signature_returned_by_a_signature_method_once(self):
+        self.assertIs(Transaction.create_signature(), Transaction.create_signature())
+        with patch("re.search", wraps=re.search) as search:
+            Resource.verify_keys({"amount": "10.00"}, Transaction.create_signature())
+            compiled_calls = search.call_count
+            Resource.verify_keys({"amount": "10.00"}, Transaction.create_signature())
+
+        self.assertEqual(compiled_calls, search.call_count)
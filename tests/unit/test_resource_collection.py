@@ -31,6 +31,85 @@ class TestResourceCollection(unittest.TestCase):
         for test_elem, coll_elem in zip(self.TestResource.items, collection):
             self.assertEqual(test_elem, coll_elem)
 
+    def test_items_parallel_yields_results_in_order(self):
+        ids = [str(i) for i in range(50)]
+        def fetch(_, batch):
+            time.sleep(random.random() / 100)
+            return ["item " + resource_id for resource_id in batch]
+
+        collection = ResourceCollection("some_query", {"search_results": {"page_size": 3, "ids": ids}}, fetch)
+        self.assertEqual(["item " + resource_id for resource_id in ids], list(collection.items_parallel(max_workers=4, prefetch=2)))
+
+    def test_items_parallel_limits_pages_fetched_ahead(self):
+        ids = [str(i) for i in range(20)]
+        fetched = []
+        def fetch(_, batch):
+            fetched.append(batch)
+            return batch
+
+        collection = ResourceCollection("some_query", {"search_results": {"page_size": 2, "ids": ids}}, fetch)
+        items = collection.items_parallel(max_workers=2, prefetch=1)
+        self.assertEqual("0", next(items))
+        time.sleep(0.05)
+
+        self.assertEqual(3, len(fetched))
+        items.close()
+
+    def test_items_parallel_holds_at_most_max_workers_plus_prefetch_pages(self):
+        ids = [str(i) for i in range(20)]
+        fetched = []
+        def fetch(_, batch):
+            fetched.append(batch)
+            return batch
+
+        collection = ResourceCollection("some_query", {"search_results": {"page_size": 2, "ids": ids}}, fetch)
+        pages_in_flight = []
+        for index, item in enumerate(collection.items_parallel(max_workers=2, prefetch=1)):
+            time.sleep(0.005)
+            pages_in_flight.append(len(fetched) - index // 2)
+
+        self.assertEqual(3, max(pages_in_flight))
+
+    def test_items_parallel_raises_errors_when_reaching_the_failed_page(self):
+        ids = [str(i) for i in range(10)]
+        def fetch(_, batch):
+            if "4" in batch:
+                raise UnexpectedError("page failed")
+            return batch
+
+        collection = ResourceCollection("some_query", {"search_results": {"page_size": 2, "ids": ids}}, fetch)
+        yielded = []
+        with self.assertRaisesRegex(UnexpectedError, "page failed"):
+            for item in collection.items_parallel(max_workers=4):
+                yielded.append(item)
+
+        self.assertEqual(["0", "1", "2", "3"], yielded)
+
+    def test_pages_are_fetched_within_the_deadline_active_at_search_time(self):
+        deadlines = []
+        def fetch(_, batch):
+            deadlines.append(Deadline.current())
+            return batch
+
+        with Deadline(30) as deadline:
+            collection = ResourceCollection("some_query", self.collection_data, fetch)
+
+        self.assertEqual(["0", "1", "2", "3", "4"], list(collection.items_parallel(max_workers=2)))
+        self.assertEqual([deadline] * 3, deadlines)
+        self.assertIsNone(Deadline.current())
+
+    def test_items_parallel_fetches_pages_within_the_deadline_active_while_iterating(self):
+        deadlines = []
+        def fetch(_, batch):
+            deadlines.append(Deadline.current())
+            return batch
+
+        collection = ResourceCollection("some_query", self.collection_data, fetch)
+        with Deadline(30) as deadline:
+            self.assertEqual(["0", "1", "2", "3", "4"], list(collection.items_parallel(max_workers=2)))
+
+        self.assertEqual([deadline] * 3, deadlines)
+
     def test_ids_returns_array_of_ids(self):
         collection = ResourceCollection("some_query", self.collection_data, TestResourceCollection.TestResource.fetch)
         self.assertEqual(collection.ids, self.collection_data['search_results']['ids'])
@@ -4,6 +4,7 @@ from datetime import datetime
 from datetime import date
 from braintree.authorization_adjustment import AuthorizationAdjustment
 from unittest.mock import MagicMock
+from braintree.attribute_getter import AttributeGetter
 
 class TestTransaction(unittest.TestCase):
     def test_clone_transaction_raises_exception_with_bad_keys(self):
@@ -72,6 +73,51 @@ class TestTransaction(unittest.TestCase):
 
         self.assertEqual(transaction.risk_data, None)
 
+    def lazy_transaction_attributes(self):
+        return {
+            'id': 'abc',
+            'amount': '27.00',
+            'tax_amount': '1.00',
+            'status': 'settled',
+            'billing': {'id': 'billing_id', 'postal_code': '60606'},
+            'customer': {'id': 'customer_id', 'first_name': 'Dan'},
+            'credit_card': {'bin': '411111', 'last_4': '1111'},
+            'status_history': [{'status': 'authorized', 'amount': '27.00'}],
+            'disputes': [],
+            'three_d_secure_info': None
+        }
+
+    def test_lazy_transactions_build_nested_objects_on_first_access(self):
+        gateway = AttributeGetter({"config": AttributeGetter({"lazy_resources": True})})
+        attributes = self.lazy_transaction_attributes()
+
+        transaction = Transaction(gateway, attributes)
+        self.assertNotIn("billing", attributes)
+        self.assertEqual("abc", transaction.id)
+        self.assertNotIn("billing_details", vars(transaction))
+        self.assertNotIn("amount", vars(transaction))
+
+        billing_details = transaction.billing_details
+        self.assertIsInstance(billing_details, Address)
+        self.assertEqual("60606", billing_details.postal_code)
+        self.assertIs(billing_details, vars(transaction)["billing_details"])
+
+    def test_lazy_transactions_match_eager_transactions(self):
+        lazy = Transaction(AttributeGetter({"config": AttributeGetter({"lazy_resources": True})}), self.lazy_transaction_attributes())
+        eager = Transaction(AttributeGetter({"config": AttributeGetter({"lazy_resources": False})}), self.lazy_transaction_attributes())
+
+        self.assertEqual(Decimal("27.00"), lazy.amount)
+        self.assertEqual(Decimal("1.00"), lazy.tax_amount)
+        self.assertEqual(eager.customer_details.first_name, lazy.customer_details.first_name)
+        self.assertEqual(eager.credit_card_details.masked_number, lazy.credit_card_details.masked_number)
+        self.assertEqual(Decimal("27.00"), lazy.status_history[0].amount)
+        self.assertEqual([], lazy.disputes)
+        self.assertIsNone(lazy.three_d_secure_info)
+        self.assertIsNone(lazy.risk_data)
+        self.assertFalse(hasattr(lazy, "paypal_details"))
+        with self.assertRaises(AttributeError):
+            lazy.shipping_details
+
     def test_is_disbursed_false(self):
         attributes = {
             'amount': '27.00',
@@ -217,3 +263,234 @@ class TestTransaction(unittest.TestCase):
 
         transaction = Transaction(None, attributes)
         self.assertEqual(transaction.installments["count"], 4)
+
+    def setup_transaction_gateway_with_search_ids(self, created_at_by_id, max_days=None):
+        searched_windows = []
+        def post(path, params):
+            window = params["search"]["created_at"]
+            searched_windows.append((window["min"], window["max"]))
+            if max_days is not None and window["max"] - window["min"] > timedelta(days=max_days):
+                raise RequestTimeoutError()
+            ids = [transaction_id for transaction_id, created_at in sorted(created_at_by_id.items(), key=lambda item: item[1])
+                   if window["min"] <= created_at <= window["max"]]
+            return {"search_results": {"ids": ids, "page_size": 50}}
+
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(post=post))
+        return TransactionGateway(gateway), searched_windows
+
+    def test_search_applies_the_deadline_to_the_search_and_its_results(self):
+        deadlines = []
+        def post(path, params):
+            deadlines.append(Deadline.current())
+            return {"search_results": {"ids": ["id1"], "page_size": 50}}
+
+        def post_elements(path, params, element_name, fields=None):
+            deadlines.append(Deadline.current())
+            return XmlUtil.elements_from_xml(
+                "<credit-card-transactions><transaction><id>id1</id><amount>10.00</amount></transaction></credit-card-transactions>",
+                element_name
+            )
+
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(post=post, post_elements=post_elements))
+        results = TransactionGateway(gateway).search(TransactionSearch.amount == "10.00", deadline=5)
+        self.assertIsNone(Deadline.current())
+
+        self.assertEqual(["id1"], [transaction.id for transaction in results])
+        self.assertEqual(5, deadlines[0].seconds)
+        self.assertIs(deadlines[0], deadlines[1])
+
+    def test_search_results_are_built_as_each_transaction_element_is_parsed(self):
+        parsed = []
+        def chunks():
+            yield b"<credit-card-transactions type=\"collection\">"
+            for transaction_id in ["id1", "id2"]:
+                parsed.append(transaction_id)
+                yield b"<transaction><id>" + transaction_id.encode() + b"</id><amount>1.00</amount></transaction>"
+            yield b"</credit-card-transactions>"
+
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(
+            post=MagicMock(return_value={"search_results": {"ids": ["id1", "id2"], "page_size": 50}}),
+            post_elements=lambda path, params, element_name, fields=None: XmlUtil.elements_from_xml(chunks(), element_name)
+        ))
+        results = iter(TransactionGateway(gateway).search(TransactionSearch.amount == "1.00"))
+
+        self.assertEqual("id1", next(results).id)
+        self.assertEqual(["id1"], parsed)
+        self.assertEqual("id2", next(results).id)
+        self.assertEqual([], list(results))
+
+    def test_search_raises_when_a_page_is_not_a_transaction_collection(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(
+            post=MagicMock(return_value={"search_results": {"ids": ["id1"], "page_size": 50}}),
+            post_elements=lambda path, params, element_name, fields=None: XmlUtil.elements_from_xml("", element_name)
+        ))
+
+        with self.assertRaises(RequestTimeoutError):
+            list(TransactionGateway(gateway).search(TransactionSearch.amount == "1.00"))
+
+    def test_find_with_fields_only_parses_the_selected_fields(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        http = MagicMock(get=MagicMock(return_value={"transaction": {"id": "id1", "status": "settled"}}))
+        gateway.config.http = MagicMock(return_value=http)
+
+        transaction = TransactionGateway(gateway).find("id1", fields=["status"])
+
+        self.assertEqual(frozenset(["id", "status"]), http.get.call_args[1]["fields"])
+        self.assertEqual("settled", transaction.status)
+        with self.assertRaisesRegex(AttributeError, "loaded with fields=\\['id', 'status'\\] and has no attribute 'amount'"):
+            transaction.amount
+
+    def test_find_with_fields_does_not_default_unselected_fields(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        http = MagicMock(get=MagicMock(return_value={"transaction": {"id": "id1", "status": "settled"}}))
+        gateway.config.http = MagicMock(return_value=http)
+
+        transaction = TransactionGateway(gateway).find("id1", fields=["status", "risk_data"])
+
+        self.assertIsNone(transaction.risk_data)
+        for name in ["three_d_secure_info", "sca_exemption_requested"]:
+            with self.assertRaisesRegex(AttributeError, "has no attribute '" + name + "'"):
+                getattr(transaction, name)
+
+    def test_first_releases_the_page_it_stops_reading(self):
+        response = MagicMock()
+        response.iter_content.return_value = iter([
+            b"<credit-card-transactions><transaction><id>id1</id></transaction>",
+            b"<transaction><id>id2</id></transaction></credit-card-transactions>"
+        ])
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(
+            post=MagicMock(return_value={"search_results": {"ids": ["id1", "id2"], "page_size": 50}}),
+            post_elements=lambda path, params, element_name, fields=None: XmlUtil.elements_from_xml(ResponseBody(response), element_name, fields)
+        ))
+
+        self.assertEqual("id1", TransactionGateway(gateway).search(TransactionSearch.amount == "1.00").first.id)
+        response.close.assert_called_with()
+
+    def test_search_with_fields_only_parses_the_selected_fields(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(
+            post=MagicMock(return_value={"search_results": {"ids": ["id1"], "page_size": 50}}),
+            post_elements=lambda path, params, element_name, fields=None: XmlUtil.elements_from_xml(
+                "<credit-card-transactions><transaction><id>id1</id><amount>1.00</amount><status>settled</status></transaction></credit-card-transactions>",
+                element_name, fields
+            )
+        ))
+
+        transaction = list(TransactionGateway(gateway).search(TransactionSearch.amount == "1.00", fields=["amount"]))[0]
+
+        self.assertEqual(Decimal("1.00"), transaction.amount)
+        self.assertFalse(hasattr(transaction, "status"))
+
+    def test_find_remembers_unknown_transactions_until_one_is_created_with_that_id(self):
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.not_found_cache = NotFoundCache()
+        http = MagicMock(
+            get=MagicMock(side_effect=NotFoundError()),
+            post=MagicMock(return_value={"transaction": {"id": "id1", "amount": "1.00"}})
+        )
+        gateway.config.http = MagicMock(return_value=http)
+        transactions = TransactionGateway(gateway)
+
+        for _ in range(2):
+            with self.assertRaises(NotFoundError):
+                transactions.find("id1")
+        self.assertEqual(1, http.get.call_count)
+
+        transactions.sale({"amount": "1.00"})
+        with self.assertRaises(NotFoundError):
+            transactions.find("id1")
+        self.assertEqual(2, http.get.call_count)
+
+    def test_sharded_search_merges_and_deduplicates_ids_across_windows(self):
+        start = datetime(2020, 1, 1)
+        created_at_by_id = dict(("id%d" % day, start + timedelta(days=day)) for day in range(32))
+        transaction_gateway, searched_windows = self.setup_transaction_gateway_with_search_ids(created_at_by_id)
+
+        results = transaction_gateway.sharded_search(
+            TransactionSearch.created_at.between(start, start + timedelta(days=31)),
+            max_workers=4
+        )
+
+        self.assertEqual(["id%d" % day for day in range(32)], results.ids)
+        self.assertEqual(4, len(searched_windows))
+
+    def test_sharded_search_searches_windows_within_the_callers_deadline(self):
+        start = datetime(2020, 1, 1)
+        deadlines = []
+        def post(path, params):
+            deadlines.append(Deadline.current())
+            return {"search_results": {"ids": [], "page_size": 50}}
+
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(post=post))
+        with Deadline(30) as deadline:
+            TransactionGateway(gateway).sharded_search(TransactionSearch.created_at.between(start, start + timedelta(days=4)), max_workers=2)
+
+        self.assertEqual([deadline] * 2, deadlines)
+
+    def test_sharded_search_splits_windows_that_time_out_or_overflow(self):
+        start = datetime(2020, 1, 1)
+        created_at_by_id = dict(("id%d" % hour, start + timedelta(hours=hour)) for hour in range(24 * 30))
+        transaction_gateway, searched_windows = self.setup_transaction_gateway_with_search_ids(created_at_by_id, max_days=5)
+
+        results = transaction_gateway.sharded_search(
+            TransactionSearch.created_at >= start,
+            TransactionSearch.created_at <= start + timedelta(days=30),
+            max_workers=2,
+            max_results=100
+        )
+
+        self.assertEqual(["id%d" % hour for hour in range(24 * 30)], results.ids)
+        for window_min, window_max in searched_windows:
+            self.assertTrue(window_min >= start and window_max <= start + timedelta(days=30))
+
+    def test_sharded_search_raises_when_a_minimum_window_still_times_out(self):
+        start = datetime(2020, 1, 1)
+        transaction_gateway, _ = self.setup_transaction_gateway_with_search_ids({}, max_days=1)
+
+        with self.assertRaises(RequestTimeoutError):
+            transaction_gateway.sharded_search(
+                TransactionSearch.created_at.between(start, start + timedelta(days=8)),
+                min_window=timedelta(days=2)
+            )
+
+    def test_sharded_search_splits_amount_ranges_given_as_strings(self):
+        amount_by_id = dict(("id%d" % cents, Decimal(1000 + cents * 25) / 100) for cents in range(41))
+        searched_windows = []
+        def post(path, params):
+            window = params["search"]["amount"]
+            searched_windows.append((window["min"], window["max"]))
+            ids = [transaction_id for transaction_id, amount in sorted(amount_by_id.items(), key=lambda item: item[1])
+                   if Decimal(window["min"]) <= amount <= Decimal(window["max"])]
+            return {"search_results": {"ids": ids, "page_size": 50}}
+
+        gateway = BraintreeGateway(Configuration.instantiate())
+        gateway.config.http = MagicMock(return_value=MagicMock(post=post))
+        results = TransactionGateway(gateway).sharded_search(
+            TransactionSearch.amount.between("10.00", "20.00"),
+            shard_by=TransactionSearch.amount,
+            max_workers=4
+        )
+
+        self.assertEqual(["id%d" % cents for cents in range(41)], results.ids)
+        self.assertEqual(
+            [("10.00", "12.50"), ("12.50", "15.00"), ("15.00", "17.50"), ("17.50", "20.00")],
+            sorted(searched_windows)
+        )
+
+    def test_sharded_search_rejects_bounds_that_are_not_dates_or_numbers(self):
+        transaction_gateway, _ = self.setup_transaction_gateway_with_search_ids({})
+
+        with self.assertRaises(ValueError):
+            transaction_gateway.sharded_search(TransactionSearch.amount.between("ten", "twenty"), shard_by=TransactionSearch.amount)
+
+    def test_sharded_search_requires_a_bounded_range(self):
+        transaction_gateway, _ = self.setup_transaction_gateway_with_search_ids({})
+
+        with self.assertRaises(ValueError):
+            transaction_gateway.sharded_search(TransactionSearch.created_at >= datetime(2020, 1, 1))
@@ -106,10 +106,129 @@ class TestXmlUtil(unittest.TestCase):
         expected = {"container": {"elements": [{"val": "val1"}, {"val": "val2"}, {"val": "val3"}]}}
         self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
 
+    def test_dict_from_xml_accepts_bytes(self):
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <container>
+            <elem>\xe1\xbd\xa1hat &amp; more</elem>
+        </container>
+        """
+        expected = {"container": {"elem": u"\u1f61hat & more"}}
+        self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
+
+    def test_dict_from_xml_accepts_byte_chunks(self):
+        xml = b"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <container>
+            <elem>\xe1\xbd\xa1hat &amp; more</elem>
+            <count type="integer">3</count>
+        </container>
+        """
+        chunks = [b"  ", b"\n"] + [xml.lstrip()[i:i + 7] for i in range(0, len(xml.lstrip()), 7)]
+        expected = {"container": {"elem": u"\u1f61hat & more", "count": 3}}
+        self.assertEqual(expected, XmlUtil.dict_from_xml(iter(chunks)))
+
+    def test_elements_from_xml_yields_each_child_element_as_it_closes(self):
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <credit-card-transactions type="collection">
+            <current-page-number type="integer">1</current-page-number>
+            <transaction><id>a</id><amount>1.00</amount></transaction>
+            <transaction>
+                <id>b</id>
+                <descriptor><name>x</name></descriptor>
+                <refund-ids type="array"><item>c</item></refund-ids>
+            </transaction>
+        </credit-card-transactions>
+        """
+        elements = XmlUtil.elements_from_xml(xml, "transaction")
+
+        self.assertEqual([
+            {"id": "a", "amount": "1.00"},
+            {"id": "b", "descriptor": {"name": "x"}, "refund_ids": ["c"]}
+        ], list(elements))
+        self.assertEqual("credit_card_transactions", elements.root)
+
+    def test_elements_from_xml_of_an_empty_document(self):
+        elements = XmlUtil.elements_from_xml(b"  ", "transaction")
+        self.assertEqual([], list(elements))
+        self.assertIsNone(elements.root)
+
+    def test_dict_from_xml_with_fields_skips_unselected_subtrees(self):
+        xml = """
+        <transaction>
+            <id>a</id>
+            <amount>1.00</amount>
+            <descriptor><name>x</name></descriptor>
+            <status-history type="array"><status-event><status>settled</status></status-event></status-history>
+        </transaction>
+        """
+        self.assertEqual(
+            {"transaction": {"id": "a", "descriptor": {"name": "x"}}},
+            XmlUtil.dict_from_xml(xml, fields=["id", "descriptor"])
+        )
+
+    def test_elements_from_xml_with_fields_skips_unselected_subtrees(self):
+        xml = """
+        <credit-card-transactions type="collection">
+            <current-page-number type="integer">1</current-page-number>
+            <transaction><id>a</id><amount>1.00</amount><customer><id>c</id></customer></transaction>
+            <transaction><id>b</id><amount>2.00</amount></transaction>
+        </credit-card-transactions>
+        """
+        elements = XmlUtil.elements_from_xml(xml, "transaction", fields=["id", "amount"])
+
+        self.assertEqual([{"id": "a", "amount": "1.00"}, {"id": "b", "amount": "2.00"}], list(elements))
+
+    def test_tag_names_and_enum_like_values_are_shared_across_documents(self):
+        xml = "<transaction><status>settled</status><card-type>Visa</card-type><order-id>123</order-id></transaction>"
+        first = XmlUtil.dict_from_xml(xml.encode())["transaction"]
+        second = XmlUtil.dict_from_xml(xml.encode())["transaction"]
+
+        self.assertIs(Transaction.Status.Settled, first["status"])
+        self.assertIs(CreditCard.CardType.Visa, second["card_type"])
+        self.assertIs(list(first)[1], list(second)[1])
+        self.assertIsNot(first["order_id"], second["order_id"])
+
+    def test_dict_from_xml_repeated_elements_become_a_list(self):
+        xml = """
+        <container>
+            <elem><val>val1</val></elem>
+            <elem><val>val2</val></elem>
+        </container>
+        """
+        expected = {"container": {"elem": [{"val": "val1"}, {"val": "val2"}]}}
+        self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
+
+    def test_dict_from_xml_keeps_whitespace_inside_text(self):
+        xml = """
+        <container>
+            <elem> val </elem>
+            <blank>   </blank>
+        </container>
+        """
+        expected = {"container": {"elem": " val ", "blank": ""}}
+        self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
+
     def test_xml_from_dict_escapes_keys_and_values(self):
         test_dict = {"k<ey": "va&lue"}
         self.assertEqual("<k&lt;ey>va&amp;lue</k&lt;ey>", XmlUtil.xml_from_dict(test_dict))
 
+    def test_xml_from_dict_escapes_repeated_keys_consistently(self):
+        test_dict = {"a&b": {"a&b": "1"}, "list": [{"a&b": "2"}, {"a&b": "3"}]}
+        self.assertEqual(
+            '<a&amp;b><a&amp;b>1</a&amp;b></a&amp;b><list type="array"><item><a&amp;b>2</a&amp;b></item><item><a&amp;b>3</a&amp;b></item></list>',
+            XmlUtil.xml_from_dict(test_dict)
+        )
+
+    def test_xml_from_dict_with_many_line_items(self):
+        line_items = [{"name": "item %d" % i, "quantity": Decimal("1"), "total_amount": "2.50"} for i in range(500)]
+        xml = XmlUtil.xml_from_dict({"transaction": {"line_items": line_items}})
+
+        expected_items = "".join(
+            "<item><name>item %d</name><quantity>1</quantity><total_amount>2.50</total_amount></item>" % i
+            for i in range(500)
+        )
+        self.assertEqual('<transaction><line_items type="array">' + expected_items + "</line_items></transaction>", xml)
+
     def test_xml_from_dict_simple(self):
         test_dict = {"a": "b"}
         self.assertEqual(test_dict, self.__xml_and_back(test_dict))
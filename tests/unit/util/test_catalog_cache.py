@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from braintree.attribute_getter import AttributeGetter
+from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.exceptions.not_found_error import NotFoundError
+from braintree.plan_gateway import PlanGateway
+from braintree.util.catalog_cache import CatalogCache
+from braintree.util.shared_catalog_cache import SharedCatalogCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+class TestCatalogCache(unittest.TestCase):
+    Key = ("merchant", "plans")
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ["time.monotonic", "time.time"]:
+            patcher = patch(name, getattr(self.clock, name.split(".")[1]))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.version = 0
+
+    def cache(self, **kwargs):
+        return CatalogCache(**kwargs)
+
+    def load(self):
+        self.version += 1
+        return [{"id": "gold", "version": self.version}, {"id": "silver", "version": self.version}]
+
+    def test_serves_the_catalog_from_memory_within_the_ttl(self):
+        cache = self.cache(ttl=60)
+        self.assertEqual(1, cache.get(self.Key, self.load, AttributeGetter, "gold").version)
+        self.clock.now += 59
+        self.assertEqual(1, cache.get(self.Key, self.load, AttributeGetter, "silver").version)
+        self.assertIsNone(cache.get(self.Key, self.load, AttributeGetter, "bronze"))
+        self.assertEqual(1, self.version)
+
+    def test_serves_a_stale_catalog_while_it_is_refreshed(self):
+        cache = self.cache(ttl=60, stale_ttl=600, refresh_in_background=False)
+        cache.items(self.Key, self.load, AttributeGetter)
+        self.clock.now += 61
+
+        self.assertEqual(1, cache.get(self.Key, self.load, AttributeGetter, "gold").version)
+        self.assertEqual(2, cache.get(self.Key, self.load, AttributeGetter, "gold").version)
+
+    def test_refreshes_a_stale_catalog_in_the_background(self):
+        cache = self.cache(ttl=60, stale_ttl=600)
+        cache.items(self.Key, self.load, AttributeGetter)
+        self.clock.now += 61
+        release = threading.Event()
+        def build(attributes):
+            release.wait(5)
+            return AttributeGetter(attributes)
+
+        self.assertEqual(1, cache.get(self.Key, self.load, build, "gold").version)
+        release.set()
+        for _ in range(500):
+            if cache.get(self.Key, self.load, build, "gold").version == 2:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(2, cache.get(self.Key, self.load, build, "gold").version)
+        self.assertEqual(2, self.version)
+
+    def test_keeps_serving_the_stale_catalog_when_a_refresh_fails(self):
+        cache = self.cache(ttl=60, stale_ttl=600, refresh_in_background=False)
+        cache.items(self.Key, self.load, AttributeGetter)
+        self.clock.now += 61
+
+        self.assertEqual(1, cache.get(self.Key, MagicMock(side_effect=IOError()), AttributeGetter, "gold").version)
+        self.assertEqual(1, cache.get(self.Key, self.load, AttributeGetter, "gold").version)
+        self.assertEqual(2, cache.get(self.Key, self.load, AttributeGetter, "gold").version)
+
+    def test_reloads_an_expired_or_invalidated_catalog_before_returning(self):
+        cache = self.cache(ttl=60, stale_ttl=600)
+        cache.items(self.Key, self.load, AttributeGetter)
+        self.clock.now += 661
+        self.assertEqual(2, cache.get(self.Key, self.load, AttributeGetter, "gold").version)
+
+        cache.invalidate(CatalogCache.Plans)
+        self.assertEqual(3, cache.get(self.Key, self.load, AttributeGetter, "gold").version)
+
+    def test_plan_gateway_get_cached_and_invalidation_on_update(self):
+        http = MagicMock(
+            get=MagicMock(return_value={"plans": [{"id": "gold", "price": "10.00"}]}),
+            put=MagicMock(return_value={"plan": {"id": "gold", "price": "12.00"}})
+        )
+        plans = PlanGateway(AttributeGetter({"config": AttributeGetter({
+            "merchant_id": "merchant",
+            "base_merchant_path": lambda: "/merchants/merchant",
+            "http": lambda: http,
+            "catalog_cache": self.cache()
+        })}))
+
+        self.assertEqual("gold", plans.get_cached("gold").id)
+        self.assertEqual(["gold"], [plan.id for plan in plans.all_cached()])
+        with self.assertRaises(NotFoundError):
+            plans.get_cached("silver")
+        self.assertEqual(1, http.get.call_count)
+
+        plans.update("gold", {"price": "12.00"})
+        plans.get_cached("gold")
+        self.assertEqual(2, http.get.call_count)
+
+
+class TestSharedCatalogCache(TestCatalogCache):
+    def setUp(self):
+        super(TestSharedCatalogCache, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "catalog")
+
+    def cache(self, **kwargs):
+        return SharedCatalogCache(self.path, **kwargs)
+
+    def test_processes_share_one_snapshot(self):
+        first = self.cache(ttl=60, refresh_in_background=False)
+        second = self.cache(ttl=60, refresh_in_background=False)
+
+        self.assertEqual(1, first.get(self.Key, self.load, AttributeGetter, "gold").version)
+        self.assertEqual(1, second.get(self.Key, self.load, AttributeGetter, "gold").version)
+        self.assertEqual(1, self.version)
+
+        self.clock.now += 61
+        self.assertEqual(1, second.get(self.Key, self.load, AttributeGetter, "gold").version)
+        self.assertEqual(2, first.get(self.Key, self.load, AttributeGetter, "gold").version)
+        self.assertEqual(2, self.version)
+
+        first.invalidate(CatalogCache.Plans)
+        self.assertEqual(3, second.get(self.Key, self.load, AttributeGetter, "gold").version)
+
+    def test_processes_only_unpickle_the_catalogs_they_use(self):
+        first = self.cache(ttl=60)
+        first.items(self.Key, self.load, AttributeGetter)
+        first.items(("merchant", "add_ons"), lambda: [{"id": "a1"}], AttributeGetter)
+
+        built = []
+        second = self.cache(ttl=60)
+        plans = second.items(self.Key, self.load, lambda attributes: built.append(attributes) or AttributeGetter(attributes))
+
+        self.assertEqual(["gold", "silver"], [plan.id for plan in plans])
+        self.assertEqual(["gold", "silver"], [attributes["id"] for attributes in built])
+        self.assertEqual(1, self.version)
+
+    def test_snapshot_is_private_to_the_user(self):
+        self.cache().items(self.Key, self.load, AttributeGetter)
+        self.assertEqual(0o600, os.stat(self.path).st_mode & 0o777)
+
+        os.chmod(self.path, 0o666)
+        with self.assertRaises(ConfigurationError):
+            self.cache().items(self.Key, self.load, AttributeGetter)
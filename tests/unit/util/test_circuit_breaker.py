@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+from braintree.exceptions.circuit_open_error import CircuitOpenError
+from braintree.exceptions.service_unavailable_error import ServiceUnavailableError
+from braintree.util.circuit_breaker import CircuitBreaker
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_opens_when_failure_rate_reaches_threshold(self):
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_requests=4)
+        for status in [200, 503, 200]:
+            breaker.before_request("vault")
+            breaker.record("vault", status)
+        self.assertEqual(CircuitBreaker.Closed, breaker.state("vault"))
+
+        breaker.before_request("vault")
+        breaker.record("vault", exception=IOError())
+        self.assertEqual(CircuitBreaker.Open, breaker.state("vault"))
+
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request("vault")
+
+    def test_circuit_open_error_is_a_service_unavailable_error(self):
+        self.assertTrue(issubclass(CircuitOpenError, ServiceUnavailableError))
+
+    def test_families_have_separate_circuits(self):
+        breaker = CircuitBreaker(minimum_requests=1)
+        breaker.record("search", 500)
+
+        self.assertEqual(CircuitBreaker.Open, breaker.state("search"))
+        breaker.before_request("transactions")
+        self.assertEqual({"search": CircuitBreaker.Open, "transactions": CircuitBreaker.Closed}, breaker.states())
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker(minimum_requests=2, slow_call_threshold=2)
+        breaker.record("transactions", 200, duration=3)
+        breaker.record("transactions", 200, duration=2.5)
+
+        self.assertEqual(CircuitBreaker.Open, breaker.state("transactions"))
+
+    def test_half_open_probe_closes_the_circuit_on_success(self):
+        transitions = []
+        breaker = CircuitBreaker(minimum_requests=1, open_duration=30,
+                                 on_state_change=lambda *transition: transitions.append(transition))
+        breaker.record("vault", 503)
+
+        self.clock.now += 30
+        breaker.before_request("vault")
+        self.assertEqual(CircuitBreaker.HalfOpen, breaker.state("vault"))
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request("vault")
+
+        breaker.record("vault", 200)
+        self.assertEqual(CircuitBreaker.Closed, breaker.state("vault"))
+        self.assertEqual([
+            ("vault", CircuitBreaker.Closed, CircuitBreaker.Open),
+            ("vault", CircuitBreaker.Open, CircuitBreaker.HalfOpen),
+            ("vault", CircuitBreaker.HalfOpen, CircuitBreaker.Closed)
+        ], transitions)
+
+    def test_half_open_probe_failure_reopens_the_circuit(self):
+        breaker = CircuitBreaker(minimum_requests=1, open_duration=30)
+        breaker.record("vault", 503)
+
+        self.clock.now += 31
+        breaker.before_request("vault")
+        breaker.record("vault", 504)
+
+        self.assertEqual(CircuitBreaker.Open, breaker.state("vault"))
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request("vault")
+
+    def test_released_probes_let_another_probe_through(self):
+        breaker = CircuitBreaker(minimum_requests=1, open_duration=30)
+        breaker.record("vault", 503)
+
+        self.clock.now += 30
+        breaker.before_request("vault")
+        breaker.release("vault")
+        breaker.before_request("vault")
+
+        self.assertEqual(CircuitBreaker.HalfOpen, breaker.state("vault"))
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request("vault")
@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from braintree.util.connection_pool import ConnectionPool
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_reuses_session_between_calls(self):
+        pool = ConnectionPool()
+        self.assertIs(pool.session(), pool.session())
+
+    def test_mounts_adapters_with_configured_pool_size(self):
+        pool = ConnectionPool(pool_size=25)
+        adapter = pool.session().get_adapter("https://api.braintreegateway.com")
+        self.assertEqual(25, adapter._pool_maxsize)
+
+    def test_recreates_session_after_max_idle(self):
+        pool = ConnectionPool(max_idle=30)
+        with patch("time.monotonic", return_value=100.0):
+            first = pool.session()
+        first.close = MagicMock()
+        with patch("time.monotonic", return_value=120.0):
+            self.assertIs(first, pool.session())
+        with patch("time.monotonic", return_value=200.0):
+            self.assertIsNot(first, pool.session())
+        # another thread may still be using the idle session
+        self.assertFalse(first.close.called)
+
+    def test_requests_in_flight_keep_the_session_from_going_idle(self):
+        pool = ConnectionPool(max_idle=30)
+        clock = [100.0]
+        def send(request, **kwargs):
+            clock[0] = 200.0
+        with patch("time.monotonic", lambda: clock[0]), patch("requests.Session.send", side_effect=send):
+            first = pool.session()
+            pool.send(MagicMock(headers={}))
+            clock[0] = 220.0
+            self.assertIs(first, pool.session())
+
+    def test_recreates_session_after_fork_without_closing_parent_session(self):
+        pool = ConnectionPool()
+        parent = pool.session()
+        parent.close = MagicMock()
+        with patch("os.getpid", return_value=-1):
+            child = pool.session()
+
+        self.assertIsNot(parent, child)
+        self.assertFalse(parent.close.called)
+
+    def test_sends_connection_close_when_keep_alive_is_disabled(self):
+        pool = ConnectionPool(keep_alive=False)
+        request = MagicMock(headers={})
+        with patch("requests.Session.send") as send:
+            pool.send(request, timeout=1)
+
+        self.assertEqual("close", request.headers["Connection"])
+        send.assert_called_once_with(request, timeout=1)
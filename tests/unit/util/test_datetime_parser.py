@@ -1,6 +1,7 @@
 import unittest
 from braintree.util.datetime_parser import parse_datetime as parse
-from datetime import datetime
+from braintree.util.datetime_parser import parse_date, _parse_datetime
+from datetime import date, datetime
 
 
 class TestDateParser(unittest.TestCase):
@@ -29,3 +30,24 @@ class TestDateParser(unittest.TestCase):
             parse('20170420')
         with self.assertRaises(ValueError):
             parse('20170420Z')
+
+    def test_canonical_timestamps_match_the_general_parser(self):
+        for timestamp in ['2017-04-19T18:51:21Z', '2000-02-29T00:00:00Z', '1999-12-31T23:59:59Z', '2016-12-31T23:59:60Z']:
+            self.assertEqual(_parse_datetime(timestamp), parse(timestamp))
+
+    def test_raises_with_bad_canonical_timestamps(self):
+        with self.assertRaises(ValueError):
+            parse('2017-02-30T18:51:21Z')
+        with self.assertRaises(ValueError):
+            parse('2017-04-19T25:51:21Z')
+        with self.assertRaises(ValueError):
+            parse('2017-0a-19T18:51:21Z')
+
+    def test_repeated_timestamps_are_cached(self):
+        self.assertIs(parse('2017-04-19T18:51:22Z'), parse('2017-04-19T18:51:22Z'))
+
+    def test_parses_dates(self):
+        self.assertEqual(date(2017, 4, 19), parse_date('2017-04-19'))
+        self.assertEqual(date(2017, 4, 9), parse_date('2017-4-9'))
+        with self.assertRaises(ValueError):
+            parse_date('2017-02-30')
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+from braintree.exceptions.http.timeout_error import DeadlineExceededError, TimeoutError
+from braintree.util.deadline import Deadline
+
+
+class TestDeadline(unittest.TestCase):
+    def test_no_deadline_is_active_by_default(self):
+        self.assertIsNone(Deadline.current())
+
+    def test_nested_deadlines_never_extend_an_outer_one(self):
+        with Deadline(1) as outer:
+            with Deadline(10):
+                self.assertIs(outer, Deadline.current())
+            with Deadline(0.5) as inner:
+                self.assertIs(inner, Deadline.current())
+            self.assertIs(outer, Deadline.current())
+        self.assertIsNone(Deadline.current())
+
+    def test_deadlines_are_per_thread(self):
+        seen = []
+        with Deadline(1):
+            thread = threading.Thread(target=lambda: seen.append(Deadline.current()))
+            thread.start()
+            thread.join()
+        self.assertEqual([None], seen)
+
+    def test_deadlines_are_per_asyncio_task(self):
+        async def task(seconds, entered, seen):
+            with Deadline(seconds) as deadline:
+                entered.set()
+                await asyncio.sleep(0.01)
+                seen.append(Deadline.current() is deadline)
+
+        async def run_tasks():
+            seen = []
+            first_entered = asyncio.Event()
+            second_entered = asyncio.Event()
+            first = asyncio.ensure_future(task(10, first_entered, seen))
+            await first_entered.wait()
+            second = asyncio.ensure_future(task(20, second_entered, seen))
+            await second_entered.wait()
+            self.assertIsNone(Deadline.current())
+            await asyncio.gather(first, second)
+            return seen
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual([True, True], loop.run_until_complete(run_tasks()))
+        finally:
+            loop.close()
+
+    def test_remaining_and_check(self):
+        with patch("time.monotonic", return_value=100.0):
+            deadline = Deadline(2)
+        with patch("time.monotonic", return_value=101.5):
+            self.assertEqual(0.5, deadline.remaining())
+            deadline.check()
+        with patch("time.monotonic", return_value=102.0):
+            self.assertEqual(0.0, deadline.remaining())
+            self.assertTrue(deadline.expired())
+            with self.assertRaises(DeadlineExceededError):
+                deadline.check()
+
+    def test_deadline_exceeded_error_is_a_timeout_error(self):
+        self.assertTrue(issubclass(DeadlineExceededError, TimeoutError))
+
+    def test_within_accepts_seconds_deadlines_or_none(self):
+        with Deadline.within(None) as deadline:
+            self.assertIsNone(deadline)
+            self.assertIsNone(Deadline.current())
+
+        with Deadline.within(3) as deadline:
+            self.assertEqual(3, deadline.seconds)
+            self.assertIs(deadline, Deadline.current())
+
+        existing = Deadline(3)
+        with Deadline.within(existing) as deadline:
+            self.assertIs(existing, deadline)
+        self.assertIsNone(Deadline.current())
@@ -0,0 +1,161 @@
+import threading
+import time
+import unittest
+from braintree.util.deadline import Deadline
+from braintree.util.hedging_policy import HedgingPolicy
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    def test_does_not_hedge_until_enough_latencies_are_observed(self):
+        policy = HedgingPolicy(min_samples=3)
+        for _ in range(2):
+            self.assertEqual("ok", policy.execute("vault", lambda: "ok"))
+        self.assertIsNone(policy.hedge_delay("vault"))
+
+        policy.execute("vault", lambda: "ok")
+        self.assertEqual(policy.min_delay, policy.hedge_delay("vault"))
+        self.assertIsNone(policy.hedge_delay("transactions"))
+
+    def test_hedge_delay_follows_the_observed_percentile(self):
+        policy = HedgingPolicy(percentile=0.9, min_samples=10, min_delay=0, max_delay=5)
+        for latency in range(10):
+            policy.record("transactions", latency / 10.0)
+        self.assertEqual(0.9, policy.hedge_delay("transactions"))
+
+        policy = HedgingPolicy(min_samples=10, max_delay=0.5)
+        for latency in range(10):
+            policy.record("transactions", latency)
+        self.assertEqual(0.5, policy.hedge_delay("transactions"))
+
+    def test_slow_requests_are_hedged_and_the_first_requests_response_is_used(self):
+        calls = []
+        hedge_sent = threading.Event()
+        discarded = []
+        def send():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                hedge_sent.wait(5)
+                return "first"
+            hedge_sent.set()
+            return "hedge"
+
+        policy = HedgingPolicy(delay=0.01, budget=1)
+        self.assertEqual("first", policy.execute("vault", send, discard=discarded.append))
+        while not discarded:
+            time.sleep(0.001)
+
+        self.assertEqual(["hedge"], discarded)
+        self.assertEqual(2, len(calls))
+        self.assertEqual(1, policy.hedged_count)
+        self.assertEqual(0, policy.hedge_wins)
+
+    def test_first_requests_are_sent_from_the_callers_thread(self):
+        callers = []
+        started = []
+        release = threading.Event()
+        def send():
+            started.append(threading.current_thread())
+            release.wait(5)
+
+        policy = HedgingPolicy(delay=5, budget=1, max_workers=1)
+        def execute():
+            callers.append(threading.current_thread())
+            policy.execute("vault", send)
+        threads = [threading.Thread(target=execute) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while len(started) < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(set(callers), set(started))
+        self.assertEqual(0, policy.hedged_count)
+
+    def test_hedges_are_sent_from_a_bounded_pool(self):
+        started = []
+        release = threading.Event()
+        def send():
+            started.append(threading.current_thread())
+            release.wait(5)
+
+        policy = HedgingPolicy(delay=0.001, budget=1, max_workers=1)
+        threads = [threading.Thread(target=policy.execute, args=("vault", send)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while len(started) < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(set(started) - set(threads)))
+
+    def test_requests_the_budget_cannot_hedge_are_sent_from_the_callers_thread(self):
+        threads = []
+        policy = HedgingPolicy(delay=0.001, budget=0)
+        policy.execute("vault", lambda: threads.append(threading.current_thread()))
+
+        self.assertEqual([threading.current_thread()], threads)
+
+    def test_before_hedge_is_called_before_the_hedge_is_sent(self):
+        events = []
+        hedge_sent = threading.Event()
+        def send():
+            events.append("send")
+            if len(events) == 1:
+                hedge_sent.wait(5)
+            else:
+                hedge_sent.set()
+
+        policy = HedgingPolicy(delay=0.01, budget=1)
+        policy.execute("vault", send, before_hedge=lambda: events.append("before_hedge"))
+
+        self.assertEqual(["send", "before_hedge", "send"], events)
+
+    def test_hedges_are_limited_by_the_budget(self):
+        def send():
+            time.sleep(0.02)
+            return "ok"
+
+        policy = HedgingPolicy(delay=0.001, budget=0.25)
+        for _ in range(8):
+            policy.execute("vault", send)
+
+        self.assertEqual(8, policy.request_count)
+        self.assertEqual(2, policy.hedged_count)
+
+    def test_a_failed_request_waits_for_the_hedge(self):
+        calls = []
+        def send():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise IOError("connection reset")
+            time.sleep(0.1)
+            return "hedge"
+
+        policy = HedgingPolicy(delay=0.01, budget=1)
+        self.assertEqual("hedge", policy.execute("vault", send))
+
+    def test_errors_are_raised_when_every_request_fails(self):
+        def send():
+            time.sleep(0.02)
+            raise IOError("connection reset")
+
+        policy = HedgingPolicy(delay=0.001, budget=1)
+        with self.assertRaises(IOError):
+            policy.execute("vault", send)
+
+    def test_requests_run_within_the_callers_deadline(self):
+        deadlines = []
+        def send():
+            deadlines.append(Deadline.current())
+            time.sleep(0.02)
+
+        policy = HedgingPolicy(delay=0.001, budget=1)
+        with Deadline(30) as deadline:
+            policy.execute("vault", send)
+
+        self.assertEqual([deadline, deadline], deadlines)
@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from braintree.attribute_getter import AttributeGetter
+from braintree.exceptions.not_found_error import NotFoundError
+from braintree.util.not_found_cache import NotFoundCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class TestNotFoundCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config = AttributeGetter({"merchant_id": "merchant", "not_found_cache": NotFoundCache(max_size=2, ttl=10)})
+
+    def test_remembers_not_found_ids_until_the_ttl_passes(self):
+        load = MagicMock(side_effect=NotFoundError())
+        for _ in range(3):
+            with self.assertRaises(NotFoundError):
+                NotFoundCache.read_through(self.config, "customer/junk", load)
+        self.assertEqual(1, load.call_count)
+        self.assertEqual(2, self.config.not_found_cache.stats()["hits"])
+
+        self.clock.now += 10
+        with self.assertRaises(NotFoundError):
+            NotFoundCache.read_through(self.config, "customer/junk", load)
+        self.assertEqual(2, load.call_count)
+
+    def test_found_ids_are_not_remembered(self):
+        load = MagicMock(return_value={"customer": {"id": "c1"}})
+        NotFoundCache.read_through(self.config, "customer/c1", load)
+        NotFoundCache.read_through(self.config, "customer/c1", load)
+        self.assertEqual(2, load.call_count)
+
+    def test_forget_clears_created_ids(self):
+        with self.assertRaises(NotFoundError):
+            NotFoundCache.read_through(self.config, "customer/c1", MagicMock(side_effect=NotFoundError()))
+        NotFoundCache.forget(self.config, "customer", None, "c1")
+
+        self.assertEqual({"id": "c1"}, NotFoundCache.read_through(self.config, "customer/c1", lambda: {"id": "c1"}))
+
+    def test_is_bounded_in_size(self):
+        for customer_id in ["a", "b", "c"]:
+            with self.assertRaises(NotFoundError):
+                NotFoundCache.read_through(self.config, "customer/" + customer_id, MagicMock(side_effect=NotFoundError()))
+
+        self.assertEqual(2, self.config.not_found_cache.stats()["size"])
+        self.assertFalse(self.config.not_found_cache.contains("merchant/customer/a"))
@@ -0,0 +1,99 @@
+import threading
+import unittest
+from unittest.mock import patch
+from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.exceptions.too_many_requests_error import TooManyRequestsError
+from braintree.util.rate_limiter import RateLimiter
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patchers = [patch("time.monotonic", self.clock.monotonic), patch("time.sleep", self.clock.sleep)]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_allows_bursts_then_waits_for_tokens(self):
+        limiter = RateLimiter(rate=2, burst=3)
+        for _ in range(3):
+            limiter.acquire("transactions")
+        self.assertEqual([], self.clock.sleeps)
+
+        limiter.acquire("transactions")
+        self.assertEqual([0.5], self.clock.sleeps)
+
+    def test_families_have_separate_budgets(self):
+        limiter = RateLimiter(rate=1, rates={"search": 1, "vault": None})
+        limiter.acquire("transactions")
+        limiter.acquire("search")
+        for _ in range(10):
+            limiter.acquire("vault")
+
+        self.assertEqual([], self.clock.sleeps)
+
+    def test_raises_when_not_blocking(self):
+        limiter = RateLimiter(rate=1, block=False)
+        limiter.acquire("search")
+        with self.assertRaises(TooManyRequestsError):
+            limiter.acquire("search")
+
+    def test_raises_when_wait_exceeds_max_wait(self):
+        limiter = RateLimiter(rate=0.1, max_wait=5)
+        limiter.acquire("search")
+        with self.assertRaises(TooManyRequestsError):
+            limiter.acquire("search")
+        self.assertEqual([], self.clock.sleeps)
+
+    def test_adapts_rate_to_throttling(self):
+        limiter = RateLimiter(rate=10, min_rate=1, recovery=0.1)
+        limiter.acquire("transactions")
+        limiter.throttled("transactions")
+        self.assertEqual(5, limiter.current_rate("transactions"))
+        for _ in range(4):
+            limiter.throttled("transactions")
+        self.assertEqual(1, limiter.current_rate("transactions"))
+
+        limiter.succeeded("transactions")
+        self.assertEqual(2, limiter.current_rate("transactions"))
+        for _ in range(20):
+            limiter.succeeded("transactions")
+        self.assertEqual(10, limiter.current_rate("transactions"))
+
+    def test_throttling_does_not_raise_a_rate_above_its_configured_rate(self):
+        limiter = RateLimiter(rate=0.2, min_rate=0.5)
+        limiter.throttled("transactions")
+        self.assertEqual(0.2, limiter.current_rate("transactions"))
+
+    def test_rejects_rates_that_are_not_positive(self):
+        with self.assertRaises(ConfigurationError):
+            RateLimiter(rate=0)
+        with self.assertRaisesRegex(ConfigurationError, "rate for search must be positive"):
+            RateLimiter(rate=10, rates={"search": -1})
+
+    def test_is_safe_to_share_between_threads(self):
+        limiter = RateLimiter(rate=1000, burst=1000, block=False)
+        def acquire_many():
+            for _ in range(100):
+                limiter.acquire("transactions")
+        threads = [threading.Thread(target=acquire_many) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self.assertRaises(TooManyRequestsError):
+            limiter.acquire("transactions")
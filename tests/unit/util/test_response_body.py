@@ -0,0 +1,53 @@
+import gzip
+import io
+import unittest
+from unittest.mock import MagicMock
+from requests.models import Response
+from urllib3.response import HTTPResponse
+from braintree.util.response_body import ResponseBody
+from braintree.util.xml_util import XmlUtil
+
+
+def gzip_response(body):
+    response = Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(
+        body=io.BytesIO(gzip.compress(body)),
+        headers={"content-encoding": "gzip"},
+        preload_content=False
+    )
+    return response
+
+
+class TestResponseBody(unittest.TestCase):
+    def test_yields_decompressed_chunks(self):
+        xml = b"<transactions type=\"array\">" + b"<transaction><id>abc</id></transaction>" * 1000 + b"</transactions>"
+        body = ResponseBody(gzip_response(xml), chunk_size=1024)
+
+        chunks = list(body)
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(xml, b"".join(chunks))
+
+    def test_is_parsed_incrementally(self):
+        xml = b"<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<customer><id>abc</id><first-name>Dan</first-name></customer>"
+        body = ResponseBody(gzip_response(xml), chunk_size=16)
+
+        self.assertEqual({"customer": {"id": "abc", "first_name": "Dan"}}, XmlUtil.dict_from_xml(body))
+
+    def test_is_blank(self):
+        self.assertTrue(ResponseBody(gzip_response(b"  \n ")).is_blank())
+
+        body = ResponseBody(gzip_response(b" \n<ok/>"), chunk_size=2)
+        self.assertFalse(body.is_blank())
+        self.assertEqual(b" \n<ok/>", body.read())
+
+    def test_closes_the_response_once_consumed_or_discarded(self):
+        response = gzip_response(b"<ok/>")
+        response.close = MagicMock()
+        ResponseBody(response).read()
+        response.close.assert_called_once_with()
+
+        response = gzip_response(b"<ok/>")
+        response.close = MagicMock()
+        ResponseBody(response).close()
+        response.close.assert_called_once_with()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from braintree.util.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_delay_uses_full_jitter_with_exponential_cap(self):
+        policy = RetryPolicy(max_attempts=10, backoff_base=0.5, backoff_cap=3)
+        with patch("random.uniform", side_effect=lambda low, high: high) as uniform:
+            self.assertEqual(0.5, policy.delay(1))
+            self.assertEqual(1.0, policy.delay(2))
+            self.assertEqual(2.0, policy.delay(3))
+            self.assertEqual(3, policy.delay(4))
+        self.assertEqual(0, uniform.call_args[0][0])
+
+    def test_delay_is_none_after_max_attempts(self):
+        policy = RetryPolicy(max_attempts=2)
+        self.assertIsNotNone(policy.delay(1))
+        self.assertIsNone(policy.delay(2))
+
+    def test_delay_honors_retry_after_seconds(self):
+        policy = RetryPolicy(backoff_base=0.01)
+        self.assertEqual(7.0, policy.delay(1, {"Retry-After": "7"}))
+
+    def test_delay_honors_retry_after_http_date(self):
+        policy = RetryPolicy(backoff_base=0.01)
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+        self.assertTrue(15 < policy.delay(1, {"Retry-After": retry_at}) <= 20)
+
+    def test_does_not_retry_when_retry_after_exceeds_maximum(self):
+        policy = RetryPolicy(max_retry_after=10)
+        self.assertIsNone(policy.delay(1, {"Retry-After": "60"}))
+
+    def test_ignores_retry_after_when_disabled(self):
+        policy = RetryPolicy(backoff_base=0.01, respect_retry_after=False)
+        self.assertTrue(policy.delay(1, {"Retry-After": "60"}) <= 0.01)
+
+    def test_only_retries_idempotent_requests_and_searches_by_default(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable_request("GET", "/transactions/id"))
+        self.assertTrue(policy.is_retryable_request("POST", "/transactions/advanced_search_ids"))
+        self.assertFalse(policy.is_retryable_request("PUT", "/transactions/id/void"))
+        self.assertFalse(policy.is_retryable_request("POST", "/transactions"))
+        self.assertTrue(RetryPolicy(retry_unsafe_requests=True).is_retryable_request("PUT", "/transactions/id/void"))
+        self.assertTrue(RetryPolicy(retry_unsafe_requests=True).is_retryable_request("POST", "/transactions"))
+
+    def test_sleep_counts_retries_and_notifies(self):
+        retries = []
+        policy = RetryPolicy(on_retry=lambda *args: retries.append(args))
+        with patch("time.sleep") as sleep:
+            policy.sleep("GET", "/path", 1, 0.25, 503)
+
+        sleep.assert_called_once_with(0.25)
+        self.assertEqual(1, policy.retry_count)
+        self.assertEqual([("GET", "/path", 1, 0.25, 503)], retries)
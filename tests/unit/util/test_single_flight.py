@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import unittest
+from braintree.exceptions.http.timeout_error import DeadlineExceededError
+from braintree.exceptions.server_error import ServerError
+from braintree.util.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def run_concurrently(self, single_flight, key, fn, count, timeout=None):
+        results = [None] * count
+        def call(index):
+            try:
+                results[index] = single_flight.do(key, fn, timeout)
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=call, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def test_concurrent_calls_with_the_same_key_share_one_call(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        def fn():
+            calls.append(1)
+            release.wait(5)
+            return {"customer": {"id": "c1"}}
+
+        threads, results = self.run_concurrently(single_flight, "key", fn, 5)
+        while single_flight.coalesced_count < 4:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([{"customer": {"id": "c1"}}] * 5, results)
+        self.assertEqual(5, len(set(id(result) for result in results)))
+
+    def test_exceptions_are_raised_to_every_waiter(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        def fn():
+            release.wait(5)
+            raise ServerError()
+
+        threads, results = self.run_concurrently(single_flight, "key", fn, 3)
+        while single_flight.coalesced_count < 2:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(all(isinstance(result, ServerError) for result in results))
+
+    def test_waiters_give_up_at_their_timeout(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        leader, _ = self.run_concurrently(single_flight, "key", lambda: release.wait(5), 1)
+        while not single_flight._SingleFlight__calls:
+            threading.Event().wait(0.001)
+
+        with self.assertRaises(DeadlineExceededError):
+            single_flight.do("key", lambda: None, 0.01)
+        release.set()
+        leader[0].join()
+
+    def test_later_calls_are_not_coalesced(self):
+        single_flight = SingleFlight()
+        self.assertEqual(1, single_flight.do("key", lambda: 1))
+        self.assertEqual(2, single_flight.do("key", lambda: 2))
+        self.assertEqual(0, single_flight.coalesced_count)
+
+    def test_async_calls_with_the_same_key_share_one_call(self):
+        single_flight = SingleFlight()
+        calls = []
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "c1"}
+
+        async def gather():
+            return await asyncio.gather(*[single_flight.do_async("key", fn) for _ in range(4)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(gather())
+        finally:
+            loop.close()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([{"id": "c1"}] * 4, results)
+        self.assertEqual(4, len(set(id(result) for result in results)))
+
+    def test_async_exceptions_are_raised_to_every_waiter(self):
+        single_flight = SingleFlight()
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ServerError()
+
+        async def gather():
+            return await asyncio.gather(*[single_flight.do_async("key", fn) for _ in range(3)], return_exceptions=True)
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(gather())
+        finally:
+            loop.close()
+
+        self.assertTrue(all(isinstance(result, ServerError) for result in results))
+
+    def test_a_waiter_sends_the_call_when_the_async_caller_is_cancelled(self):
+        single_flight = SingleFlight()
+        calls = []
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "c1"}
+
+        async def cancel_leader():
+            leader = asyncio.ensure_future(single_flight.do_async("key", fn))
+            await asyncio.sleep(0)
+            waiters = [asyncio.ensure_future(single_flight.do_async("key", fn)) for _ in range(2)]
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await asyncio.gather(*waiters)
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(cancel_leader())
+        finally:
+            loop.close()
+
+        self.assertEqual(2, len(calls))
+        self.assertEqual([{"id": "c1"}] * 2, results)
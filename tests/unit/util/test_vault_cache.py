@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from braintree.attribute_getter import AttributeGetter
+from braintree.util.vault_cache import VaultCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class TestVaultCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def config(self, cache):
+        return AttributeGetter({"merchant_id": "merchant", "vault_cache": cache})
+
+    def test_entries_expire_after_the_ttl(self):
+        cache = VaultCache(ttl=10)
+        cache.set("a", {"id": "a"})
+        self.clock.now += 9
+        self.assertEqual({"id": "a"}, cache.get("a"))
+        self.clock.now += 1
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual({"hits": 1, "misses": 1, "evictions": 0, "invalidations": 0, "size": 0}, cache.stats())
+
+    def test_evicts_the_least_recently_used_entry(self):
+        cache = VaultCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual(1, cache.stats()["evictions"])
+
+    def test_read_through_loads_once_and_returns_copies(self):
+        config = self.config(VaultCache())
+        load = MagicMock(return_value={"customer": {"id": "c1"}})
+
+        first = VaultCache.read_through(config, "customer/c1", load)
+        first["customer"]["id"] = "changed"
+        second = VaultCache.read_through(config, "customer/c1", load)
+
+        self.assertEqual({"customer": {"id": "c1"}}, second)
+        self.assertEqual(1, load.call_count)
+        self.assertEqual({"id": "c1"}, config.vault_cache.get("merchant/customer/c1")["customer"])
+
+    def test_read_through_without_a_cache_always_loads(self):
+        load = MagicMock(return_value={})
+        VaultCache.read_through(AttributeGetter({"merchant_id": "merchant"}), "customer/c1", load)
+        VaultCache.read_through(AttributeGetter({"merchant_id": "merchant"}), "customer/c1", load)
+        self.assertEqual(2, load.call_count)
+
+    def test_invalidate_payment_method_removes_the_cached_customer(self):
+        config = self.config(VaultCache())
+        VaultCache.read_through(config, "customer/c1", lambda: {"customer": {"id": "c1"}})
+        VaultCache.read_through(config, "customer/c2", lambda: {"customer": {"id": "c2"}})
+        VaultCache.read_through(config, "payment_method/t1", lambda: {"credit_card": {"token": "t1", "customer_id": "c1"}})
+
+        VaultCache.invalidate_payment_method(config, "t1")
+
+        self.assertEqual(1, config.vault_cache.stats()["size"])
+        self.assertIsNotNone(config.vault_cache.get("merchant/customer/c2"))
+
+    def test_invalidate_payment_method_clears_the_cache_when_the_customer_is_unknown(self):
+        config = self.config(VaultCache())
+        VaultCache.read_through(config, "customer/c1", lambda: {"customer": {"id": "c1"}})
+
+        VaultCache.invalidate_payment_method(config, "t1")
+
+        self.assertEqual(0, config.vault_cache.stats()["size"])
+
+    def test_invalidate_payment_method_does_not_count_its_lookups(self):
+        config = self.config(VaultCache())
+        VaultCache.read_through(config, "payment_method/t1", lambda: {"credit_card": {"token": "t1", "customer_id": "c1"}})
+
+        VaultCache.invalidate_payment_method(config, "t1")
+
+        self.assertEqual({"hits": 0, "misses": 1, "evictions": 0, "invalidations": 1, "size": 0}, config.vault_cache.stats())
+
+    def test_invalidate_customer_removes_its_cached_payment_methods(self):
+        config = self.config(VaultCache())
+        VaultCache.read_through(config, "customer/c1", lambda: {"customer": {"id": "c1", "credit_cards": [{"token": "t1"}], "paypal_accounts": [{"token": "t2"}]}})
+        VaultCache.read_through(config, "credit_card/t1", lambda: {"credit_card": {"token": "t1", "customer_id": "c1"}})
+        VaultCache.read_through(config, "payment_method/t2", lambda: {"paypal_account": {"token": "t2", "customer_id": "c1"}})
+        VaultCache.read_through(config, "customer/c2", lambda: {"customer": {"id": "c2"}})
+
+        VaultCache.invalidate_customer(config, "c1")
+
+        self.assertEqual(1, config.vault_cache.stats()["size"])
+        self.assertIsNotNone(config.vault_cache.peek("merchant/customer/c2"))
+
+    def test_invalidate_customer_clears_the_cache_when_the_customer_is_not_cached(self):
+        config = self.config(VaultCache())
+        VaultCache.read_through(config, "payment_method/t1", lambda: {"credit_card": {"token": "t1", "customer_id": "c1"}})
+
+        VaultCache.invalidate_customer(config, "c1")
+
+        self.assertEqual(0, config.vault_cache.stats()["size"])